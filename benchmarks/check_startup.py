@@ -0,0 +1,126 @@
+"""
+Startup Time Check
+Measures how long a fresh interpreter takes to import main.py and to print
+--help, and fails if either is over budget or if importing main pulls in a
+library that only the pipeline stages need
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(REPO_ROOT, 'src')
+
+# Imported by the stages that use them, never by main.py itself
+HEAVY_MODULES = ['pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn', 'pyarrow', 'google.genai']
+
+DEFAULT_BUDGET_S = 0.5
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=SRC_DIR, capture_output=True, text=True)
+
+
+def time_command(args: List[str], repeat: int = 5) -> Dict[str, float]:
+    """Wall time of a fresh interpreter running args, over several runs."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run(args)
+        times.append(time.perf_counter() - start)
+    return {'min': round(min(times), 3), 'median': round(statistics.median(times), 3)}
+
+
+def heavy_imports(module: str = 'main') -> List[str]:
+    """Heavy libraries that importing a module loads."""
+    code = (f"import sys, json, {module}; "
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))")
+    result = _run(['-c', code])
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module: str = 'main', n: int = 10) -> List[Tuple[str, float]]:
+    """The n imports with the largest cumulative time, from python -X importtime."""
+    result = _run(['-X', 'importtime', '-c', f"import {module}"])
+    imports = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            imports.append((parts[2].strip(), int(parts[1]) / 1e6))
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return [(name, round(seconds, 3)) for name, seconds in imports[:n]]
+
+
+def measure_startup(repeat: int = 5) -> Dict[str, Any]:
+    """
+    Startup figures recorded with benchmark results.
+
+    Returns:
+        Dictionary with the wall time of a bare interpreter, of importing
+        main and of main.py --help (min and median seconds), and the heavy
+        libraries importing main loads
+    """
+    return {
+        'python_s': time_command(['-c', 'pass'], repeat),
+        'import_main_s': time_command(['-c', 'import main'], repeat),
+        'help_s': time_command(['main.py', '--help'], repeat),
+        'heavy_modules': heavy_imports()
+    }
+
+
+def main():
+    """Startup check entry point with CLI argument parsing."""
+    parser = argparse.ArgumentParser(
+        description='Check that main.py starts quickly and imports no heavy libraries up front'
+    )
+
+    parser.add_argument(
+        '--budget',
+        type=float,
+        help=f'Maximum median seconds for "import main" and "main.py --help" (default: {DEFAULT_BUDGET_S})',
+        default=DEFAULT_BUDGET_S
+    )
+
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        help='Fresh interpreters started per measurement (default: 5)',
+        default=5
+    )
+
+    args = parser.parse_args()
+
+    startup = measure_startup(args.repeat)
+    print(f"\n⏱️  Startup (median of {args.repeat}, budget {args.budget:.2f}s)")
+    print(f"   python -c pass    {startup['python_s']['median']:.3f}s")
+    print(f"   import main       {startup['import_main_s']['median']:.3f}s")
+    print(f"   main.py --help    {startup['help_s']['median']:.3f}s")
+
+    failures = []
+    for label, key in (('import main', 'import_main_s'), ('main.py --help', 'help_s')):
+        if startup[key]['median'] > args.budget:
+            failures.append(f"{label} took {startup[key]['median']:.3f}s")
+    if startup['heavy_modules']:
+        failures.append(f"importing main loads {', '.join(startup['heavy_modules'])}")
+
+    if failures:
+        print("\n❌ Startup over budget: " + "; ".join(failures))
+        print("\n   Slowest imports (cumulative):")
+        for name, seconds in slowest_imports():
+            print(f"   {seconds:>7.3f}s  {name}")
+        print()
+        sys.exit(1)
+
+    print("\n✅ Startup within budget\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark Comparison
+Compares two results files written by run_benchmarks.py, stage by stage
+"""
+import sys
+import json
+import argparse
+from typing import Any, Dict, List, Optional
+
+from run_benchmarks import STAGES
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _label(results: Dict[str, Any]) -> str:
+    git = results.get('git', {})
+    commit = (git.get('commit') or 'unknown')[:10]
+    return f"{commit}{' (dirty)' if git.get('dirty') else ''}"
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.10,
+            min_seconds: float = 0.05) -> List[Dict[str, Any]]:
+    """
+    Median wall time of every stage of the cases both runs have, before and after.
+
+    Args:
+        base: Results to compare against
+        new: Results to check (startup times are compared too when both have them)
+        threshold: Relative slowdown reported as a regression (0.10 = 10%)
+        min_seconds: Stages faster than this in both runs are never flagged,
+            since their timings are mostly noise
+
+    Returns:
+        One row per case and stage (plus a 'total' row per case) with the
+        base and new medians, the relative change and a regression flag
+    """
+    base_cases = {case['name']: case for case in base['cases']}
+    rows = []
+    if 'startup' in base and 'startup' in new:
+        for stage, key in (('import main', 'import_main_s'), ('main.py --help', 'help_s')):
+            rows.append(_row('startup', stage, base['startup'][key]['median'],
+                             new['startup'][key]['median'], threshold, min_seconds))
+
+    for case in new['cases']:
+        before = base_cases.get(case['name'])
+        if before is None:
+            continue
+        pairs = [(stage, before['stages'].get(stage, {}).get('wall_s', {}).get('median'),
+                  case['stages'].get(stage, {}).get('wall_s', {}).get('median'))
+                 for stage in STAGES]
+        pairs.append(('total', before['total_s']['median'], case['total_s']['median']))
+
+        for stage, base_s, new_s in pairs:
+            if base_s is not None and new_s is not None:
+                rows.append(_row(case['name'], stage, base_s, new_s, threshold, min_seconds))
+    return rows
+
+
+def _row(case: str, stage: str, base_s: float, new_s: float, threshold: float,
+         min_seconds: float) -> Dict[str, Any]:
+    change = (new_s - base_s) / base_s if base_s > 0 else None
+    return {
+        'case': case,
+        'stage': stage,
+        'base_s': base_s,
+        'new_s': new_s,
+        'change': change,
+        'regression': change is not None and change > threshold and max(base_s, new_s) >= min_seconds
+    }
+
+
+def _format_change(change: Optional[float]) -> str:
+    return "n/a" if change is None else f"{change:+.1%}"
+
+
+def main():
+    """Comparison entry point with CLI argument parsing."""
+    parser = argparse.ArgumentParser(
+        description='Compare two AutoGen-EDA benchmark results files'
+    )
+
+    parser.add_argument('base', help='Results file to compare against (e.g. from the main branch)')
+    parser.add_argument('new', help='Results file to check')
+
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        help='Relative slowdown reported as a regression (default: 0.10)',
+        default=0.10
+    )
+
+    parser.add_argument(
+        '--fail-on-regression',
+        action='store_true',
+        help='Exit with status 1 if any stage regressed'
+    )
+
+    args = parser.parse_args()
+
+    base, new = _load(args.base), _load(args.new)
+    rows = compare(base, new, args.threshold)
+    if not rows:
+        print("❌ The two results files have no cases in common")
+        sys.exit(1)
+
+    print(f"\n⏱️  {_label(base)} → {_label(new)} (median wall time)\n")
+    print(f"   {'case':<12} {'stage':<16} {'before':>10} {'after':>10} {'change':>9}")
+    for row in rows:
+        flag = "  ⚠️  regression" if row['regression'] else ""
+        print(f"   {row['case']:<12} {row['stage']:<16} {row['base_s']:>9.3f}s {row['new_s']:>9.3f}s "
+              f"{_format_change(row['change']):>9}{flag}")
+
+    regressions = [row for row in rows if row['regression']]
+    print(f"\n{'⚠️ ' if regressions else '✅'} {len(regressions)} regressions over {args.threshold:.0%}\n")
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
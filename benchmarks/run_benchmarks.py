@@ -0,0 +1,455 @@
+"""
+AutoGen-EDA Benchmarks
+Times DataLoader, EDAPlanner, DataAnalyzer, DataVisualizer, InsightGenerator
+and ReportBuilder on synthetic datasets of increasing size, with the LLM
+stubbed out, and writes the results to JSON for comparison across commits
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import contextlib
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+sys.path.insert(0, REPO_ROOT)
+
+from generate_sample_data import synthetic_columns, write_synthetic_csv
+from check_startup import measure_startup
+
+RESULTS_VERSION = 1
+
+STAGES = ['load', 'plan', 'analysis', 'visualization', 'insights', 'report']
+
+# (rows, columns) of each case
+PRESETS = {
+    'smoke': [(10_000, 10)],
+    'default': [(10_000, 10), (100_000, 20), (1_000_000, 20), (10_000, 1_000)],
+    'rows': [(10_000, 10), (100_000, 10), (1_000_000, 10), (10_000_000, 10), (100_000_000, 10)],
+    'columns': [(10_000, 10), (10_000, 100), (10_000, 1_000), (10_000, 10_000)],
+}
+PRESETS['full'] = PRESETS['rows'] + PRESETS['columns'][1:]
+
+# Cases from this many rows up load in streaming mode, as production runs would
+STREAMING_ROWS = 5_000_000
+STREAMING_CHUNKSIZE = 1_000_000
+
+
+class StubLLM:
+    """Stands in for LLMClient: returns fixed responses instantly, so only our code is timed"""
+
+    model_name = 'benchmark-stub'
+
+    def __init__(self, plan: Dict[str, Any]):
+        self.plan = plan
+
+    def generate_json(self, prompt: str, purpose: str = "JSON Generation") -> Dict[str, Any]:
+        if 'Planning' in purpose:
+            return json.loads(json.dumps(self.plan))
+        return {
+            'key_insights': ["Benchmark insight one", "Benchmark insight two"],
+            'limitations': ["Synthetic data"]
+        }
+
+    def generate(self, prompt: str, purpose: str = "General", temperature: float = 0.7) -> str:
+        return "Benchmark summary."
+
+
+def benchmark_plan(n_columns: int) -> Dict[str, Any]:
+    """
+    EDA plan for a synthetic dataset with one visualization of each type.
+
+    Args:
+        n_columns: Number of columns of the dataset (see synthetic_columns)
+
+    Returns:
+        Plan in the format the LLM is asked for
+    """
+    columns = synthetic_columns(n_columns)
+    numeric = [name for name, kind in columns if kind in ('float', 'int')]
+    categorical = [name for name, kind in columns if kind == 'category']
+    datetime_cols = [name for name, kind in columns if kind == 'datetime']
+
+    visualizations = []
+    if numeric:
+        visualizations.append({'type': 'histogram', 'column': numeric[0], 'title': f'Distribution of {numeric[0]}'})
+        visualizations.append({'type': 'boxplot', 'column': numeric[0], 'title': f'Outliers in {numeric[0]}'})
+    if categorical:
+        visualizations.append({'type': 'bar', 'column': categorical[0], 'title': f'Frequency of {categorical[0]}'})
+    if len(numeric) >= 2:
+        visualizations.append({'type': 'correlation_heatmap', 'columns': numeric[:10], 'title': 'Correlation Matrix'})
+        visualizations.append({'type': 'scatter', 'x': numeric[0], 'y': numeric[1],
+                               'title': f'{numeric[0]} vs {numeric[1]}'})
+
+    return {
+        'dataset_type': 'mixed',
+        'key_columns': {
+            'categorical': categorical[:5],
+            'numeric': numeric[:5],
+            'datetime': datetime_cols[:1],
+            'potential_target': None
+        },
+        'recommended_analyses': {'categorical': [], 'numeric': [], 'relationships': []},
+        'recommended_visualizations': visualizations,
+        'data_quality_checks': [],
+        'expected_insights': []
+    }
+
+
+def dataset_path(data_dir: str, case: Dict[str, Any]) -> str:
+    """Generated file of a case; the name records every generator parameter."""
+    name = (f"synthetic_{case['rows']}r_{case['columns']}c_"
+            f"m{case['missing_rate']}_k{case['cardinality']}_s{case['seed']}.csv")
+    return os.path.join(data_dir, name)
+
+
+def ensure_dataset(data_dir: str, case: Dict[str, Any]) -> Tuple[str, Optional[float]]:
+    """
+    Generate a case's dataset unless an earlier run already did.
+
+    Returns:
+        Tuple of (path, seconds spent generating or None if reused)
+    """
+    path = dataset_path(data_dir, case)
+    if os.path.exists(path):
+        return path, None
+
+    print(f"   🎲 Generating {case['rows']:,} rows × {case['columns']:,} columns...")
+    start = time.perf_counter()
+    write_synthetic_csv(path, case['rows'], case['columns'], case['missing_rate'],
+                        case['cardinality'], case['seed'], workers=0)
+    return path, round(time.perf_counter() - start, 2)
+
+
+def _run_once(csv_path: str, case: Dict[str, Any], options: Dict[str, Any],
+              work_dir: str) -> Dict[str, Any]:
+    """
+    Worker side: run every stage once on a dataset, in order, under a tracer.
+
+    Runs in a fresh process so peak memory and caches do not carry over
+    between runs.
+    """
+    from data_loader import DataLoader
+    from eda_planner import EDAPlanner
+    from analyzer import DataAnalyzer, format_facts
+    from visualizer import PlotPool, render_plots
+    from insight_generator import InsightGenerator
+    from report_builder import ReportBuilder
+    from parallel import ColumnPool
+    from instrumentation import Tracer, activate
+
+    streaming = case['rows'] >= options['streaming_rows']
+    tracer = Tracer()
+    llm = StubLLM(benchmark_plan(case['columns']))
+    with contextlib.ExitStack() as stack:
+        if not options['verbose']:
+            stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+        pool = stack.enter_context(ColumnPool(options['workers'], options['parallel_backend']))
+        # Started before the clock runs, as main.py starts it while earlier stages run
+        plot_pool = stack.enter_context(PlotPool())
+        stack.enter_context(activate(tracer))
+
+        with tracer.span('load', 'stage'):
+            loader = DataLoader(csv_path, chunksize=STREAMING_CHUNKSIZE if streaming else None,
+                                sample_rows=options['sample_rows'], pool=pool)
+            df, schema, profile = loader.load_all()
+            tracer.annotate(rows=int(df.shape[0]), columns=int(df.shape[1]))
+
+        with tracer.span('plan', 'stage'):
+            plan = EDAPlanner(llm).generate_analysis_plan(profile, schema)
+
+        with tracer.span('analysis', 'stage'):
+            analyzer = DataAnalyzer(df, pool=pool, numeric_sketches=loader.numeric_sketches,
+                                    duplicates=loader.duplicates)
+            analysis_results = analyzer.analyze_all()
+
+        with tracer.span('visualization', 'stage'):
+            plot_paths = render_plots(work_dir, {'df': df}, plan, plot_pool, analysis_results)
+
+        with tracer.span('insights', 'stage'):
+            insight_gen = InsightGenerator(llm)
+            insights = insight_gen.generate_insights(format_facts(analysis_results), analysis_results)
+            summary = insight_gen.generate_summary('benchmark', insights)
+
+        with tracer.span('report', 'stage'):
+            ReportBuilder(work_dir).build_reports('benchmark', profile, analysis_results,
+                                                  insights, plot_paths, summary)
+
+    return {
+        'streaming': streaming,
+        'plots': len(plot_paths),
+        'stages': {row['stage']: row for row in tracer.stage_summary()},
+        'categories': tracer.category_totals()
+    }
+
+
+def run_case(csv_path: str, case: Dict[str, Any], options: Dict[str, Any],
+             work_dir: str) -> Dict[str, Any]:
+    """
+    Run a case options['repeat'] times, each in a new process.
+
+    Returns:
+        Case result with min/median/max wall time, median thread CPU time and
+        process peak RSS so far of every stage
+    """
+    runs = []
+    for _ in range(options['repeat']):
+        shutil.rmtree(work_dir, ignore_errors=True)
+        os.makedirs(work_dir)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            runs.append(executor.submit(_run_once, csv_path, case, options, work_dir).result())
+
+    stages = {}
+    for stage in STAGES:
+        rows = [run['stages'][stage] for run in runs]
+        walls = [row['wall_s'] for row in rows]
+        peaks = [row['process_peak_rss_mb'] for row in rows if row['process_peak_rss_mb'] is not None]
+        stages[stage] = {
+            'wall_s': {'min': min(walls), 'median': round(statistics.median(walls), 3), 'max': max(walls)},
+            'thread_cpu_s': round(statistics.median(row['thread_cpu_s'] for row in rows), 3),
+            'process_peak_rss_mb': max(peaks) if peaks else None
+        }
+    totals = [sum(run['stages'][stage]['wall_s'] for stage in STAGES) for run in runs]
+
+    return {
+        **case,
+        'file_mb': round(os.path.getsize(csv_path) / 1024**2, 1),
+        'streaming': runs[0]['streaming'],
+        'plots': runs[0]['plots'],
+        'stages': stages,
+        'total_s': {'min': round(min(totals), 3), 'median': round(statistics.median(totals), 3)},
+        'categories': runs[-1]['categories']
+    }
+
+
+def git_info() -> Dict[str, Any]:
+    """Commit the benchmarked tree is at, and whether it had uncommitted changes."""
+    def git(*args) -> Optional[str]:
+        try:
+            return subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git('status', '--porcelain', '--untracked-files=no')
+    return {
+        'commit': git('rev-parse', 'HEAD'),
+        'branch': git('rev-parse', '--abbrev-ref', 'HEAD'),
+        'subject': git('log', '-1', '--format=%s'),
+        'dirty': bool(status) if status is not None else None
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """Interpreter, machine and library versions the results were measured with."""
+    packages = {}
+    for package in ('pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn', 'pyarrow'):
+        try:
+            packages[package] = __import__(package).__version__
+        except ImportError:
+            packages[package] = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'packages': packages
+    }
+
+
+def _size_label(n: int) -> str:
+    """1e6 for powers of ten, the plain number otherwise."""
+    exponent = len(str(n)) - 1
+    return f"1e{exponent}" if n == 10**exponent and exponent >= 3 else str(n)
+
+
+def build_cases(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Cases from --rows/--columns if given, else from the preset."""
+    if args.rows or args.columns:
+        sizes = [(int(rows), int(columns))
+                 for rows in (args.rows or [10_000]) for columns in (args.columns or [10])]
+    else:
+        sizes = PRESETS[args.preset]
+
+    return [{
+        'name': f"{_size_label(rows)}x{columns}",
+        'rows': rows,
+        'columns': columns,
+        'missing_rate': args.missing_rate,
+        'cardinality': args.cardinality,
+        'seed': args.seed
+    } for rows, columns in sizes]
+
+
+def print_case(result: Dict[str, Any]):
+    parts = [f"{stage} {result['stages'][stage]['wall_s']['median']:.2f}s" for stage in STAGES]
+    print(f"   ✅ {result['name']}: {result['total_s']['median']:.2f}s ({', '.join(parts)})")
+
+
+def main():
+    """Benchmark entry point with CLI argument parsing."""
+    parser = argparse.ArgumentParser(
+        description='Time each AutoGen-EDA stage on synthetic datasets (LLM stubbed out)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmarks/run_benchmarks.py --preset smoke
+  python benchmarks/run_benchmarks.py --preset rows --repeat 1
+  python benchmarks/run_benchmarks.py --rows 1e5 1e6 --columns 10 100 --workers 4
+  python benchmarks/compare.py benchmarks/results/<before>.json benchmarks/results/<after>.json
+        """
+    )
+
+    parser.add_argument(
+        '--preset',
+        choices=sorted(PRESETS),
+        help='Dataset sizes to run (default: default)',
+        default='default'
+    )
+
+    parser.add_argument(
+        '--rows',
+        type=float,
+        nargs='+',
+        help='Row counts to run instead of a preset (e.g. 1e4 1e6); combined with every --columns value'
+    )
+
+    parser.add_argument(
+        '--columns',
+        type=float,
+        nargs='+',
+        help='Column counts to run instead of a preset (e.g. 10 1000)'
+    )
+
+    parser.add_argument(
+        '--missing-rate',
+        type=float,
+        help='Fraction of missing values per column (default: 0.05)',
+        default=0.05
+    )
+
+    parser.add_argument(
+        '--cardinality',
+        type=int,
+        help='Distinct values of each categorical column (default: 20)',
+        default=20
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed of the generated datasets (default: 42)',
+        default=42
+    )
+
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        help='Runs per case; medians are reported (default: 3)',
+        default=3
+    )
+
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        help='Column workers, as in main.py (default: 1)',
+        default=1
+    )
+
+    parser.add_argument(
+        '--parallel-backend',
+        choices=['thread', 'process'],
+        help='Column worker backend, as in main.py (default: thread)',
+        default='thread'
+    )
+
+    parser.add_argument(
+        '--sample-rows',
+        type=int,
+        help=f'Rows kept in memory for streamed cases (at least {STREAMING_ROWS:,} rows; default: 200000)',
+        default=200000
+    )
+
+    parser.add_argument(
+        '--data-dir',
+        help='Directory for generated datasets, reused across runs (default: benchmarks/data)',
+        default=os.path.join(REPO_ROOT, 'benchmarks', 'data')
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        help='Results file (default: benchmarks/results/<timestamp>_<commit>.json)',
+        default=None
+    )
+
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Show the progress output of each stage'
+    )
+
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    cases = build_cases(args)
+    options = {
+        'repeat': args.repeat,
+        'workers': args.workers,
+        'parallel_backend': args.parallel_backend,
+        'sample_rows': args.sample_rows,
+        'streaming_rows': STREAMING_ROWS,
+        'verbose': args.verbose
+    }
+    git = git_info()
+    work_dir = os.path.join(args.data_dir, 'output')
+
+    print("="*80)
+    print(f"⏱️  AutoGen-EDA benchmarks: {len(cases)} cases × {args.repeat} runs "
+          f"at {(git['commit'] or 'unknown')[:10]}{' (dirty)' if git['dirty'] else ''}")
+    print("="*80)
+
+    startup = measure_startup()
+    print(f"\n🚀 Startup: import main {startup['import_main_s']['median']:.3f}s, "
+          f"main.py --help {startup['help_s']['median']:.3f}s")
+
+    results = []
+    for case in cases:
+        print(f"\n📊 {case['name']}: {case['rows']:,} rows × {case['columns']:,} columns")
+        csv_path, generate_s = ensure_dataset(args.data_dir, case)
+        result = run_case(csv_path, case, options, work_dir)
+        result['generate_s'] = generate_s
+        results.append(result)
+        print_case(result)
+
+    created = datetime.now()
+    output_path = args.output or os.path.join(
+        REPO_ROOT, 'benchmarks', 'results',
+        f"{created:%Y%m%d-%H%M%S}_{(git['commit'] or 'nogit')[:10]}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'created': created.isoformat(timespec='seconds'),
+            'git': git,
+            'environment': environment_info(),
+            'options': {key: value for key, value in options.items() if key != 'verbose'},
+            'startup': startup,
+            'cases': results
+        }, f, indent=2)
+
+    print(f"\n💾 Results saved to: {output_path}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,59 @@
 """
 Generate sample datasets for testing AutoGen-EDA
-Run this if you want to test without downloading real datasets
+Run this if you want to test without downloading real datasets, or with
+--rows to write large synthetic datasets (from a JSON schema or a default
+mix of column types) for scaling tests
 """
+import os
+import sys
+import gzip
+import json
+import argparse
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Options of every schema column, and of each column type
+COMMON_DEFAULTS = {
+    'null_rate': 0.0,
+    'missing_codes': [],
+    'missing_code_rate': 0.0,
+    'correlate_with': None,
+    'correlation': 0.0
+}
+COLUMN_DEFAULTS = {
+    'float': {'mean': 0.0, 'std': 1.0, 'min': None, 'max': None, 'decimals': 3},
+    'int': {'mean': 50.0, 'std': 15.0, 'min': None, 'max': None},
+    'category': {'cardinality': 10, 'values': None, 'skew': 1.0},
+    'datetime': {'start': '2020-01-01', 'end': '2024-12-31', 'sequential': False},
+    'bool': {'p': 0.5},
+    'id': {'prefix': 'id_'}
+}
+
+# Column types of the default synthetic dataset, cycled so any width gets a stable mix
+# (4 float, 2 int, 2 categorical, 1 datetime, 1 boolean per 10 columns, plus IDs)
+SYNTHETIC_KIND_CYCLE = ['float', 'int', 'category', 'float', 'id',
+                        'float', 'category', 'int', 'datetime', 'bool']
+
+# Rows generated at a time, fewer for wide schemas so a chunk holds at most
+# CHUNK_CELLS values; the chunk size is part of what fixes a file's content
+DEFAULT_CHUNK_ROWS = 100_000
+CHUNK_CELLS = 10_000_000
+
+CSV_COMPRESSIONS = ('none', 'gzip')
+PARQUET_COMPRESSIONS = ('none', 'snappy', 'gzip', 'zstd')
 
 
 def generate_health_survey_data(n_rows=5000):
@@ -100,8 +149,399 @@ def generate_sales_data(n_rows=3000):
     
     return df
 
+def synthetic_columns(n_columns: int) -> List[Tuple[str, str]]:
+    """
+    Names and types of the columns of the default synthetic dataset.
+    
+    Args:
+        n_columns: Number of columns
+    
+    Returns:
+        List of (name, type) pairs; type is one of SYNTHETIC_KIND_CYCLE
+    """
+    columns = []
+    for i in range(n_columns):
+        kind = SYNTHETIC_KIND_CYCLE[i % len(SYNTHETIC_KIND_CYCLE)]
+        columns.append((f"{kind}_{i}", kind))
+    return columns
 
-def main():
+
+def synthetic_schema(n_columns: int, missing_rate: float = 0.05, cardinality: int = 20) -> Dict[str, Any]:
+    """
+    Schema of the default synthetic dataset (see synthetic_columns).
+    
+    Every second float column is correlated with the float column before it
+    (r = 0.7), so correlation analysis and heatmaps have structure to find.
+    
+    Args:
+        n_columns: Number of columns
+        missing_rate: Fraction of missing values in every column except IDs
+        cardinality: Distinct values of each categorical column (skewed)
+    
+    Returns:
+        Schema for write_dataset
+    """
+    columns = []
+    unpaired_float = None
+    for i, (name, kind) in enumerate(synthetic_columns(n_columns)):
+        spec = {'name': name, 'type': kind}
+        if kind != 'id':
+            spec['null_rate'] = missing_rate
+        if kind == 'float':
+            spec.update(mean=100.0 * (i + 1), std=10.0 * (i + 1))
+            if unpaired_float:
+                spec.update(correlate_with=unpaired_float, correlation=0.7)
+                unpaired_float = None
+            else:
+                unpaired_float = name
+        elif kind == 'int':
+            mean = 5 + i % 20
+            spec.update(mean=mean, std=mean ** 0.5, min=0)
+        elif kind == 'category':
+            spec['cardinality'] = cardinality
+        elif kind == 'bool':
+            spec['p'] = 0.3
+        columns.append(spec)
+    return {'columns': columns}
+
+
+def validate_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check a dataset schema and fill in the defaults of every column.
+    
+    A schema is {"columns": [...]}, each column a dict with a "name", a
+    "type" (see COLUMN_DEFAULTS for the options of each type) and optionally:
+    "null_rate" (fraction left empty), "missing_codes" (sentinel values such
+    as -999 or "Unknown") with "missing_code_rate", and for numeric columns
+    "correlate_with" (an earlier numeric column) and "correlation".
+    
+    Args:
+        schema: Schema as loaded from JSON
+    
+    Returns:
+        Copy of the schema with every option set
+    
+    Raises:
+        ValueError: If the schema is malformed
+    """
+    columns = schema.get('columns') if isinstance(schema, dict) else None
+    if not columns:
+        raise ValueError("Schema needs a non-empty 'columns' list")
+    
+    normalized = []
+    numeric_seen = set()
+    names = set()
+    for spec in columns:
+        name, kind = spec.get('name'), spec.get('type')
+        if not name or name in names:
+            raise ValueError(f"Column names must be present and unique: {name!r}")
+        if kind not in COLUMN_DEFAULTS:
+            raise ValueError(f"Column {name!r}: unknown type {kind!r} (expected one of {', '.join(COLUMN_DEFAULTS)})")
+        names.add(name)
+        
+        options = {**COMMON_DEFAULTS, **COLUMN_DEFAULTS[kind]}
+        unknown = set(spec) - set(options) - {'name', 'type'}
+        if unknown:
+            raise ValueError(f"Column {name!r}: unknown options for type {kind}: {', '.join(sorted(unknown))}")
+        column = {**options, **spec}
+        if column['missing_codes'] and 'missing_code_rate' not in spec:
+            column['missing_code_rate'] = 0.01
+        
+        if not (0 <= column['null_rate'] and 0 <= column['missing_code_rate']
+                and column['null_rate'] + column['missing_code_rate'] <= 1):
+            raise ValueError(f"Column {name!r}: null_rate and missing_code_rate must be non-negative and sum to at most 1")
+        if column['missing_codes'] and kind in ('bool', 'id'):
+            raise ValueError(f"Column {name!r}: missing_codes are not supported for {kind} columns")
+        if kind in ('float', 'int') and not all(isinstance(code, (int, float)) for code in column['missing_codes']):
+            raise ValueError(f"Column {name!r}: missing_codes of numeric columns must be numbers")
+        if kind == 'int' and not all(float(code).is_integer() for code in column['missing_codes']):
+            raise ValueError(f"Column {name!r}: missing_codes of int columns must be whole numbers")
+        
+        if column['correlate_with'] is not None:
+            if kind not in ('float', 'int'):
+                raise ValueError(f"Column {name!r}: only numeric columns can be correlated")
+            if column['correlate_with'] not in numeric_seen:
+                raise ValueError(f"Column {name!r}: correlate_with must name an earlier numeric column")
+            if not -1 <= column['correlation'] <= 1:
+                raise ValueError(f"Column {name!r}: correlation must be between -1 and 1")
+        if kind in ('float', 'int'):
+            numeric_seen.add(name)
+        
+        if kind == 'category' and not (column['values'] or column['cardinality'] >= 1):
+            raise ValueError(f"Column {name!r}: needs a 'values' list or a cardinality of at least 1")
+        if kind == 'datetime' and pd.Timestamp(column['start']) >= pd.Timestamp(column['end']):
+            raise ValueError(f"Column {name!r}: start must be before end")
+        normalized.append(column)
+    
+    return {'columns': normalized}
+
+
+def load_schema(path: str) -> Dict[str, Any]:
+    """Load and validate a JSON dataset schema (see validate_schema)."""
+    with open(path) as f:
+        return validate_schema(json.load(f))
+
+
+def chunk_rows_for(n_columns: int, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """Rows per chunk, reduced for wide schemas so a chunk holds at most CHUNK_CELLS values."""
+    return max(1, min(chunk_rows, CHUNK_CELLS // max(n_columns, 1)))
+
+
+def _numeric_values(column: Dict[str, Any], rng: np.random.Generator, size: int,
+                    latents: Dict[str, np.ndarray]) -> np.ndarray:
+    z = rng.standard_normal(size)
+    if column['correlate_with'] is not None:
+        # Mixed with the reference column's standard normal draws: Pearson r = correlation
+        rho = column['correlation']
+        z = rho * latents[column['correlate_with']] + np.sqrt(1 - rho**2) * z
+    latents[column['name']] = z
+    
+    values = column['mean'] + column['std'] * z
+    if column['min'] is not None or column['max'] is not None:
+        values = np.clip(values, column['min'], column['max'])
+    if column['type'] == 'int':
+        return np.rint(values).astype(np.int64)
+    return values.round(column['decimals'])
+
+
+def _column_values(column: Dict[str, Any], rng: np.random.Generator, start_row: int,
+                   size: int, n_rows: int, latents: Dict[str, np.ndarray]) -> np.ndarray:
+    kind = column['type']
+    if kind in ('float', 'int'):
+        return _numeric_values(column, rng, size, latents)
+    
+    if kind == 'category':
+        labels = column['values'] or [f"level_{k}" for k in range(column['cardinality'])]
+        labels = np.array(labels, dtype=object)
+        # Zipf-like frequencies; skew 0 gives uniform levels
+        weights = 1.0 / np.arange(1, len(labels) + 1) ** column['skew']
+        return labels[rng.choice(len(labels), size, p=weights / weights.sum())]
+    
+    if kind == 'datetime':
+        start = np.datetime64(pd.Timestamp(column['start']), 's')
+        span_s = int((pd.Timestamp(column['end']) - pd.Timestamp(column['start'])).total_seconds())
+        if column['sequential']:
+            # Evenly spaced over the whole file, like an event log
+            offsets = (np.arange(start_row, start_row + size) * (span_s / max(n_rows, 1))).astype(np.int64)
+        else:
+            offsets = rng.integers(0, span_s, size)
+        return start + offsets.astype('timedelta64[s]')
+    
+    if kind == 'bool':
+        return rng.random(size) < column['p']
+    
+    # Row numbers make identifiers unique across the file, whichever chunk writes them
+    return np.char.add(column['prefix'], np.arange(start_row, start_row + size).astype(str)).astype(object)
+
+
+def _apply_missing(column: Dict[str, Any], values: np.ndarray, rng: np.random.Generator):
+    """Replace a column's sampled missing-code and null positions."""
+    kind = column['type']
+    draw = rng.random(len(values)) if column['null_rate'] or column['missing_code_rate'] else None
+    
+    if draw is not None and column['missing_code_rate']:
+        code_mask = (draw >= column['null_rate']) & (draw < column['null_rate'] + column['missing_code_rate'])
+        codes = column['missing_codes']
+        if kind == 'datetime':
+            codes = [np.datetime64(pd.Timestamp(code), 's') for code in codes]
+        values[code_mask] = np.array(codes, dtype=values.dtype)[rng.integers(0, len(codes), code_mask.sum())]
+    
+    null_mask = draw < column['null_rate'] if draw is not None else np.zeros(len(values), dtype=bool)
+    if kind == 'int':
+        return pd.arrays.IntegerArray(values, null_mask)
+    if kind == 'bool':
+        return pd.arrays.BooleanArray(values, null_mask)
+    if kind == 'float':
+        values[null_mask] = np.nan
+    elif kind == 'datetime':
+        values[null_mask] = np.datetime64('NaT')
+    else:
+        values[null_mask] = None
+    return values
+
+
+def generate_chunk(schema: Dict[str, Any], chunk_index: int, chunk_rows: int,
+                   n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate one chunk of a dataset: rows [chunk_index * chunk_rows, ...).
+    
+    Each chunk draws from its own random stream derived from the seed and
+    the chunk index, so chunks can be generated in any order or process
+    and the file is identical for the same schema, seed and chunk size.
+    
+    Args:
+        schema: Validated schema (see validate_schema)
+        chunk_index: Position of the chunk in the file
+        chunk_rows: Rows per chunk (the last chunk may be shorter)
+        n_rows: Total rows of the dataset
+        seed: Random seed of the dataset
+    
+    Returns:
+        DataFrame chunk
+    """
+    start_row = chunk_index * chunk_rows
+    size = min(chunk_rows, n_rows - start_row)
+    rng = np.random.default_rng([seed, chunk_index])
+    
+    latents: Dict[str, np.ndarray] = {}
+    data = {}
+    for column in schema['columns']:
+        values = _column_values(column, rng, start_row, size, n_rows, latents)
+        data[column['name']] = _apply_missing(column, values, rng)
+    return pd.DataFrame(data)
+
+
+def generate_synthetic_data(n_rows: int = 10000, n_columns: int = 10, missing_rate: float = 0.05,
+                            cardinality: int = 20, seed: int = 42) -> pd.DataFrame:
+    """Generate the default synthetic dataset in memory, with the same rows write_synthetic_csv writes."""
+    schema = validate_schema(synthetic_schema(n_columns, missing_rate, cardinality))
+    chunk_rows = chunk_rows_for(n_columns)
+    chunks = [generate_chunk(schema, i, chunk_rows, n_rows, seed)
+              for i in range(-(-n_rows // chunk_rows))]
+    return pd.concat(chunks, ignore_index=True)
+
+
+# Dataset being written by this generator worker, set once by _init_generator
+_GENERATOR_JOB: Optional[Dict[str, Any]] = None
+
+
+def _init_generator(job: Dict[str, Any]):
+    """Receive the schema and layout once per worker rather than with every chunk."""
+    global _GENERATOR_JOB
+    _GENERATOR_JOB = job
+
+
+def _encode_chunk(chunk_index: int):
+    """Worker side: generate a chunk and serialize it (CSV bytes or an Arrow table)."""
+    job = _GENERATOR_JOB
+    df = generate_chunk(job['schema'], chunk_index, job['chunk_rows'], job['n_rows'], job['seed'])
+    if job['format'] == 'parquet':
+        return pa.Table.from_pandas(df, preserve_index=False)
+    
+    data = df.to_csv(index=False, header=(chunk_index == 0)).encode('utf-8')
+    if job['compression'] == 'gzip':
+        # Concatenated gzip members form one valid .gz file
+        return gzip.compress(data, compresslevel=6)
+    return data
+
+
+def _encoded_chunks(job: Dict[str, Any], n_chunks: int, workers: int) -> Iterator[Any]:
+    """Encoded chunks in file order, generated by up to `workers` processes."""
+    if workers <= 1:
+        _init_generator(job)
+        for chunk_index in range(n_chunks):
+            yield _encode_chunk(chunk_index)
+        return
+    
+    # A bounded window of chunks in flight keeps memory flat however large the file
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_generator, initargs=(job,)) as executor:
+        pending = deque()
+        next_chunk = 0
+        while pending or next_chunk < n_chunks:
+            while next_chunk < n_chunks and len(pending) < 2 * workers:
+                pending.append(executor.submit(_encode_chunk, next_chunk))
+                next_chunk += 1
+            yield pending.popleft().result()
+
+
+def write_dataset(path: str, schema: Dict[str, Any], n_rows: int, seed: int = 42,
+                  workers: int = 1, compression: Optional[str] = None,
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> str:
+    """
+    Write a synthetic dataset chunk by chunk, generated in parallel.
+    
+    Memory stays bounded by a few chunks per worker however many rows are
+    requested, and the output only depends on the schema, seed and chunk
+    size, not on the number of workers.
+    
+    Args:
+        path: Output file; .parquet writes Parquet (requires pyarrow),
+            anything else CSV, gzip-compressed by default if it ends in .gz
+        schema: Dataset schema (see validate_schema)
+        n_rows: Total rows
+        seed: Random seed
+        workers: Generator processes (0 = all cores)
+        compression: CSV: 'none' or 'gzip'; Parquet: 'none', 'snappy',
+            'gzip' or 'zstd' (default: from the file name, snappy for Parquet)
+        chunk_rows: Rows per chunk (see chunk_rows_for)
+    
+    Returns:
+        Path of the written file
+    """
+    path = str(path)
+    fmt = 'parquet' if path.endswith('.parquet') else 'csv'
+    if compression is None:
+        compression = 'snappy' if fmt == 'parquet' else ('gzip' if path.endswith('.gz') else 'none')
+    allowed = PARQUET_COMPRESSIONS if fmt == 'parquet' else CSV_COMPRESSIONS
+    if compression not in allowed:
+        raise ValueError(f"Compression {compression!r} not supported for {fmt} (use one of {', '.join(allowed)})")
+    if fmt == 'parquet' and not PYARROW_AVAILABLE:
+        raise ImportError("Parquet output requires pyarrow (pip install pyarrow)")
+    if n_rows < 1:
+        raise ValueError("n_rows must be at least 1")
+    
+    schema = validate_schema(schema)
+    chunk_rows = chunk_rows_for(len(schema['columns']), chunk_rows)
+    n_chunks = -(-n_rows // chunk_rows)
+    workers = min(workers if workers > 0 else (os.cpu_count() or 1), n_chunks)
+    job = {'schema': schema, 'n_rows': n_rows, 'chunk_rows': chunk_rows, 'seed': seed,
+           'format': fmt, 'compression': compression}
+    
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    report_every = max(1, n_chunks // 10)
+    
+    if fmt == 'parquet':
+        writer = None
+        for chunk_index, table in enumerate(_encoded_chunks(job, n_chunks, workers)):
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, table.schema,
+                                          compression=None if compression == 'none' else compression)
+            elif not table.schema.equals(writer.schema, check_metadata=False):
+                table = table.cast(writer.schema)
+            # One row group per chunk
+            writer.write_table(table)
+            _report_progress(chunk_index, n_chunks, chunk_rows, n_rows, report_every)
+        writer.close()
+    else:
+        with open(tmp_path, 'wb') as f:
+            for chunk_index, data in enumerate(_encoded_chunks(job, n_chunks, workers)):
+                f.write(data)
+                _report_progress(chunk_index, n_chunks, chunk_rows, n_rows, report_every)
+    
+    # Renamed at the end, so an interrupted run never leaves a truncated dataset
+    os.replace(tmp_path, path)
+    return path
+
+
+def _report_progress(chunk_index: int, n_chunks: int, chunk_rows: int, n_rows: int, report_every: int):
+    if n_chunks > 1 and ((chunk_index + 1) % report_every == 0 or chunk_index + 1 == n_chunks):
+        print(f"   ✍️  {min((chunk_index + 1) * chunk_rows, n_rows):,} / {n_rows:,} rows written")
+
+
+def write_synthetic_csv(path: str, n_rows: int, n_columns: int, missing_rate: float = 0.05,
+                        cardinality: int = 20, seed: int = 42, workers: int = 1) -> str:
+    """
+    Write the default synthetic dataset (see synthetic_schema) to a file.
+    
+    Args:
+        path: Output path (see write_dataset for the supported formats)
+        n_rows: Total rows
+        n_columns: Number of columns
+        missing_rate: Fraction of missing values per column
+        cardinality: Distinct values of each categorical column
+        seed: Random seed
+        workers: Generator processes (0 = all cores)
+    
+    Returns:
+        Path of the written file
+    """
+    return write_dataset(path, synthetic_schema(n_columns, missing_rate, cardinality),
+                         n_rows, seed, workers)
+
+
+def generate_samples():
     """Generate and save sample datasets."""
     print("="*80)
     print("🎲 Sample Dataset Generator for AutoGen-EDA")
@@ -134,6 +574,107 @@ def main():
     print(f"  python src/main.py {sales_path}")
     print("\n" + "="*80 + "\n")
 
+def main():
+    """Entry point: the sample datasets, or a synthetic dataset with --rows."""
+    parser = argparse.ArgumentParser(
+        description='Generate sample datasets, or large synthetic datasets for scaling tests',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python generate_sample_data.py
+  python generate_sample_data.py --rows 1e6 --columns 50
+  python generate_sample_data.py --rows 5e8 --schema data/schema.json --output data/big.csv.gz
+  python generate_sample_data.py --rows 1e8 --columns 20 --output data/big.parquet --workers 16
+        """
+    )
+    
+    parser.add_argument(
+        '--rows',
+        type=float,
+        help='Write a synthetic dataset with this many rows (e.g. 1e8) instead of the sample datasets'
+    )
+    
+    parser.add_argument(
+        '--schema',
+        help='JSON schema of the columns (types, cardinality, null rates, missing codes, correlations)'
+    )
+    
+    parser.add_argument(
+        '--columns',
+        type=int,
+        help='Columns of the default mixed-type schema when no --schema is given (default: 10)',
+        default=10
+    )
+    
+    parser.add_argument(
+        '--missing-rate',
+        type=float,
+        help='Fraction of missing values per column of the default schema (default: 0.05)',
+        default=0.05
+    )
+    
+    parser.add_argument(
+        '--cardinality',
+        type=int,
+        help='Distinct values of categorical columns of the default schema (default: 20)',
+        default=20
+    )
+    
+    parser.add_argument(
+        '--output', '-o',
+        help='Output file; .csv, .csv.gz or .parquet (default: data/synthetic_<rows>x<columns>.csv)'
+    )
+    
+    parser.add_argument(
+        '--compression',
+        choices=sorted(set(CSV_COMPRESSIONS + PARQUET_COMPRESSIONS)),
+        help='Override the compression implied by the file name (Parquet default: snappy)'
+    )
+    
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed; the same seed, schema and chunk size give the same file (default: 42)',
+        default=42
+    )
+    
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        help='Generator processes (default: 0 = all cores); does not change the output',
+        default=0
+    )
+    
+    parser.add_argument(
+        '--chunk-rows',
+        type=int,
+        help=f'Rows generated at a time (default: {DEFAULT_CHUNK_ROWS:,})',
+        default=DEFAULT_CHUNK_ROWS
+    )
+    
+    args = parser.parse_args()
+    
+    if args.rows is None:
+        generate_samples()
+        return
+    
+    n_rows = int(args.rows)
+    try:
+        schema = load_schema(args.schema) if args.schema else synthetic_schema(
+            args.columns, args.missing_rate, args.cardinality
+        )
+        n_columns = len(schema['columns'])
+        output = args.output or f"data/synthetic_{n_rows}x{n_columns}.csv"
+        
+        print(f"🎲 Writing {n_rows:,} rows × {n_columns} columns to {output}...")
+        write_dataset(output, schema, n_rows, seed=args.seed, workers=args.workers,
+                      compression=args.compression, chunk_rows=args.chunk_rows)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    
+    print(f"   ✅ Saved: {output} ({os.path.getsize(output) / 1024**2:,.1f} MB)")
+
 
 if __name__ == "__main__":
     main()
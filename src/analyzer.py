@@ -5,23 +5,159 @@ NO LLM - only verified computations
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Tuple
-from scipy import stats
-from utils import safe_percentage, format_number, infer_column_types
+from typing import Dict, Any, List, Optional, Tuple
+from utils import safe_percentage, format_number
+from column_stats import get_column_stats
+from parallel import ColumnPool
+from sketches import NumericSketch, spread_sample
+from correlation import correlation_matrix, top_correlations, save_matrix
+from duplicates import find_duplicates
+from instrumentation import span, annotate
+
+# Plot-ready distribution summaries kept with each numeric column's statistics
+HISTOGRAM_BINS = 30
+MAX_FLIERS = 100
+
+
+def _summarize_categorical(col_data: pd.Series, total: int, n_unique: int) -> Dict[str, Any]:
+    """Frequency summary of one categorical column."""
+    value_counts = col_data.value_counts()
+    
+    return {
+        'unique_values': n_unique,
+        'most_frequent': {
+            'value': str(value_counts.index[0]) if len(value_counts) > 0 else None,
+            'count': int(value_counts.iloc[0]) if len(value_counts) > 0 else 0,
+            'percentage': round(safe_percentage(value_counts.iloc[0], total), 2) if len(value_counts) > 0 else 0
+        },
+        'value_distribution': [
+            {
+                'value': str(val),
+                'count': int(count),
+                'percentage': round(safe_percentage(count, total), 2)
+            }
+            for val, count in value_counts.head(10).items()
+        ]
+    }
+
+
+def summarize_numeric(col_data: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Descriptive statistics and IQR outliers of one numeric column (None if empty),
+    with the histogram bin counts and boxplot whiskers the visualizer draws from.
+    """
+    col_data = col_data.dropna()
+    
+    if len(col_data) == 0:
+        return None
+    
+    # Basic statistics
+    result = {
+        'count': int(len(col_data)),
+        'mean': float(col_data.mean()),
+        'median': float(col_data.median()),
+        'std': float(col_data.std()),
+        'min': float(col_data.min()),
+        'max': float(col_data.max()),
+        'q25': float(col_data.quantile(0.25)),
+        'q75': float(col_data.quantile(0.75))
+    }
+    
+    # IQR and outliers
+    q1 = result['q25']
+    q3 = result['q75']
+    iqr = q3 - q1
+    
+    lower_bound = q1 - 1.5 * iqr
+    upper_bound = q3 + 1.5 * iqr
+    
+    is_outlier = (col_data < lower_bound) | (col_data > upper_bound)
+    outliers = col_data[is_outlier]
+    inside = col_data[~is_outlier]
+    
+    result['outliers'] = {
+        'count': int(len(outliers)),
+        'percentage': round(safe_percentage(len(outliers), len(col_data)), 2),
+        'lower_bound': float(lower_bound),
+        'upper_bound': float(upper_bound)
+    }
+    
+    # Distribution summaries for plots, so plotting never rescans the column
+    counts, edges = np.histogram(col_data.to_numpy(dtype=np.float64), bins=HISTOGRAM_BINS)
+    result['histogram'] = {'counts': counts.tolist(), 'edges': edges.tolist()}
+    result['boxplot'] = {
+        'whislo': float(inside.min()),
+        'whishi': float(inside.max()),
+        'fliers': spread_sample(np.sort(outliers.to_numpy(dtype=np.float64)), MAX_FLIERS)
+    }
+    
+    # Skewness and kurtosis (scipy.stats is slow to import, so only when first needed)
+    from scipy import stats
+    result['skewness'] = float(stats.skew(col_data))
+    result['kurtosis'] = float(stats.kurtosis(col_data))
+    
+    return result
+
+
+def _sketch_numeric(col_data: pd.Series, accuracy: float,
+                    block_rows: int = 1000000) -> Optional[Dict[str, Any]]:
+    """
+    Numeric summary from one pass through a quantile sketch.
+    
+    The sketch still sorts each block as it compresses it, so this is not
+    faster than exact quantiles on an in-memory column; it keeps memory
+    bounded by the sketch size rather than the column length.
+    """
+    sketch = NumericSketch(accuracy)
+    values = col_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    for start in range(0, len(values), block_rows):
+        sketch.update(values[start:start + block_rows])
+    return sketch.summary(HISTOGRAM_BINS, MAX_FLIERS)
 
 
 class DataAnalyzer:
     """Performs statistical analysis on datasets"""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, pool: Optional[ColumnPool] = None,
+                 approx_distinct: bool = False, quantile_accuracy: Optional[float] = None,
+                 numeric_sketches: Optional[Dict[str, NumericSketch]] = None,
+                 inline_matrix_limit: int = 50, duplicate_subset: Optional[List[str]] = None,
+                 duplicates: Optional[Dict[str, Any]] = None,
+                 profile: Optional[Dict[str, Any]] = None):
         """
         Initialize analyzer.
         
         Args:
             df: DataFrame to analyze
+            pool: Optional worker pool for per-column analysis (inline if None)
+            approx_distinct: Estimate distinct counts of high-cardinality columns
+                with HyperLogLog (ignored if the frame's stats already exist)
+            quantile_accuracy: If set, compute numeric quantiles and outlier counts
+                with a KLL sketch of this normalized rank error, in bounded memory
+            numeric_sketches: Optional precomputed sketches per column (e.g. built
+                over the whole file while streaming), used in place of df's values
+            inline_matrix_limit: Largest number of numeric columns whose correlation
+                matrix is embedded in the results; wider ones only keep the top pairs
+            duplicate_subset: Optional columns for near-duplicate detection
+            duplicates: Optional precomputed duplicate summary (e.g. over the whole
+                file while streaming), used instead of scanning df
+            profile: Optional whole-file profile (the loader's streamed profile)
+                when df is only a sample; row, missing and distinct counts are
+                taken from it, and the results record the sample size
         """
         self.df = df
-        self.column_types = infer_column_types(df)
+        self.pool = pool or ColumnPool()
+        self.quantile_accuracy = quantile_accuracy
+        self.numeric_sketches = numeric_sketches or {}
+        self.inline_matrix_limit = inline_matrix_limit
+        self.duplicate_subset = duplicate_subset
+        self.duplicates = duplicates
+        self.profile = profile
+        self.n_rows = int(profile['shape']['rows']) if profile else int(df.shape[0])
+        self.correlation_matrix: Optional[np.ndarray] = None
+        self.correlation_columns: List[str] = []
+        self.column_stats = get_column_stats(df, pool, approx_distinct)
+        self.column_types = dict(self.column_stats.column_types)
         self.results = {}
     
     def analyze_all(self, plan: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -35,28 +171,55 @@ class DataAnalyzer:
             Dictionary of all analysis results
         """
         print("\n📊 Running statistical analysis...")
+        annotate(rows=int(self.df.shape[0]), columns=int(self.df.shape[1]))
         
-        self.results = {
-            'overview': self._get_overview(),
-            'data_quality': self._check_data_quality(),
-            'categorical_analysis': self._analyze_categorical(),
-            'numeric_analysis': self._analyze_numeric(),
-            'relationships': self._analyze_relationships()
-        }
+        sections = [
+            ('overview', self._get_overview),
+            ('data_quality', self._check_data_quality),
+            ('categorical_analysis', self._analyze_categorical),
+            ('numeric_analysis', self._analyze_numeric),
+            ('relationships', self._analyze_relationships)
+        ]
+        self.results = {}
+        for name, analyze in sections:
+            with span(name, 'step', rows=int(self.df.shape[0])):
+                self.results[name] = analyze()
         
         print("   ✅ Analysis complete")
         return self.results
     
     def _get_overview(self) -> Dict[str, Any]:
         """Get dataset overview."""
-        return {
-            'total_rows': int(self.df.shape[0]),
+        duplicates = self.duplicates
+        if duplicates is None:
+            subset = [col for col in self.duplicate_subset or [] if col in self.df.columns]
+            with span('find_duplicates', 'step', rows=int(self.df.shape[0])):
+                duplicates = find_duplicates(self.df, subset or None)
+        
+        overview = {
+            'total_rows': self.n_rows,
             'total_columns': int(self.df.shape[1]),
-            'total_cells': int(self.df.shape[0] * self.df.shape[1]),
-            'memory_usage_mb': float(self.df.memory_usage(deep=True).sum() / 1024**2),
-            'duplicate_rows': int(self.df.duplicated().sum()),
+            'total_cells': int(self.n_rows * self.df.shape[1]),
+            'memory_usage_mb': float(self.profile['memory_usage_mb'] if self.profile
+                                     else self.df.memory_usage(deep=True).sum() / 1024**2),
+            'duplicate_rows': int(duplicates['duplicate_rows']),
+            'duplicates': duplicates,
             'column_types': self.column_types
         }
+        if self.n_rows != len(self.df):
+            # Sections computed from df's rows rather than whole-file counts or sketches
+            overview['sample_rows'] = int(len(self.df))
+            overview['sampled_sections'] = ['categorical_analysis', 'relationships']
+            if not self.numeric_sketches:
+                overview['sampled_sections'].insert(1, 'numeric_analysis')
+        return overview
+    
+    def _column_counts(self, col: str) -> Tuple[int, int]:
+        """Missing and distinct counts of a column, whole-file when a profile is given."""
+        info = (self.profile or {}).get('columns', {}).get(col)
+        if info is not None:
+            return int(info['null_count']), int(info['unique_count'])
+        return int(self.column_stats.null_counts[col]), int(self.column_stats.unique_counts[col])
     
     def _check_data_quality(self) -> Dict[str, Any]:
         """Check data quality issues."""
@@ -68,8 +231,8 @@ class DataAnalyzer:
         }
         
         for col in self.df.columns:
-            missing_count = int(self.df[col].isna().sum())
-            missing_pct = safe_percentage(missing_count, len(self.df))
+            missing_count, n_unique = self._column_counts(col)
+            missing_pct = safe_percentage(missing_count, self.n_rows)
             
             quality['missing_by_column'][col] = {
                 'count': missing_count,
@@ -84,18 +247,21 @@ class DataAnalyzer:
                 })
             
             # Check for constant columns
-            if self.df[col].nunique() == 1:
+            if n_unique == 1:
                 quality['constant_columns'].append(col)
             
             # Check for high cardinality
             if self.column_types[col] in ['categorical', 'text']:
-                unique_ratio = self.df[col].nunique() / len(self.df)
+                unique_ratio = n_unique / self.n_rows
                 if unique_ratio > 0.9:
-                    quality['high_cardinality_columns'].append({
+                    entry = {
                         'column': col,
-                        'unique_count': int(self.df[col].nunique()),
+                        'unique_count': n_unique,
                         'unique_ratio': round(unique_ratio, 3)
-                    })
+                    }
+                    if self.column_stats.is_estimated(col):
+                        entry['estimated'] = True
+                    quality['high_cardinality_columns'].append(entry)
         
         return quality
     
@@ -104,78 +270,32 @@ class DataAnalyzer:
         categorical_cols = [col for col, ctype in self.column_types.items() 
                            if ctype in ['categorical', 'binary']]
         
-        results = {}
+        selected = categorical_cols[:5]  # Limit to top 5
+        # Frequencies are shares of the rows in df; the distinct count may be whole-file
+        args = {col: (int(self.column_stats.non_null_counts[col]), self._column_counts(col)[1])
+                for col in selected}
         
-        for col in categorical_cols[:5]:  # Limit to top 5
-            value_counts = self.df[col].value_counts()
-            total = len(self.df[col].dropna())
-            
-            results[col] = {
-                'unique_values': int(self.df[col].nunique()),
-                'most_frequent': {
-                    'value': str(value_counts.index[0]) if len(value_counts) > 0 else None,
-                    'count': int(value_counts.iloc[0]) if len(value_counts) > 0 else 0,
-                    'percentage': round(safe_percentage(value_counts.iloc[0], total), 2) if len(value_counts) > 0 else 0
-                },
-                'value_distribution': [
-                    {
-                        'value': str(val),
-                        'count': int(count),
-                        'percentage': round(safe_percentage(count, total), 2)
-                    }
-                    for val, count in value_counts.head(10).items()
-                ]
-            }
-        
-        return results
+        return self.pool.map_columns(_summarize_categorical, self.df, selected, args)
     
     def _analyze_numeric(self) -> Dict[str, Any]:
         """Analyze numeric columns."""
         numeric_cols = [col for col, ctype in self.column_types.items() 
                        if ctype == 'numeric']
         
-        results = {}
+        # Analyze up to 10 numeric columns
+        selected = numeric_cols[:10]
+        to_compute = [col for col in selected if col not in self.numeric_sketches]
+        if self.quantile_accuracy:
+            args = {col: (self.quantile_accuracy,) for col in to_compute}
+            computed = self.pool.map_columns(_sketch_numeric, self.df, to_compute, args)
+        else:
+            computed = self.pool.map_columns(summarize_numeric, self.df, to_compute)
         
-        for col in numeric_cols[:10]:  # Analyze up to 10 numeric columns
-            col_data = self.df[col].dropna()
-            
-            if len(col_data) == 0:
-                continue
-            
-            # Basic statistics
-            results[col] = {
-                'count': int(len(col_data)),
-                'mean': float(col_data.mean()),
-                'median': float(col_data.median()),
-                'std': float(col_data.std()),
-                'min': float(col_data.min()),
-                'max': float(col_data.max()),
-                'q25': float(col_data.quantile(0.25)),
-                'q75': float(col_data.quantile(0.75))
-            }
-            
-            # IQR and outliers
-            q1 = results[col]['q25']
-            q3 = results[col]['q75']
-            iqr = q3 - q1
-            
-            lower_bound = q1 - 1.5 * iqr
-            upper_bound = q3 + 1.5 * iqr
-            
-            outliers = col_data[(col_data < lower_bound) | (col_data > upper_bound)]
-            
-            results[col]['outliers'] = {
-                'count': int(len(outliers)),
-                'percentage': round(safe_percentage(len(outliers), len(col_data)), 2),
-                'lower_bound': float(lower_bound),
-                'upper_bound': float(upper_bound)
-            }
-            
-            # Skewness and kurtosis
-            results[col]['skewness'] = float(stats.skew(col_data))
-            results[col]['kurtosis'] = float(stats.kurtosis(col_data))
+        summaries = {col: self.numeric_sketches[col].summary(HISTOGRAM_BINS, MAX_FLIERS)
+                     if col in self.numeric_sketches
+                     else computed[col] for col in selected}
         
-        return results
+        return {col: summary for col, summary in summaries.items() if summary is not None}
     
     def _analyze_relationships(self) -> Dict[str, Any]:
         """Analyze relationships between columns."""
@@ -186,31 +306,45 @@ class DataAnalyzer:
         
         # Correlation matrix for numeric columns
         if len(numeric_cols) >= 2:
-            corr_matrix = self.df[numeric_cols].corr()
+            with span('correlation_matrix', 'step', rows=int(self.df.shape[0]), columns=len(numeric_cols)):
+                self.correlation_matrix = correlation_matrix(self.df, numeric_cols)
+            self.correlation_columns = numeric_cols
             
-            # Find strong correlations (|r| > 0.5)
-            strong_correlations = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.5 and not np.isnan(corr_val):
-                        strong_correlations.append({
-                            'column1': corr_matrix.columns[i],
-                            'column2': corr_matrix.columns[j],
-                            'correlation': round(float(corr_val), 3)
-                        })
+            results['correlations'] = {}
             
-            results['correlations'] = {
-                'matrix': corr_matrix.round(3).to_dict(),
-                'strong_correlations': sorted(
-                    strong_correlations,
-                    key=lambda x: abs(x['correlation']),
-                    reverse=True
-                )[:10]  # Top 10
-            }
+            # Wide matrices go to a binary sidecar (save_correlation_matrix) instead of the JSON
+            if len(numeric_cols) <= self.inline_matrix_limit:
+                matrix = pd.DataFrame(self.correlation_matrix, index=numeric_cols, columns=numeric_cols)
+                results['correlations']['matrix'] = matrix.round(3).to_dict()
+            
+            # Find strong correlations (|r| > 0.5) straight from the upper triangle
+            results['correlations']['strong_correlations'] = top_correlations(
+                self.correlation_matrix, numeric_cols, threshold=0.5, k=10  # Top 10
+            )
         
         return results
     
+    def save_correlation_matrix(self, path: str, force: bool = False) -> Optional[str]:
+        """
+        Save the full correlation matrix as a compact .npz sidecar.
+        
+        Args:
+            path: Output path
+            force: Also save matrices small enough to be inlined in the results
+        
+        Returns:
+            Path of the sidecar, or None if there was nothing to save
+        """
+        if self.correlation_matrix is None:
+            return None
+        if not force and len(self.correlation_columns) <= self.inline_matrix_limit:
+            return None
+        
+        saved = save_matrix(path, self.correlation_matrix, self.correlation_columns)
+        if 'correlations' in self.results.get('relationships', {}):
+            self.results['relationships']['correlations']['matrix_file'] = saved
+        return saved
+    
     def get_facts_for_llm(self) -> str:
         """
         Format analysis results as facts for LLM insight generation.
@@ -219,61 +353,91 @@ class DataAnalyzer:
         Returns:
             Formatted string of verified facts
         """
-        facts = []
-        
-        # Overview facts
-        facts.append(f"Dataset has {format_number(self.results['overview']['total_rows'])} rows and {self.results['overview']['total_columns']} columns")
-        facts.append(f"Total of {format_number(self.results['overview']['total_cells'])} cells")
-        
-        if self.results['overview']['duplicate_rows'] > 0:
-            facts.append(f"Found {format_number(self.results['overview']['duplicate_rows'])} duplicate rows")
-        
-        # Data quality facts
-        quality = self.results['data_quality']
-        
-        if quality['high_missing_columns']:
-            for item in quality['high_missing_columns'][:3]:
-                facts.append(f"Column '{item['column']}' has {item['missing_pct']}% missing values")
-        
-        if quality['constant_columns']:
-            facts.append(f"Constant columns (single value): {', '.join(quality['constant_columns'][:5])}")
-        
-        # Categorical facts
-        for col, info in list(self.results['categorical_analysis'].items())[:3]:
-            facts.append(f"Column '{col}' has {format_number(info['unique_values'])} unique values")
-            if info['most_frequent']['value']:
-                facts.append(
-                    f"Most frequent value in '{col}': '{info['most_frequent']['value']}' "
-                    f"({info['most_frequent']['percentage']}%)"
-                )
-        
-        # Numeric facts
-        for col, info in list(self.results['numeric_analysis'].items())[:5]:
+        return format_facts(self.results)
+
+
+def format_facts(results: Dict[str, Any]) -> str:
+    """
+    Format analysis results as facts for LLM insight generation.
+    
+    Module-level so results read back from analysis_results_<dataset>.json
+    can be turned into facts without re-running the analysis.
+    
+    Args:
+        results: Output of DataAnalyzer.analyze_all()
+    
+    Returns:
+        Formatted string of verified facts
+    """
+    facts = []
+    
+    # Overview facts
+    facts.append(f"Dataset has {format_number(results['overview']['total_rows'])} rows and {results['overview']['total_columns']} columns")
+    facts.append(f"Total of {format_number(results['overview']['total_cells'])} cells")
+    if 'sample_rows' in results['overview']:
+        sampled = [section.replace('_', ' ') for section in results['overview'].get('sampled_sections', [])]
+        facts.append(f"Row, missing and duplicate counts cover the whole file; "
+                     f"{' and '.join(filter(None, [', '.join(sampled[:-1]), sampled[-1]]))} "
+                     f"use a uniform sample of {format_number(results['overview']['sample_rows'])} rows")
+    
+    if results['overview']['duplicate_rows'] > 0:
+        facts.append(f"Found {format_number(results['overview']['duplicate_rows'])} duplicate rows")
+    
+    duplicates = results['overview'].get('duplicates', {})
+    if duplicates.get('near_duplicate_rows', 0) > 0:
+        facts.append(
+            f"Found {format_number(duplicates['near_duplicate_rows'])} near-duplicate rows "
+            f"(same {', '.join(duplicates['subset'])} but different other values)"
+        )
+    
+    # Data quality facts
+    quality = results['data_quality']
+    
+    if quality['high_missing_columns']:
+        for item in quality['high_missing_columns'][:3]:
+            facts.append(f"Column '{item['column']}' has {item['missing_pct']}% missing values")
+    
+    if quality['constant_columns']:
+        facts.append(f"Constant columns (single value): {', '.join(quality['constant_columns'][:5])}")
+    
+    # Categorical facts
+    for col, info in list(results['categorical_analysis'].items())[:3]:
+        facts.append(f"Column '{col}' has {format_number(info['unique_values'])} unique values")
+        if info['most_frequent']['value']:
             facts.append(
-                f"Column '{col}': mean={format_number(info['mean'])}, "
-                f"median={format_number(info['median'])}, "
-                f"std={format_number(info['std'])}"
+                f"Most frequent value in '{col}': '{info['most_frequent']['value']}' "
+                f"({info['most_frequent']['percentage']}%)"
             )
-            
-            if info['outliers']['count'] > 0:
-                facts.append(
-                    f"Column '{col}' has {format_number(info['outliers']['count'])} outliers "
-                    f"({info['outliers']['percentage']}% of data)"
-                )
-        
-        # Correlation facts
-        if 'correlations' in self.results['relationships']:
-            for corr in self.results['relationships']['correlations']['strong_correlations'][:5]:
-                facts.append(
-                    f"Strong correlation between '{corr['column1']}' and '{corr['column2']}': "
-                    f"r={corr['correlation']}"
-                )
+    
+    # Numeric facts
+    for col, info in list(results['numeric_analysis'].items())[:5]:
+        facts.append(
+            f"Column '{col}': mean={format_number(info['mean'])}, "
+            f"median={format_number(info['median'])}, "
+            f"std={format_number(info['std'])}"
+        )
         
-        return "\n".join(f"- {fact}" for fact in facts)
+        if info['outliers']['count'] > 0:
+            facts.append(
+                f"Column '{col}' has {format_number(info['outliers']['count'])} outliers "
+                f"({info['outliers']['percentage']}% of data)"
+            )
+    
+    # Correlation facts
+    if 'correlations' in results['relationships']:
+        for corr in results['relationships']['correlations']['strong_correlations'][:5]:
+            facts.append(
+                f"Strong correlation between '{corr['column1']}' and '{corr['column2']}': "
+                f"r={corr['correlation']}"
+            )
+    
+    return "\n".join(f"- {fact}" for fact in facts)
 
 
 # Test
 if __name__ == "__main__":
+    import json
+    
     # Create sample data
     df = pd.DataFrame({
         'age': np.random.randint(18, 80, 1000),
@@ -287,3 +451,29 @@ if __name__ == "__main__":
     
     print("\n📊 Analysis Results:")
     print(json.dumps(results, indent=2, default=str))
+    
+    # Streaming: counts must cover the whole file, not the in-memory sample
+    import os
+    import tempfile
+    from data_loader import DataLoader
+    
+    df.loc[df.sample(50, random_state=0).index, 'income'] = np.nan
+    df = pd.concat([df] * 5, ignore_index=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'streamed.csv')
+        df.to_csv(csv_path, index=False)
+        loader = DataLoader(csv_path, chunksize=700, sample_rows=1000)
+        sample = loader.load_csv()
+        streamed = DataAnalyzer(sample, profile=loader.streamed_profile,
+                                duplicates=loader.duplicates).analyze_all()
+        full = pd.read_csv(csv_path)
+    
+    assert len(sample) < len(full)
+    assert streamed['overview']['total_rows'] == len(full)
+    assert streamed['overview']['sample_rows'] == len(sample)
+    assert streamed['overview']['duplicate_rows'] == int(full.duplicated().sum())
+    for col, missing in full.isna().sum().items():
+        assert streamed['data_quality']['missing_by_column'][col]['count'] == missing, col
+    print(f"\n✅ Streamed overview matches pandas: {len(full):,} rows, "
+          f"{int(full.isna().sum().sum())} missing cells (sample of {len(sample):,} rows)")
+
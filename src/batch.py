@@ -0,0 +1,270 @@
+"""
+Batch Module
+Analyzes many CSV files (a directory, glob or manifest) on one pool of
+worker processes that each import the analysis stack and create their LLM
+client once, then writes a combined index of the per-dataset reports
+"""
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from main import AutoGenEDA, add_analysis_arguments, analysis_options
+from llm_client import LLMClient
+from report_builder import ReportBuilder
+from utils import sanitize_filename, create_output_dir
+
+MANIFEST_EXTENSIONS = ('.txt', '.json')
+
+# LLM client of the current worker process, created once by _init_worker
+_WORKER_LLM: Optional[LLMClient] = None
+
+
+def _read_manifest(path: str) -> List[Dict[str, Optional[str]]]:
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    def resolve(entry: Optional[str]) -> Optional[str]:
+        return os.path.join(base_dir, entry) if entry else None
+
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.json'):
+            items = json.load(f)
+        else:
+            items = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+    inputs = []
+    for item in items:
+        if isinstance(item, str):
+            item = {'csv': item}
+        inputs.append({'csv': resolve(item['csv']), 'schema': resolve(item.get('schema'))})
+    return inputs
+
+
+def collect_inputs(source: str) -> List[Dict[str, Optional[str]]]:
+    """
+    Expand a batch source into the CSV files to analyze.
+
+    Args:
+        source: Directory (every *.csv in it), glob pattern, single CSV, or
+            manifest: a .txt file with one CSV path per line or a .json list
+            of paths or of {"csv": ..., "schema": ...} objects; relative
+            manifest paths are resolved against the manifest's directory
+
+    Returns:
+        List of {'csv': path, 'schema': path or None}, in source order
+    """
+    if os.path.isdir(source):
+        paths = sorted(glob.glob(os.path.join(source, '*.csv')))
+    elif os.path.isfile(source) and source.endswith(MANIFEST_EXTENSIONS):
+        return _read_manifest(source)
+    elif os.path.isfile(source):
+        paths = [source]
+    else:
+        paths = sorted(glob.glob(source, recursive=True))
+
+    return [{'csv': path, 'schema': None} for path in paths]
+
+
+def _assign_names(inputs: List[Dict[str, Optional[str]]], output_dir: str) -> List[Dict[str, Any]]:
+    """Give each dataset a unique name and its own output subdirectory."""
+    jobs = []
+    seen: Dict[str, int] = {}
+    for item in inputs:
+        name = sanitize_filename(os.path.splitext(os.path.basename(item['csv']))[0])
+        seen[name] = seen.get(name, 0) + 1
+        if seen[name] > 1:
+            name = f"{name}_{seen[name]}"
+        jobs.append({**item, 'name': name, 'output_dir': os.path.join(output_dir, name)})
+    return jobs
+
+
+def _file_size(path: str) -> int:
+    """Size of a file for ordering; missing or unreadable files count as empty (their job reports the error)."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _init_worker(llm_cache_dir: Optional[str], log_dir: str):
+    """Create the worker's LLM client; every dataset the worker runs reuses it."""
+    global _WORKER_LLM
+    try:
+        # One prompt log per worker, so concurrent appends never interleave
+        _WORKER_LLM = LLMClient(log_file=os.path.join(log_dir, f"genai_log_{os.getpid()}.md"),
+                                cache_dir=llm_cache_dir)
+    except Exception:
+        # Each dataset then reports the error when creating its own client
+        _WORKER_LLM = None
+
+
+def _run_dataset(job: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker side: analyze one dataset, with its console output sent to a log file."""
+    os.makedirs(job['output_dir'], exist_ok=True)
+    entry = {
+        'dataset': job['name'],
+        'csv': job['csv'],
+        'output_dir': job['output_dir'],
+        'log': os.path.join(job['output_dir'], 'run.log')
+    }
+
+    start = time.perf_counter()
+    with open(entry['log'], 'w', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            # Plots render in this process: the worker is already isolated
+            eda = AutoGenEDA(job['csv'], job['schema'], job['output_dir'],
+                             llm_client=_WORKER_LLM, raise_on_error=True,
+                             plot_process=False, **options)
+            result = eda.run()
+            entry.update({
+                'status': 'ok',
+                'rows': result['shape']['rows'],
+                'columns': result['shape']['columns'],
+                'plots': len(result['plots']),
+                'insights': result['insight_count'],
+                'reports': result['reports']
+            })
+        except Exception as e:
+            entry.update({'status': 'failed', 'error': f"{type(e).__name__}: {e}"})
+    entry['duration_s'] = round(time.perf_counter() - start, 2)
+    return entry
+
+
+def run_batch(source: str, output_dir: str = "output", jobs: int = 0,
+              options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Analyze every dataset of a batch source on a shared process pool.
+
+    Each worker imports the libraries and creates its LLM client once and
+    then runs datasets one after another; all workers share the on-disk LLM
+    response cache. Larger files are started first so a big file picked up
+    last does not hold up the end of the batch.
+
+    Args:
+        source: Directory, glob pattern or manifest (see collect_inputs)
+        output_dir: Directory for the index; each dataset gets a subdirectory
+        jobs: Worker processes (0 = all cores)
+        options: AutoGenEDA keyword arguments applied to every dataset
+
+    Returns:
+        Dictionary with the index paths and succeeded/failed counts
+    """
+    options = dict(options or {})
+    inputs = collect_inputs(source)
+    if not inputs:
+        raise ValueError(f"No CSV files found for: {source}")
+
+    create_output_dir(output_dir)
+    log_dir = os.path.join(output_dir, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    batch_jobs = _assign_names(inputs, output_dir)
+    n_workers = min(jobs if jobs > 0 else (os.cpu_count() or 1), len(batch_jobs))
+
+    print("\n" + "="*80)
+    print(f"🗂️  AutoGen-EDA batch: {len(batch_jobs)} datasets on {n_workers} workers")
+    print("="*80)
+
+    order = sorted(range(len(batch_jobs)), key=lambda i: -_file_size(batch_jobs[i]['csv']))
+    entries: List[Optional[Dict[str, Any]]] = [None] * len(batch_jobs)
+    start = time.perf_counter()
+
+    # Spawned, not forked, like the pipeline's process stages
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker,
+                             initargs=(options.get('llm_cache_dir'), log_dir)) as executor:
+        futures = {executor.submit(_run_dataset, batch_jobs[i], options): i for i in order}
+        for n_done, future in enumerate(as_completed(futures), 1):
+            job = batch_jobs[futures[future]]
+            try:
+                entry = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed for running out of memory)
+                entry = {'dataset': job['name'], 'csv': job['csv'], 'output_dir': job['output_dir'],
+                         'status': 'failed', 'error': f"{type(e).__name__}: {e}", 'duration_s': 0.0}
+            entries[futures[future]] = entry
+
+            if entry['status'] == 'ok':
+                print(f"   ✅ [{n_done}/{len(batch_jobs)}] {entry['dataset']} ({entry['duration_s']:.1f}s)")
+            else:
+                print(f"   ❌ [{n_done}/{len(batch_jobs)}] {entry['dataset']}: {entry['error']} "
+                      f"(see {entry.get('log', 'worker output')})")
+
+    n_failed = sum(1 for entry in entries if entry['status'] != 'ok')
+    index_json = os.path.join(output_dir, "index.json")
+    with open(index_json, 'w') as f:
+        json.dump({
+            'source': source,
+            'total_s': round(time.perf_counter() - start, 2),
+            'succeeded': len(entries) - n_failed,
+            'failed': n_failed,
+            'datasets': entries
+        }, f, indent=2)
+
+    print("\n📄 Building batch index...")
+    index_html = ReportBuilder(output_dir).build_index(entries)
+    print(f"   ✅ Batch summary: {index_json}")
+    print(f"\n⏱️  {len(entries)} datasets in {time.perf_counter() - start:.1f}s "
+          f"({len(entries) - n_failed} succeeded, {n_failed} failed)\n")
+
+    return {
+        'index': index_html,
+        'index_json': index_json,
+        'succeeded': len(entries) - n_failed,
+        'failed': n_failed
+    }
+
+
+def main():
+    """Batch entry point with CLI argument parsing."""
+    parser = argparse.ArgumentParser(
+        description='AutoGen-EDA batch mode: analyze many CSV files on a shared worker pool',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python src/batch.py data/nightly/
+  python src/batch.py "data/nightly/*.csv" --jobs 8 --output output/nightly
+  python src/batch.py data/manifest.json --streaming --resume
+        """
+    )
+
+    parser.add_argument(
+        'source',
+        help='Directory of CSV files, glob pattern, or manifest (.txt/.json)'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        help='Output directory; each dataset gets a subdirectory (default: output/)',
+        default='output'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        help='Datasets analyzed at once, one worker process each (default: 0 = all cores)',
+        default=0
+    )
+
+    add_analysis_arguments(parser)
+
+    args = parser.parse_args()
+
+    try:
+        summary = run_batch(args.source, args.output, jobs=args.jobs, options=analysis_options(args))
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
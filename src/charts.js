@@ -0,0 +1,283 @@
+/*
+ * Chart renderer for AutoGen-EDA HTML reports.
+ * Draws the pre-aggregated chart data written by DataVisualizer in
+ * interactive mode (bin counts, top-k counts, box statistics, scatter
+ * points or density grids, correlation matrices) as inline SVG, with small
+ * controls for bin width, category count and scales.
+ */
+(function () {
+  'use strict';
+
+  var SVG_NS = 'http://www.w3.org/2000/svg';
+  var WIDTH = 760, HEIGHT = 420;
+  var MARGIN = {top: 20, right: 30, bottom: 60, left: 80};
+  var COLORS = {bar: '#87ceeb', bars: '#4682b4', box: '#add8e6', mean: '#d62728',
+                median: '#2ca02c', line: '#d62728', grid: '#e6e6e6'};
+
+  function el(name, attrs, parent, text) {
+    var node = document.createElementNS(SVG_NS, name);
+    Object.keys(attrs || {}).forEach(function (key) { node.setAttribute(key, attrs[key]); });
+    if (text !== undefined) { node.textContent = text; }
+    if (parent) { parent.appendChild(node); }
+    return node;
+  }
+
+  function tooltip(node, text) { el('title', {}, node, text); }
+
+  function fmt(value) {
+    if (value === null || value === undefined) { return 'n/a'; }
+    var abs = Math.abs(value);
+    if (abs !== 0 && (abs >= 1e6 || abs < 1e-3)) { return value.toExponential(2); }
+    return Number(value.toPrecision(4)).toLocaleString();
+  }
+
+  function scale(d0, d1, r0, r1) {
+    return function (v) { return d1 === d0 ? (r0 + r1) / 2 : r0 + (v - d0) * (r1 - r0) / (d1 - d0); };
+  }
+
+  function ticks(lo, hi, count) {
+    if (!(hi > lo)) { return [lo]; }
+    var step = Math.pow(10, Math.floor(Math.log10((hi - lo) / count)));
+    var err = (hi - lo) / count / step;
+    step *= err >= 7.5 ? 10 : err >= 3.5 ? 5 : err >= 1.5 ? 2 : 1;
+    var out = [];
+    for (var t = Math.ceil(lo / step) * step; t <= hi + step * 1e-9; t += step) { out.push(t); }
+    return out;
+  }
+
+  function extent(values) {
+    var lo = Infinity, hi = -Infinity;
+    values.forEach(function (v) { if (v !== null) { lo = Math.min(lo, v); hi = Math.max(hi, v); } });
+    return [lo, hi];
+  }
+
+  // Plot area with numeric axes; a null domain leaves that axis to the caller
+  function frame(svg, xDomain, yDomain, xLabel, yLabel) {
+    var x0 = MARGIN.left, x1 = WIDTH - MARGIN.right, y0 = HEIGHT - MARGIN.bottom, y1 = MARGIN.top;
+    var axes = {x: xDomain && scale(xDomain[0], xDomain[1], x0, x1),
+                y: yDomain && scale(yDomain[0], yDomain[1], y0, y1)};
+    if (axes.x) {
+      ticks(xDomain[0], xDomain[1], 8).forEach(function (t) {
+        el('line', {x1: axes.x(t), x2: axes.x(t), y1: y0, y2: y1, stroke: COLORS.grid}, svg);
+        el('text', {x: axes.x(t), y: y0 + 18, 'text-anchor': 'middle'}, svg, fmt(t));
+      });
+    }
+    if (axes.y) {
+      ticks(yDomain[0], yDomain[1], 6).forEach(function (t) {
+        el('line', {x1: x0, x2: x1, y1: axes.y(t), y2: axes.y(t), stroke: COLORS.grid}, svg);
+        el('text', {x: x0 - 8, y: axes.y(t) + 4, 'text-anchor': 'end'}, svg, fmt(t));
+      });
+    }
+    el('rect', {x: x0, y: y1, width: x1 - x0, height: y0 - y1, fill: 'none', stroke: '#999'}, svg);
+    el('text', {x: (x0 + x1) / 2, y: HEIGHT - 15, 'text-anchor': 'middle', 'font-weight': 'bold'}, svg, xLabel);
+    el('text', {x: 0, y: 0, transform: 'translate(18,' + (y0 + y1) / 2 + ') rotate(-90)',
+                'text-anchor': 'middle', 'font-weight': 'bold'}, svg, yLabel);
+    axes.box = {x0: x0, x1: x1, y0: y0, y1: y1};
+    return axes;
+  }
+
+  function control(bar, label, input, onChange) {
+    var wrap = document.createElement('label');
+    wrap.textContent = label + ' ';
+    wrap.appendChild(input);
+    input.addEventListener('change', onChange);
+    bar.appendChild(wrap);
+    return input;
+  }
+
+  function select(options, selected) {
+    var node = document.createElement('select');
+    options.forEach(function (option) {
+      var item = document.createElement('option');
+      item.value = option[0];
+      item.textContent = option[1];
+      item.selected = String(option[0]) === String(selected);
+      node.appendChild(item);
+    });
+    return node;
+  }
+
+  function checkbox(checked) {
+    var node = document.createElement('input');
+    node.type = 'checkbox';
+    node.checked = checked;
+    return node;
+  }
+
+  function histogram(chart, svg, bar) {
+    var data = chart.data, n = data.counts.length;
+    var factors = [];
+    for (var f = 1; n / f >= 3; f++) { if (n % f === 0) { factors.push([f, n / f + ' bins']); } }
+    var merge = control(bar, 'Bins', select(factors, 1), draw);
+
+    function draw() {
+      svg.textContent = '';
+      var k = Number(merge.value), counts = [], edges = [];
+      for (var i = 0; i < n; i += k) {
+        counts.push(data.counts.slice(i, i + k).reduce(function (a, b) { return a + b; }, 0));
+        edges.push(data.edges[i]);
+      }
+      edges.push(data.edges[n]);
+      var axes = frame(svg, [edges[0], edges[edges.length - 1]], [0, Math.max.apply(null, counts) * 1.05],
+                       chart.columns[0], 'Frequency');
+      counts.forEach(function (count, j) {
+        var rect = el('rect', {x: axes.x(edges[j]), y: axes.y(count), width: axes.x(edges[j + 1]) - axes.x(edges[j]),
+                               height: axes.y(0) - axes.y(count), fill: COLORS.bar, stroke: '#333'}, svg);
+        tooltip(rect, fmt(edges[j]) + ' to ' + fmt(edges[j + 1]) + ': ' + count.toLocaleString());
+      });
+      [['mean', 'Mean'], ['median', 'Median']].forEach(function (stat) {
+        var x = axes.x(data[stat[0]]);
+        el('line', {x1: x, x2: x, y1: axes.box.y0, y2: axes.box.y1, stroke: COLORS[stat[0]],
+                    'stroke-dasharray': '6,4', 'stroke-width': 2}, svg);
+        el('text', {x: x + 4, y: axes.box.y1 + (stat[0] === 'mean' ? 14 : 30), fill: COLORS[stat[0]]},
+           svg, stat[1] + ': ' + fmt(data[stat[0]]));
+      });
+    }
+    draw();
+  }
+
+  function boxplot(chart, svg, bar) {
+    var data = chart.data;
+    var showFliers = control(bar, 'Outliers', checkbox(true), draw);
+
+    function draw() {
+      svg.textContent = '';
+      var values = [data.whislo, data.whishi, data.q1, data.q3].concat(showFliers.checked ? data.fliers : []);
+      var range = extent(values), pad = (range[1] - range[0]) * 0.05 || 1;
+      var axes = frame(svg, null, [range[0] - pad, range[1] + pad], '', chart.columns[0]);
+      var cx = (axes.box.x0 + axes.box.x1) / 2, half = 60;
+      el('line', {x1: cx, x2: cx, y1: axes.y(data.whislo), y2: axes.y(data.q1), stroke: '#333'}, svg);
+      el('line', {x1: cx, x2: cx, y1: axes.y(data.q3), y2: axes.y(data.whishi), stroke: '#333'}, svg);
+      [data.whislo, data.whishi].forEach(function (v) {
+        el('line', {x1: cx - half / 2, x2: cx + half / 2, y1: axes.y(v), y2: axes.y(v), stroke: '#333'}, svg);
+      });
+      var box = el('rect', {x: cx - half, y: axes.y(data.q3), width: 2 * half, height: axes.y(data.q1) - axes.y(data.q3),
+                            fill: COLORS.box, 'fill-opacity': 0.7, stroke: '#333'}, svg);
+      tooltip(box, 'Q1 ' + fmt(data.q1) + ', median ' + fmt(data.med) + ', Q3 ' + fmt(data.q3) +
+              '; whiskers ' + fmt(data.whislo) + ' to ' + fmt(data.whishi));
+      el('line', {x1: cx - half, x2: cx + half, y1: axes.y(data.med), y2: axes.y(data.med),
+                  stroke: 'red', 'stroke-width': 2}, svg);
+      if (showFliers.checked) {
+        data.fliers.forEach(function (v) {
+          tooltip(el('circle', {cx: cx, cy: axes.y(v), r: 4, fill: 'none', stroke: '#333'}, svg), fmt(v));
+        });
+      }
+    }
+    draw();
+  }
+
+  function barChart(chart, svg, bar) {
+    var data = chart.data, total = data.labels.length;
+    var sizes = [5, 10, 20].filter(function (k) { return k < total; }).concat([total]);
+    var topN = control(bar, 'Show top', select(sizes.map(function (k) { return [k, k]; }), total), draw);
+    var order = control(bar, 'Sort by', select([['count', 'count'], ['label', 'label']], 'count'), draw);
+
+    function draw() {
+      svg.textContent = '';
+      var items = data.labels.map(function (label, i) { return {label: label, count: data.counts[i]}; })
+        .slice(0, Number(topN.value));
+      if (order.value === 'label') { items.sort(function (a, b) { return a.label.localeCompare(b.label); }); }
+      var horizontal = items.length > 10, max = Math.max.apply(null, items.map(function (d) { return d.count; }));
+      var axes = horizontal ? frame(svg, [0, max * 1.05], null, 'Count', chart.columns[0])
+                            : frame(svg, null, [0, max * 1.05], chart.columns[0], 'Count');
+      var box = axes.box, span = horizontal ? box.y0 - box.y1 : box.x1 - box.x0, slot = span / items.length;
+      items.forEach(function (d, i) {
+        var rect;
+        if (horizontal) {
+          var y = box.y1 + i * slot + slot * 0.25;
+          rect = el('rect', {x: box.x0, y: y, width: axes.x(d.count) - box.x0, height: slot * 0.5, fill: COLORS.bars}, svg);
+          el('text', {x: box.x0 - 6, y: y + slot * 0.25 + 4, 'text-anchor': 'end'}, svg, d.label);
+        } else {
+          var x = box.x0 + i * slot + slot * 0.25;
+          rect = el('rect', {x: x, y: axes.y(d.count), width: slot * 0.5, height: box.y0 - axes.y(d.count),
+                             fill: COLORS.bars}, svg);
+          el('text', {x: x + slot * 0.25, y: box.y0 + 16, 'text-anchor': 'middle'}, svg, d.label);
+        }
+        tooltip(rect, d.label + ': ' + d.count.toLocaleString());
+      });
+    }
+    draw();
+  }
+
+  function scatter(chart, svg, bar) {
+    var data = chart.data, logScale = data.grid ? control(bar, 'Log color scale', checkbox(true), draw) : null;
+
+    function draw() {
+      svg.textContent = '';
+      var xs = data.grid ? data.x_edges : data.x, ys = data.grid ? data.y_edges : data.y;
+      var axes = frame(svg, extent(xs), extent(ys), chart.columns[0], chart.columns[1]);
+      if (data.grid) {
+        var max = 0;
+        data.grid.forEach(function (row) { row.forEach(function (c) { max = Math.max(max, c); }); });
+        data.grid.forEach(function (row, i) {
+          row.forEach(function (count, j) {
+            if (!count) { return; }
+            var shade = logScale.checked ? Math.log(1 + count) / Math.log(1 + max) : count / max;
+            var rect = el('rect', {x: axes.x(data.x_edges[i]), y: axes.y(data.y_edges[j + 1]),
+                                   width: axes.x(data.x_edges[i + 1]) - axes.x(data.x_edges[i]),
+                                   height: axes.y(data.y_edges[j]) - axes.y(data.y_edges[j + 1]),
+                                   fill: COLORS.bars, 'fill-opacity': 0.1 + 0.9 * shade}, svg);
+            tooltip(rect, count.toLocaleString() + ' rows');
+          });
+        });
+        el('text', {x: axes.box.x1, y: axes.box.y1 - 6, 'text-anchor': 'end'}, svg,
+           data.points.toLocaleString() + ' rows, binned');
+      } else {
+        data.x.forEach(function (x, i) {
+          el('circle', {cx: axes.x(x), cy: axes.y(data.y[i]), r: 3, fill: COLORS.bars, 'fill-opacity': 0.5}, svg);
+        });
+      }
+      if (data.line) {
+        el('line', {x1: axes.x(data.line.line_x[0]), y1: axes.y(data.line.line_y[0]),
+                    x2: axes.x(data.line.line_x[1]), y2: axes.y(data.line.line_y[1]),
+                    stroke: COLORS.line, 'stroke-width': 2, 'stroke-dasharray': '6,4'}, svg);
+      }
+    }
+    draw();
+  }
+
+  function heatmapColor(r) {
+    // Diverging blue-white-red, like the coolwarm colormap of the PNG heatmap
+    var lo = [59, 76, 192], mid = [247, 247, 247], hi = [180, 4, 38];
+    var t = Math.max(-1, Math.min(1, r)), to = t < 0 ? lo : hi;
+    return 'rgb(' + mid.map(function (c, i) { return Math.round(c + (to[i] - c) * Math.abs(t)); }).join(',') + ')';
+  }
+
+  function heatmap(chart, svg) {
+    var labels = chart.data.labels, n = labels.length;
+    var size = Math.min((WIDTH - 200) / n, (HEIGHT - 120) / n), x0 = 160, y0 = 10;
+    svg.setAttribute('viewBox', '0 0 ' + WIDTH + ' ' + Math.max(HEIGHT, y0 + n * size + 120));
+    chart.data.matrix.forEach(function (row, i) {
+      row.forEach(function (r, j) {
+        if (j >= i) { return; }
+        var rect = el('rect', {x: x0 + j * size, y: y0 + i * size, width: size, height: size, stroke: 'white',
+                               fill: r === null ? '#ddd' : heatmapColor(r)}, svg);
+        tooltip(rect, labels[i] + ' / ' + labels[j] + ': ' + (r === null ? 'n/a' : r.toFixed(3)));
+        if (size >= 28 && r !== null) {
+          el('text', {x: x0 + (j + 0.5) * size, y: y0 + (i + 0.5) * size + 4, 'text-anchor': 'middle',
+                      fill: Math.abs(r) > 0.6 ? 'white' : '#222'}, svg, r.toFixed(2));
+        }
+      });
+      el('text', {x: x0 - 6, y: y0 + (i + 0.5) * size + 4, 'text-anchor': 'end'}, svg, labels[i]);
+      el('text', {x: 0, y: 0, 'text-anchor': 'end',
+                  transform: 'translate(' + (x0 + (i + 0.5) * size) + ',' + (y0 + n * size + 8) + ') rotate(-45)'},
+         svg, labels[i]);
+    });
+  }
+
+  var RENDERERS = {histogram: histogram, boxplot: boxplot, bar: barChart, scatter: scatter,
+                   correlation_heatmap: heatmap};
+
+  var charts = JSON.parse(document.getElementById('eda-chart-data').textContent);
+  charts.forEach(function (chart, i) {
+    var box = document.querySelector('[data-chart="' + i + '"]');
+    var render = RENDERERS[chart.type];
+    if (!box || !render) { return; }
+    var bar = document.createElement('div');
+    bar.className = 'chart-controls';
+    var svg = el('svg', {viewBox: '0 0 ' + WIDTH + ' ' + HEIGHT, 'font-size': 12, 'font-family': 'sans-serif'});
+    box.appendChild(bar);
+    box.appendChild(svg);
+    render(chart, svg, bar);
+  });
+})();
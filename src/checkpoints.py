@@ -0,0 +1,142 @@
+"""
+Checkpoints Module
+Records which inputs each pipeline stage's output file was produced from,
+so a resumed run can read unchanged outputs back instead of recomputing them
+"""
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def stable_hash(value: Any) -> str:
+    """Hex digest of a JSON-serializable value, independent of dict ordering."""
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class Checkpoint:
+    """Output file of one stage and how its result is written to and read from it"""
+
+    def __init__(self, path: str, label: str, fmt: str = 'json',
+                 validate: Optional[Callable[[Any], bool]] = None):
+        """
+        Initialize checkpoint.
+
+        Args:
+            path: File the stage result is saved to
+            label: Name used in progress messages (e.g. 'EDA plan')
+            fmt: 'json' or 'text'
+            validate: Optional check a saved result must pass to be reused,
+                e.g. that the files it refers to still exist
+        """
+        if fmt not in ('json', 'text'):
+            raise ValueError(f"Unknown checkpoint format: {fmt}")
+        self.path = str(path)
+        self.label = label
+        self.fmt = fmt
+        self.validate = validate
+
+    def dumps(self, value: Any) -> bytes:
+        if self.fmt == 'json':
+            return json.dumps(value, indent=2, default=str).encode('utf-8')
+        return str(value).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        if self.fmt == 'json':
+            return json.loads(data.decode('utf-8'))
+        return data.decode('utf-8')
+
+
+class CheckpointStore:
+    """Manifest of saved stage outputs, keyed by a hash of each stage's inputs and config"""
+
+    VERSION = 1
+
+    def __init__(self, manifest_path: str):
+        """
+        Initialize checkpoint store.
+
+        Args:
+            manifest_path: JSON file recording the key and content digest of
+                every saved stage output
+        """
+        self.manifest_path = str(manifest_path)
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get('version') == self.VERSION:
+                self._stages = manifest.get('stages', {})
+        except (OSError, ValueError):
+            pass
+
+    def restore(self, stage: str, key: str, checkpoint: Checkpoint) -> Optional[Tuple[Any, str]]:
+        """
+        Read back a stage's saved result if it was produced from the same inputs.
+
+        The output file must be unchanged since it was saved and the result
+        must pass the checkpoint's validate check.
+
+        Returns:
+            Tuple of (result, content digest), or None if the stage must run
+        """
+        entry = self._stages.get(stage)
+        if entry is None or entry['key'] != key or entry['file'] != os.path.abspath(checkpoint.path):
+            return None
+
+        try:
+            with open(checkpoint.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if _digest(data) != entry['digest']:
+            return None
+
+        value = checkpoint.loads(data)
+        if checkpoint.validate is not None and not checkpoint.validate(value):
+            return None
+
+        print(f"   ♻️  Reusing {checkpoint.label} from: {checkpoint.path}")
+        return value, entry['digest']
+
+    def save(self, stage: str, key: str, checkpoint: Checkpoint, value: Any) -> Tuple[Any, str]:
+        """
+        Write a stage's result to its output file and record it in the manifest.
+
+        Returns:
+            Tuple of (result as read back from the file, content digest), so
+            downstream stages see the same value whether it was just computed
+            or restored on a later run
+        """
+        data = checkpoint.dumps(value)
+        os.makedirs(os.path.dirname(os.path.abspath(checkpoint.path)), exist_ok=True)
+        with open(checkpoint.path, 'wb') as f:
+            f.write(data)
+        print(f"   💾 Saved {checkpoint.label} to: {checkpoint.path}")
+
+        digest = _digest(data)
+        with self._lock:
+            self._stages[stage] = {
+                'key': key,
+                'file': os.path.abspath(checkpoint.path),
+                'digest': digest,
+                'saved': datetime.now().isoformat(timespec='seconds')
+            }
+            self._write_manifest()
+        return checkpoint.loads(data), digest
+
+    def _write_manifest(self):
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'stages': self._stages}, f, indent=2)
+        # Atomic, so an interrupted run never leaves a half-written manifest
+        os.replace(tmp_path, self.manifest_path)
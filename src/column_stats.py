@@ -0,0 +1,245 @@
+"""
+Column Statistics Module
+Computes per-column statistics once in a vectorized pass over the frame
+and shares them between DataLoader, DataAnalyzer and utils.infer_column_types
+"""
+import pickle
+import hashlib
+import weakref
+import pandas as pd
+import numpy as np
+from typing import Dict, Optional, Tuple
+from parallel import ColumnPool
+from sketches import approx_nunique
+
+# Below this many (estimated) distinct values an exact count is cheap, so it is used instead
+EXACT_DISTINCT_LIMIT = 10000
+
+# Rows at each end of the frame hashed to notice in-place edits
+FINGERPRINT_ROWS = 32
+
+
+def _distinct_count(series: pd.Series, hll_precision: Optional[int] = None) -> Tuple[int, bool]:
+    """
+    Distinct count of one column, approximated with HyperLogLog when requested.
+
+    Returns:
+        Tuple of (distinct count, whether the count is an estimate)
+    """
+    if hll_precision is None:
+        return int(series.nunique()), False
+
+    estimate = approx_nunique(series, hll_precision)
+    if estimate < EXACT_DISTINCT_LIMIT:
+        return int(series.nunique()), False
+    return estimate, True
+
+
+def _fingerprint(df: pd.DataFrame) -> Optional[str]:
+    """Hash of the first and last FINGERPRINT_ROWS rows (None if they cannot be pickled)."""
+    rows = np.unique(np.r_[0:min(FINGERPRINT_ROWS, len(df)), max(len(df) - FINGERPRINT_ROWS, 0):len(df)])
+    try:
+        return hashlib.blake2b(pickle.dumps(df.take(rows), protocol=5), digest_size=16).hexdigest()
+    except Exception:
+        return None
+
+
+def _summarize_column(series: pd.Series, hll_precision: Optional[int] = None) -> Tuple[int, int, bool, float, float]:
+    """Null count, distinct count (and whether estimated), min and max of one column (worker task)."""
+    null_count = int(series.isna().sum())
+    n_unique, is_estimate = _distinct_count(series, hll_precision)
+    if pd.api.types.is_numeric_dtype(series.dtype) and null_count < len(series):
+        return null_count, n_unique, is_estimate, float(series.min()), float(series.max())
+    return null_count, n_unique, is_estimate, np.nan, np.nan
+
+
+class ColumnStats:
+    """Null counts, distinct counts, min/max and dtype class for every column"""
+
+    def __init__(self, df: pd.DataFrame, pool: Optional[ColumnPool] = None,
+                 approx_distinct: bool = False, hll_precision: int = 14):
+        """
+        Compute statistics for all columns.
+
+        Args:
+            df: DataFrame to summarize (not retained)
+            pool: Optional worker pool to shard columns across
+            approx_distinct: Estimate distinct counts of high-cardinality columns
+                with HyperLogLog instead of building full hash sets
+            hll_precision: HyperLogLog precision; relative standard error is
+                1.04 / sqrt(2**hll_precision)
+        """
+        self.n_rows = int(len(df))
+        self.columns = list(df.columns)
+        self.dtypes = df.dtypes
+        self.fingerprint = _fingerprint(df)
+        self.numeric_columns = [col for col in self.columns
+                                if pd.api.types.is_numeric_dtype(self.dtypes[col])]
+
+        self.approx_distinct = approx_distinct
+        self.distinct_error = 1.04 / np.sqrt(2 ** hll_precision) if approx_distinct else 0.0
+        precision = hll_precision if approx_distinct else None
+
+        if pool is not None and pool.parallel:
+            args = {col: (precision,) for col in self.columns}
+            summaries = pool.map_columns(_summarize_column, df, self.columns, args)
+            frame = pd.DataFrame.from_dict(summaries, orient='index',
+                                           columns=['nulls', 'unique', 'estimated', 'min', 'max'])
+            self.null_counts = frame['nulls']
+            self.unique_counts = frame['unique']
+            self.estimated_columns = set(frame.index[frame['estimated'].astype(bool)])
+            self.min = frame.loc[self.numeric_columns, 'min']
+            self.max = frame.loc[self.numeric_columns, 'max']
+        else:
+            # One pass each over the whole frame instead of per-column loops
+            self.null_counts = df.isna().sum()
+            if approx_distinct:
+                counts = {col: _distinct_count(df[col], precision) for col in self.columns}
+                self.unique_counts = pd.Series({col: count for col, (count, _) in counts.items()},
+                                               dtype='int64')
+                self.estimated_columns = {col for col, (_, estimated) in counts.items() if estimated}
+            else:
+                self.unique_counts = df.nunique()
+                self.estimated_columns = set()
+            numeric = df[self.numeric_columns]
+            self.min = numeric.min() if self.numeric_columns else pd.Series(dtype=float)
+            self.max = numeric.max() if self.numeric_columns else pd.Series(dtype=float)
+
+        self.non_null_counts = self.n_rows - self.null_counts
+
+        self._column_types: Optional[Dict[str, str]] = None
+
+    def matches(self, df: pd.DataFrame) -> bool:
+        """
+        Cheap check that the frame is still the one these stats were computed for.
+
+        Compares the shape, dtypes and a hash of the first and last
+        FINGERPRINT_ROWS rows. An in-place edit that touches only rows in
+        between (e.g. df.loc[mask, col] = value) is not noticed; call
+        invalidate(df) after such edits.
+        """
+        return (len(df) == self.n_rows and list(df.columns) == self.columns
+                and tuple(df.dtypes) == tuple(self.dtypes)
+                and _fingerprint(df) == self.fingerprint)
+
+    def is_estimated(self, col: str) -> bool:
+        """Whether the distinct count of a column is a HyperLogLog estimate."""
+        return col in self.estimated_columns
+
+    def _all_distinct(self, col: str) -> bool:
+        """Every value distinct, allowing for estimation error (three standard errors)."""
+        if self.is_estimated(col):
+            return self.unique_counts[col] >= self.n_rows * (1 - 3 * self.distinct_error)
+        return self.unique_counts[col] == self.n_rows
+
+    def dtype_class(self, col: str) -> str:
+        """Storage class of a column: numeric, datetime or object."""
+        dtype = self.dtypes[col]
+        if pd.api.types.is_numeric_dtype(dtype):
+            return 'numeric'
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'datetime'
+        return 'object'
+
+    def min_max(self, col: str) -> Tuple[Optional[float], Optional[float]]:
+        """Min and max of a numeric column (None for all-null columns)."""
+        col_min, col_max = self.min.get(col, np.nan), self.max.get(col, np.nan)
+        if pd.isna(col_min):
+            return None, None
+        return float(col_min), float(col_max)
+
+    @property
+    def column_types(self) -> Dict[str, str]:
+        """
+        Semantic types of columns beyond pandas dtypes.
+
+        Returns:
+            Dictionary mapping column names to inferred types
+            (numeric, categorical, datetime, text, id, binary)
+        """
+        if self._column_types is None:
+            self._column_types = {col: self._infer_type(col) for col in self.columns}
+        return self._column_types
+
+    def _infer_type(self, col: str) -> str:
+        n_unique = self.unique_counts[col]
+        n_total = self.n_rows
+        dtype_class = self.dtype_class(col)
+
+        # Numeric
+        if dtype_class == 'numeric':
+            if n_unique == 2:
+                return 'binary'
+            elif self._all_distinct(col) or n_unique > 0.9 * n_total:
+                return 'id'  # Likely an ID column
+            return 'numeric'
+
+        # Datetime
+        if dtype_class == 'datetime':
+            return 'datetime'
+
+        # Object/String
+        if n_unique <= 20 or n_unique < 0.05 * n_total:
+            return 'categorical'
+        elif self._all_distinct(col):
+            return 'id'
+        return 'text'
+
+
+# Stats are keyed by frame identity; the weakref drops the entry when the frame is freed
+_STATS_CACHE: Dict[int, Tuple[weakref.ref, ColumnStats]] = {}
+
+
+def get_column_stats(df: pd.DataFrame, pool: Optional[ColumnPool] = None,
+                     approx_distinct: bool = False) -> ColumnStats:
+    """
+    Get the shared ColumnStats for a frame, computing them on first use.
+
+    The first computation wins: later callers get the cached stats whatever
+    options they pass. Stats are recomputed when the frame's shape, dtypes
+    or first and last rows change; after editing other rows in place (e.g.
+    fillna(inplace=True) on a column whose edge rows have no nulls), call
+    invalidate(df).
+
+    Args:
+        df: DataFrame to summarize
+        pool: Optional worker pool used if the stats need computing
+        approx_distinct: Estimate high-cardinality distinct counts if computing
+
+    Returns:
+        Cached ColumnStats for this frame
+    """
+    key = id(df)
+    entry = _STATS_CACHE.get(key)
+    if entry is not None and entry[0]() is df and entry[1].matches(df):
+        return entry[1]
+
+    stats = ColumnStats(df, pool, approx_distinct)
+    ref = weakref.ref(df, lambda _, key=key: _STATS_CACHE.pop(key, None))
+    _STATS_CACHE[key] = (ref, stats)
+    return stats
+
+
+def invalidate(df: pd.DataFrame):
+    """Drop the cached stats of a frame, e.g. after editing it in place."""
+    entry = _STATS_CACHE.get(id(df))
+    if entry is not None and entry[0]() is df:
+        del _STATS_CACHE[id(df)]
+
+
+if __name__ == "__main__":
+    # Test: in-place edits must not return stale stats
+    df = pd.DataFrame({'a': np.arange(1000, dtype=float), 'b': ['x', 'y'] * 500})
+    assert get_column_stats(df) is get_column_stats(df)
+
+    df.loc[0, 'a'] = np.nan
+    assert get_column_stats(df).null_counts['a'] == 1
+
+    df.loc[500, 'a'] = np.nan
+    assert get_column_stats(df).null_counts['a'] == 1  # middle rows are not hashed
+    invalidate(df)
+    assert get_column_stats(df).null_counts['a'] == 2
+
+    df.fillna({'a': 0.0}, inplace=True)
+    assert get_column_stats(df).null_counts['a'] == 0
+    print("✅ column_stats checks passed")
@@ -0,0 +1,150 @@
+"""
+Correlation Module
+Blocked, NaN-aware Pearson correlation built on matrix products so wide
+numeric tables are correlated by BLAS rather than pairwise Python loops
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional, Tuple
+
+# Values standardized at a time (8 MB of float64 per temporary array)
+CHUNK_CELLS = 1 << 20
+
+
+def correlation_matrix(df: pd.DataFrame, columns: List[str], block_size: int = 512,
+                       chunk_cells: int = CHUNK_CELLS) -> np.ndarray:
+    """
+    Pearson correlation of every pair of columns.
+
+    Matches DataFrame.corr(): each pair uses the rows where both values are
+    present, and constant pairs give NaN. Columns are standardized first so
+    the sums below do not lose precision to large offsets.
+
+    Args:
+        df: Source DataFrame
+        columns: Numeric columns to correlate
+        block_size: Columns per block of the result
+        chunk_cells: Values per standardized row chunk; the per-pair sums are
+            accumulated chunk by chunk, so temporary memory is a few arrays of
+            this many float64 values plus the block_size x block_size sums
+
+    Returns:
+        Symmetric (len(columns) x len(columns)) float64 matrix
+    """
+    n_cols = len(columns)
+    mean = np.empty(n_cols)
+    scale = np.empty(n_cols)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for idx, col in enumerate(columns):
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            present = values[~np.isnan(values)]
+            mean[idx] = present.mean() if len(present) else np.nan
+            scale[idx] = present.std() if len(present) else np.nan
+    scale[~(scale > 0)] = 1.0
+
+    result = np.empty((n_cols, n_cols))
+    for i0 in range(0, n_cols, block_size):
+        i1 = min(i0 + block_size, n_cols)
+        for j0 in range(i0, n_cols, block_size):
+            j1 = min(j0 + block_size, n_cols)
+            block = _correlation_block(df, columns, (i0, i1), (j0, j1), mean, scale, chunk_cells)
+            result[i0:i1, j0:j1] = block
+            result[j0:j1, i0:i1] = block.T
+    return result
+
+
+def _standardized_chunk(df: pd.DataFrame, columns: List[str], rows: Tuple[int, int],
+                        cols: Tuple[int, int], mean: np.ndarray,
+                        scale: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Standardized values of a row/column chunk (missing as 0) and its presence mask."""
+    values = df.iloc[rows[0]:rows[1]][columns[cols[0]:cols[1]]].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = ~np.isnan(values)
+    # A new array: to_numpy may return a read-only view of the frame's data
+    values = (values - mean[cols[0]:cols[1]]) / scale[cols[0]:cols[1]]
+    values[~mask] = 0.0
+    return values, mask.astype(np.float64)
+
+
+def _correlation_block(df: pd.DataFrame, columns: List[str], cols_i: Tuple[int, int],
+                       cols_j: Tuple[int, int], mean: np.ndarray, scale: np.ndarray,
+                       chunk_cells: int) -> np.ndarray:
+    """Correlations between two column blocks over pairwise-complete rows, summed over row chunks."""
+    width = max(cols_i[1] - cols_i[0], cols_j[1] - cols_j[0])
+    chunk_rows = max(1, chunk_cells // width)
+    shape = (cols_i[1] - cols_i[0], cols_j[1] - cols_j[0])
+    n, sum_i, sum_j, sum_ij, sum_ii, sum_jj = (np.zeros(shape) for _ in range(6))
+
+    for r0 in range(0, len(df), chunk_rows):
+        rows = (r0, min(r0 + chunk_rows, len(df)))
+        zi, mi = _standardized_chunk(df, columns, rows, cols_i, mean, scale)
+        zj, mj = (zi, mi) if cols_j == cols_i else _standardized_chunk(df, columns, rows, cols_j, mean, scale)
+        n += mi.T @ mj
+        sum_i += zi.T @ mj
+        sum_j += mi.T @ zj
+        sum_ij += zi.T @ zj
+        sum_ii += (zi * zi).T @ mj
+        sum_jj += mi.T @ (zj * zj)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sum_ij - sum_i * sum_j / n
+        var_i = sum_ii - sum_i * sum_i / n
+        var_j = sum_jj - sum_j * sum_j / n
+        block = cov / np.sqrt(var_i * var_j)
+    # Fewer than two shared rows or zero variance within the shared rows
+    block[(n < 2) | ~(var_i > 0) | ~(var_j > 0) | ~np.isfinite(block)] = np.nan
+    np.clip(block, -1.0, 1.0, out=block)
+    return block
+
+
+def top_correlations(matrix: np.ndarray, columns: List[str], threshold: float = 0.5,
+                     k: Optional[int] = 10) -> List[Dict[str, Any]]:
+    """
+    Strongest pairs from the upper triangle of a correlation matrix.
+
+    Args:
+        matrix: Correlation matrix
+        columns: Column names in matrix order
+        threshold: Minimum |r| (exclusive) for a pair to be reported
+        k: Maximum number of pairs (None for all)
+
+    Returns:
+        List of {column1, column2, correlation} sorted by |r| descending
+    """
+    upper = np.triu(np.ones(matrix.shape, dtype=bool), k=1)
+    with np.errstate(invalid='ignore'):
+        rows, cols = np.nonzero(upper & (np.abs(matrix) > threshold))
+
+    rounded = np.round(matrix[rows, cols], 3)
+    order = np.argsort(-np.abs(rounded), kind='stable')
+    if k is not None:
+        order = order[:k]
+
+    return [
+        {
+            'column1': columns[rows[idx]],
+            'column2': columns[cols[idx]],
+            'correlation': float(rounded[idx])
+        }
+        for idx in order
+    ]
+
+
+def save_matrix(path: str, matrix: np.ndarray, columns: List[str]) -> str:
+    """
+    Store a correlation matrix as a compact binary sidecar.
+
+    Saved as float32 in a NumPy .npz archive with the column names; load
+    with np.load(path) and read 'matrix' and 'columns'.
+
+    Returns:
+        Path of the written file
+    """
+    np.savez_compressed(path, matrix=matrix.astype(np.float32),
+                        columns=np.array([str(col) for col in columns]))
+    return str(path)
+
+
+def load_matrix(path: str) -> Tuple[np.ndarray, List[str]]:
+    """Read a sidecar written by save_matrix."""
+    with np.load(path) as data:
+        return data['matrix'], data['columns'].tolist()
@@ -0,0 +1,186 @@
+"""
+CSV Cache Module
+Persists parsed CSVs in a local columnar (Arrow IPC) cache so reruns on an
+unchanged file memory-map the cached frame instead of re-parsing it
+"""
+import os
+import json
+import glob
+import hashlib
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Bytes hashed from the head, middle and tail of the file for the content hash
+FINGERPRINT_BLOCK_SIZE = 1024 * 1024
+
+
+def file_fingerprint(path: str) -> Dict[str, Any]:
+    """
+    Fingerprint a file by path, size, mtime and a content hash.
+
+    The content hash covers the head, middle and tail blocks rather than the
+    whole file so fingerprinting stays cheap on multi-GB inputs; size and
+    mtime catch edits elsewhere in the file.
+
+    Returns:
+        Dictionary with path, size, mtime_ns and content_hash
+    """
+    stat = os.stat(path)
+    size = stat.st_size
+
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        offsets = [0]
+        if size > 2 * FINGERPRINT_BLOCK_SIZE:
+            offsets += [size // 2, size - FINGERPRINT_BLOCK_SIZE]
+        elif size > FINGERPRINT_BLOCK_SIZE:
+            offsets.append(FINGERPRINT_BLOCK_SIZE)
+        for offset in offsets:
+            f.seek(offset)
+            hasher.update(f.read(FINGERPRINT_BLOCK_SIZE))
+
+    return {
+        'path': os.path.abspath(path),
+        'size': int(size),
+        'mtime_ns': int(stat.st_mtime_ns),
+        'content_hash': hasher.hexdigest()
+    }
+
+
+class CSVCache:
+    """Columnar on-disk cache of parsed CSV files keyed by file fingerprint"""
+
+    def __init__(self, cache_dir: str = ".cache/csv"):
+        """
+        Initialize CSV cache.
+
+        Args:
+            cache_dir: Directory holding cached Arrow files and their metadata
+        """
+        self.cache_dir = cache_dir
+        self.enabled = PYARROW_AVAILABLE
+
+        if not self.enabled:
+            print("   ⚠️  pyarrow not installed, CSV cache disabled (pip install pyarrow)")
+            return
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _path_key(path: str) -> str:
+        """Stable key for the source path, shared by all cached versions of it."""
+        return hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+
+    def _entry_key(self, fingerprint: Dict[str, Any], variant: str) -> str:
+        """Key for one cached version of a file."""
+        payload = json.dumps({**fingerprint, 'variant': variant}, sort_keys=True)
+        content_key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return f"{self._path_key(fingerprint['path'])}-{content_key}"
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        return (os.path.join(self.cache_dir, f"{key}.arrow"),
+                os.path.join(self.cache_dir, f"{key}.json"))
+
+    def load(self, csv_path: str, variant: str = "full",
+             columns: Optional[List[str]] = None) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Load a cached frame for the CSV if the file is unchanged.
+
+        Args:
+            csv_path: Path to the source CSV
+            variant: Which parse of the file to look up (e.g. full load vs streamed sample)
+            columns: Optional subset of columns to read from the cached frame
+
+        Returns:
+            Tuple of (dataframe, metadata) or None on a cache miss
+        """
+        if not self.enabled:
+            return None
+
+        key = self._entry_key(file_fingerprint(csv_path), variant)
+        data_path, meta_path = self._paths(key)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None
+
+        try:
+            with open(meta_path, 'r') as f:
+                metadata = json.load(f)
+            table = feather.read_table(data_path, columns=columns, memory_map=True)
+            df = table.to_pandas()
+        except Exception as e:
+            print(f"   ⚠️  Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+        return df, metadata
+
+    def store(self, csv_path: str, df: pd.DataFrame, metadata: Dict[str, Any],
+              variant: str = "full") -> Optional[str]:
+        """
+        Store a parsed frame and its metadata, replacing older versions of the same file.
+
+        Args:
+            csv_path: Path to the source CSV
+            df: Parsed DataFrame
+            metadata: Extra metadata to persist (detected encoding, profile, ...)
+            variant: Which parse of the file this is
+
+        Returns:
+            Path of the cached Arrow file, or None if the frame could not be cached
+        """
+        if not self.enabled:
+            return None
+
+        fingerprint = file_fingerprint(csv_path)
+        key = self._entry_key(fingerprint, variant)
+        data_path, meta_path = self._paths(key)
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=True)
+            # Uncompressed so later reads can memory-map the buffers directly
+            feather.write_feather(table, data_path + ".tmp", compression='uncompressed')
+            os.replace(data_path + ".tmp", data_path)
+        except Exception as e:
+            print(f"   ⚠️  Could not cache parsed CSV: {e}")
+            if os.path.exists(data_path + ".tmp"):
+                os.remove(data_path + ".tmp")
+            return None
+
+        metadata = {
+            **metadata,
+            'fingerprint': fingerprint,
+            'variant': variant,
+            'dtypes': {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        with open(meta_path, 'w') as f:
+            json.dump(metadata, f, indent=2, default=str)
+
+        self._evict_stale(fingerprint, variant, keep=key)
+        return data_path
+
+    def _evict_stale(self, fingerprint: Dict[str, Any], variant: str, keep: str):
+        """Remove entries for the same file that are superseded or no longer match it."""
+        pattern = os.path.join(self.cache_dir, f"{self._path_key(fingerprint['path'])}-*.json")
+        for meta_path in glob.glob(pattern):
+            key = os.path.basename(meta_path)[:-len(".json")]
+            if key == keep:
+                continue
+            try:
+                with open(meta_path, 'r') as f:
+                    entry = json.load(f)
+                if entry.get('variant') != variant and entry.get('fingerprint') == fingerprint:
+                    continue
+            except Exception:
+                pass
+            for path in self._paths(key):
+                if os.path.exists(path):
+                    os.remove(path)
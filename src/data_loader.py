@@ -4,27 +4,65 @@ Handles loading CSV files and optional schema/data dictionary files
 """
 import pandas as pd
 import json
-from typing import Optional, Dict, Any, Tuple
+import codecs
+import copy
+import hashlib
+from typing import Optional, Dict, Any, List, Tuple
 import chardet
 from pathlib import Path
+from profiling import StreamingProfiler
+from csv_cache import CSVCache
+from decoding import FallbackDecodingReader
+from column_stats import get_column_stats
+from parallel import ColumnPool
+from sketches import NumericSketch
+from instrumentation import span
 
 
 class DataLoader:
     """Handles loading and initial processing of datasets"""
     
-    def __init__(self, csv_path: str, schema_path: Optional[str] = None):
+    def __init__(self, csv_path: str, schema_path: Optional[str] = None,
+                 chunksize: Optional[int] = None, sample_rows: int = 200000,
+                 cache_dir: Optional[str] = None, pool: Optional[ColumnPool] = None,
+                 approx_distinct: bool = False, quantile_accuracy: Optional[float] = None,
+                 duplicate_subset: Optional[List[str]] = None):
         """
         Initialize DataLoader.
         
         Args:
             csv_path: Path to CSV file
             schema_path: Optional path to schema/data dictionary file
+            chunksize: If set, stream the CSV in chunks of this many rows and
+                build the profile incrementally (out-of-core mode)
+            sample_rows: In streaming mode, number of rows kept in memory as
+                a uniform sample for the downstream stages
+            cache_dir: If set, reuse/store the parsed frame in a columnar cache here
+            pool: Optional worker pool for per-column profiling
+            approx_distinct: Estimate distinct counts of high-cardinality columns
+                with HyperLogLog (relative standard error ~0.8%)
+            quantile_accuracy: In streaming mode, sketch numeric columns over the
+                whole file with this quantile rank error (see numeric_sketches)
+            duplicate_subset: In streaming mode, columns for near-duplicate detection
+                in the whole-file duplicate scan (see duplicates)
         """
         self.csv_path = csv_path
         self.schema_path = schema_path
+        self.chunksize = chunksize
+        self.sample_rows = sample_rows
         self.df: Optional[pd.DataFrame] = None
         self.schema: Optional[Dict[str, Any]] = None
         self.encoding: str = 'utf-8'
+        self.encoding_switch_offset: Optional[int] = None
+        self.profiler: Optional[StreamingProfiler] = None
+        self.streamed_profile: Optional[Dict[str, Any]] = None
+        self.cache: Optional[CSVCache] = CSVCache(cache_dir) if cache_dir else None
+        self.pool = pool
+        self.approx_distinct = approx_distinct
+        self.quantile_accuracy = quantile_accuracy
+        self.numeric_sketches: Dict[str, NumericSketch] = {}
+        self.duplicate_subset = duplicate_subset
+        self.duplicates: Optional[Dict[str, Any]] = None
     
     def _detect_encoding(self) -> str:
         """Detect file encoding."""
@@ -33,41 +71,232 @@ class DataLoader:
             result = chardet.detect(raw_data)
             return result['encoding'] or 'utf-8'
     
-    def load_csv(self) -> pd.DataFrame:
+    def load_csv(self, usecols: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load CSV file with robust error handling.
         
+        Args:
+            usecols: Optional subset of columns to load (all columns if None)
+        
         Returns:
             Loaded DataFrame
         """
         print(f"📂 Loading CSV: {self.csv_path}")
+        if usecols is not None:
+            print(f"   Projecting to {len(usecols)} columns")
         
-        # Try to detect encoding
+        variant = self._cache_variant(usecols)
+        with span('load_cached_csv', 'io') as cache_span:
+            if self._load_from_cache(variant, usecols):
+                cache_span.set(hit=True, rows=int(self.df.shape[0]), columns=int(self.df.shape[1]))
+                return self.df
+            cache_span.set(hit=False)
+        
+        self.streamed_profile = None
+        self.numeric_sketches = {}
+        self.duplicates = None
+        reader = self._open_reader()
         try:
-            self.encoding = self._detect_encoding()
-            print(f"   Detected encoding: {self.encoding}")
+            with span('stream_csv' if self.chunksize else 'read_csv', 'io') as read_span:
+                if self.chunksize:
+                    self.df = self._stream_csv(reader, usecols)
+                else:
+                    self.df = pd.read_csv(reader, usecols=usecols, low_memory=False)
+                read_span.set(rows=int(self.df.shape[0]), columns=int(self.df.shape[1]))
+        except Exception as e:
+            raise Exception(f"Failed to load CSV: {e}")
+        finally:
+            reader.close()
+        
+        self._report_decoding(reader)
+        print(f"   ✅ Loaded successfully with {self.encoding}")
+        print(f"   Shape: {self.df.shape[0]:,} rows × {self.df.shape[1]} columns")
+        with span('store_csv_cache', 'io'):
+            self._store_in_cache(variant)
+        return self.df
+    
+    def load_sample(self, nrows: int) -> pd.DataFrame:
+        """
+        Load only the header and the first rows of the CSV.
+        
+        Used to profile and plan before deciding which columns to load in full.
+        
+        Args:
+            nrows: Number of rows to read
+        
+        Returns:
+            DataFrame with every column and at most nrows rows
+        """
+        print(f"📂 Loading CSV sample: {self.csv_path} (first {nrows:,} rows)")
+        
+        self.streamed_profile = None
+        reader = self._open_reader()
+        try:
+            with span('read_csv_sample', 'io') as read_span:
+                self.df = pd.read_csv(reader, nrows=nrows, low_memory=False)
+                read_span.set(rows=int(self.df.shape[0]), columns=int(self.df.shape[1]))
+        except Exception as e:
+            raise Exception(f"Failed to load CSV sample: {e}")
+        finally:
+            reader.close()
+        
+        self._report_decoding(reader)
+        print(f"   ✅ Sampled {self.df.shape[0]:,} rows × {self.df.shape[1]} columns")
+        return self.df
+    
+    def refine_profile(self, sample_profile: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Overlay full-data statistics for the loaded columns onto a sample-based profile.
+        
+        Args:
+            sample_profile: Profile built from load_sample()
+        
+        Returns:
+            Profile with full row count and exact stats for the loaded columns;
+            columns that were not loaded keep their sample stats and are marked
+            'sampled' with the sample size, and missing_summary counts only the
+            loaded columns
+        """
+        full_profile = self.get_initial_profile()
+        sample_rows = sample_profile['shape']['rows']
+        
+        profile = copy.deepcopy(sample_profile)
+        profile['profile_sample_rows'] = sample_rows
+        profile['shape']['rows'] = full_profile['shape']['rows']
+        for info in profile['columns'].values():
+            info.update({'sampled': True, 'sample_rows': sample_rows})
+        profile['columns'].update(full_profile['columns'])
+        profile['projected_columns'] = list(full_profile['columns'])
+        profile['missing_summary'] = {
+            **full_profile['missing_summary'],
+            'columns_counted': len(full_profile['columns'])
+        }
+        return profile
+    
+    def _open_reader(self) -> FallbackDecodingReader:
+        """Sniff the encoding and open a single-pass decoding stream over the CSV."""
+        try:
+            detected = self._detect_encoding()
+            print(f"   Detected encoding: {detected}")
         except Exception as e:
             print(f"   ⚠️  Encoding detection failed, using UTF-8: {e}")
-            self.encoding = 'utf-8'
-        
-        # Try loading with different strategies
-        strategies = [
-            {'encoding': self.encoding},
-            {'encoding': 'utf-8'},
-            {'encoding': 'latin-1'},
-            {'encoding': 'iso-8859-1'},
-        ]
-        
-        for i, kwargs in enumerate(strategies):
-            try:
-                self.df = pd.read_csv(self.csv_path, **kwargs, low_memory=False)
-                print(f"   ✅ Loaded successfully with {kwargs['encoding']}")
-                print(f"   Shape: {self.df.shape[0]:,} rows × {self.df.shape[1]} columns")
-                return self.df
-            except Exception as e:
-                if i == len(strategies) - 1:
-                    raise Exception(f"Failed to load CSV with all encoding strategies: {e}")
-                continue
+            detected = 'utf-8'
+        
+        self.encoding, fallback_encoding = self._choose_encodings(detected)
+        
+        # Bytes that are invalid in the sniffed encoding switch the rest of the
+        # stream to the fallback codec instead of forcing a full re-parse
+        return FallbackDecodingReader(self.csv_path, self.encoding, fallback_encoding)
+    
+    def _report_decoding(self, reader: FallbackDecodingReader):
+        """Record and report a mid-stream switch to the fallback codec."""
+        self.encoding_switch_offset = reader.switch_offset
+        if reader.switch_offset is not None:
+            print(f"   ⚠️  Invalid {self.encoding} at byte {reader.switch_offset:,}; "
+                  f"decoded the rest as {reader.fallback_encoding}")
+    
+    @staticmethod
+    def _choose_encodings(detected: str) -> Tuple[str, str]:
+        """
+        Pick the primary and fallback codecs for a sniffed encoding.
+        
+        Returns:
+            Tuple of (primary encoding, fallback encoding)
+        """
+        try:
+            name = codecs.lookup(detected).name
+        except LookupError:
+            name = 'utf-8'
+        
+        # A pure-ASCII head says nothing about the tail; UTF-8 is its strict superset
+        if name == 'ascii':
+            name = 'utf-8'
+        
+        return name, 'latin-1'
+    
+    def _stream_csv(self, reader: FallbackDecodingReader,
+                    usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read the CSV in bounded chunks, profiling each chunk as it arrives.
+        
+        Args:
+            reader: Decoded text stream of the CSV
+            usecols: Optional subset of columns to read
+        
+        Returns:
+            Uniform row sample of the file (at most sample_rows rows)
+        """
+        print(f"   Streaming in chunks of {self.chunksize:,} rows")
+        self.profiler = StreamingProfiler(sample_rows=self.sample_rows,
+                                          quantile_accuracy=self.quantile_accuracy,
+                                          duplicate_subset=self.duplicate_subset)
+        
+        with pd.read_csv(reader, usecols=usecols, chunksize=self.chunksize,
+                         low_memory=False) as chunks:
+            for chunk in chunks:
+                self.profiler.update(chunk)
+        
+        print(f"   Profiled {self.profiler.n_rows:,} rows; keeping a {min(self.sample_rows, self.profiler.n_rows):,}-row sample")
+        self.streamed_profile = self.profiler.get_profile(Path(self.csv_path).name)
+        self.numeric_sketches = self.profiler.get_numeric_sketches()
+        self.duplicates = self.profiler.duplicates.summary()
+        return self.profiler.get_sample()
+    
+    def _cache_variant(self, usecols: Optional[List[str]] = None) -> str:
+        """Cache variant for the current load mode (streamed samples depend on sample_rows)."""
+        variant = f"stream-{self.sample_rows}" if self.chunksize else "full"
+        if self.chunksize and self.quantile_accuracy:
+            variant += f"-q{self.quantile_accuracy}"
+        if self.chunksize and self.duplicate_subset:
+            digest = hashlib.blake2b(json.dumps(sorted(self.duplicate_subset)).encode(), digest_size=8).hexdigest()
+            variant += f"-dup-{digest}"
+        if usecols is not None:
+            digest = hashlib.blake2b(json.dumps(sorted(usecols)).encode(), digest_size=8).hexdigest()
+            variant += f"-cols-{digest}"
+        return variant
+    
+    def _load_from_cache(self, variant: str, usecols: Optional[List[str]] = None) -> bool:
+        """Try to restore the parsed frame from the columnar cache."""
+        if self.cache is None:
+            return False
+        
+        cached = self.cache.load(self.csv_path, variant)
+        if cached is None and usecols is not None and not self.chunksize:
+            # A cached full parse can serve any projection by reading just those columns
+            cached = self.cache.load(self.csv_path, "full", columns=usecols)
+        if cached is None:
+            return False
+        
+        self.df, metadata = cached
+        self.encoding = metadata.get('encoding', self.encoding)
+        self.encoding_switch_offset = metadata.get('encoding_switch_offset')
+        self.streamed_profile = metadata.get('profile')
+        self.numeric_sketches = {col: NumericSketch.from_dict(data)
+                                 for col, data in metadata.get('numeric_sketches', {}).items()}
+        self.duplicates = metadata.get('duplicates')
+        print(f"   ⚡ Loaded from cache (encoding: {self.encoding})")
+        print(f"   Shape: {self.df.shape[0]:,} rows × {self.df.shape[1]} columns")
+        return True
+    
+    def _store_in_cache(self, variant: str):
+        """Persist the parsed frame so the next run can skip parsing."""
+        if self.cache is None:
+            return
+        
+        metadata = {
+            'encoding': self.encoding,
+            'encoding_switch_offset': self.encoding_switch_offset
+        }
+        if self.streamed_profile is not None:
+            metadata['profile'] = self.streamed_profile
+        if self.numeric_sketches:
+            metadata['numeric_sketches'] = {col: sketch.to_dict()
+                                            for col, sketch in self.numeric_sketches.items()}
+        if self.duplicates is not None:
+            metadata['duplicates'] = self.duplicates
+        
+        if self.cache.store(self.csv_path, self.df, metadata, variant):
+            print(f"   💾 Cached parsed data in: {self.cache.cache_dir}")
     
     def load_schema(self) -> Optional[Dict[str, Any]]:
         """
@@ -121,6 +350,10 @@ class DataLoader:
         if self.df is None:
             raise ValueError("Data not loaded. Call load_csv() first.")
         
+        # In streaming mode the profile covers the whole file, not the sample
+        if self.streamed_profile is not None:
+            return self.streamed_profile
+        
         profile = {
             'filename': Path(self.csv_path).name,
             'shape': {
@@ -132,35 +365,51 @@ class DataLoader:
             'memory_usage_mb': float(self.df.memory_usage(deep=True).sum() / 1024**2)
         }
         
-        # Column-level information
+        # Column-level information from one vectorized pass over the frame
+        with span('column_stats', 'step', rows=int(self.df.shape[0]), columns=int(self.df.shape[1])):
+            stats = get_column_stats(self.df, self.pool, self.approx_distinct)
         for col in self.df.columns:
             col_data = self.df[col]
+            null_count = int(stats.null_counts[col])
             
             profile['columns'][col] = {
                 'dtype': str(col_data.dtype),
-                'non_null_count': int(col_data.count()),
-                'null_count': int(col_data.isna().sum()),
-                'null_percentage': float(col_data.isna().sum() / len(col_data) * 100),
-                'unique_count': int(col_data.nunique()),
-                'sample_values': [str(v) for v in col_data.dropna().head(5).tolist()]
+                'non_null_count': int(stats.non_null_counts[col]),
+                'null_count': null_count,
+                'null_percentage': float(null_count / len(col_data) * 100) if len(col_data) else 0.0,
+                'unique_count': int(stats.unique_counts[col]),
+                'sample_values': self._sample_values(col_data, int(stats.non_null_counts[col]))
             }
             
+            if stats.is_estimated(col):
+                profile['columns'][col]['unique_count_is_estimate'] = True
+                profile['columns'][col]['unique_count_relative_error'] = round(stats.distinct_error, 4)
+            
             # Add min/max for numeric columns
-            if pd.api.types.is_numeric_dtype(col_data):
-                profile['columns'][col]['min'] = float(col_data.min()) if not col_data.isna().all() else None
-                profile['columns'][col]['max'] = float(col_data.max()) if not col_data.isna().all() else None
+            if stats.dtype_class(col) == 'numeric':
+                col_min, col_max = stats.min_max(col)
+                profile['columns'][col]['min'] = col_min
+                profile['columns'][col]['max'] = col_max
         
         # Overall missing data summary
         total_cells = self.df.shape[0] * self.df.shape[1]
-        missing_cells = self.df.isna().sum().sum()
+        missing_cells = stats.null_counts.sum()
         profile['missing_summary'] = {
             'total_missing_cells': int(missing_cells),
             'total_cells': int(total_cells),
-            'missing_percentage': float(missing_cells / total_cells * 100)
+            'missing_percentage': float(missing_cells / total_cells * 100) if total_cells else 0.0
         }
         
         return profile
     
+    @staticmethod
+    def _sample_values(col_data: pd.Series, non_null_count: int, n: int = 5) -> List[str]:
+        """First n non-null values, scanning only the head of the column when possible."""
+        values = col_data.head(1000).dropna().head(n)
+        if len(values) < min(n, non_null_count):
+            values = col_data.dropna().head(n)
+        return [str(v) for v in values.tolist()]
+    
     def load_all(self) -> Tuple[pd.DataFrame, Optional[Dict[str, Any]], Dict[str, Any]]:
         """
         Load CSV, schema (if provided), and generate initial profile.
@@ -180,8 +429,34 @@ if __name__ == "__main__":
     import sys
     
     if len(sys.argv) < 2:
+        # Self-check: a two-phase profile must give full-file missing counts for loaded columns
+        import os
+        import tempfile
+        import numpy as np
+        
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({'a': rng.normal(size=5000), 'b': rng.integers(0, 9, 5000), 'c': rng.normal(size=5000)})
+        df.loc[1000:, 'a'] = np.where(rng.random(4000) < 0.2, np.nan, df.loc[1000:, 'a'])
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, 'two_phase.csv')
+            df.to_csv(csv_path, index=False)
+            loader = DataLoader(csv_path)
+            loader.load_sample(1000)
+            sample_profile = loader.get_initial_profile()
+            loader.load_csv(usecols=['a', 'b'])
+            profile = loader.refine_profile(sample_profile)
+            full = pd.read_csv(csv_path)
+        
+        nulls = full[['a', 'b']].isna().sum()
+        assert profile['shape']['rows'] == len(full)
+        assert profile['missing_summary']['total_missing_cells'] == int(nulls.sum())
+        assert profile['missing_summary']['total_cells'] == len(full) * 2
+        assert profile['columns']['a']['null_count'] == int(nulls['a'])
+        assert profile['columns']['c']['sampled'] and profile['columns']['c']['sample_rows'] == 1000
+        assert 'sampled' not in profile['columns']['a']
+        print(f"\n✅ Refined profile matches pandas: {int(nulls.sum())} missing cells in loaded columns")
         print("Usage: python data_loader.py <csv_file> [schema_file]")
-        sys.exit(1)
+        sys.exit(0)
     
     csv_path = sys.argv[1]
     schema_path = sys.argv[2] if len(sys.argv) > 2 else None
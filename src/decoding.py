@@ -0,0 +1,96 @@
+"""
+Decoding Module
+Single-pass text decoding of CSV files: validates the primary encoding
+incrementally and switches to a fallback codec only for the remaining bytes
+"""
+import io
+import codecs
+from typing import Optional
+
+
+class FallbackDecodingReader(io.TextIOBase):
+    """Read-only text stream that decodes a file once, falling back mid-stream on bad bytes"""
+
+    def __init__(self, path: str, encoding: str = 'utf-8',
+                 fallback_encoding: str = 'latin-1', block_size: int = 1024 * 1024):
+        """
+        Initialize decoding reader.
+
+        Args:
+            path: Path to the file to decode
+            encoding: Encoding tried first (validated strictly as bytes stream in)
+            fallback_encoding: Encoding used for everything after the first invalid byte
+            block_size: Bytes read from disk per refill
+        """
+        super().__init__()
+        self.primary_encoding = encoding
+        self.fallback_encoding = fallback_encoding
+        self.block_size = block_size
+        # Byte offset where decoding switched to the fallback codec (None = never)
+        self.switch_offset: Optional[int] = None
+
+        self._raw = open(path, 'rb')
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+        self._buffer = ''
+        self._bytes_read = 0
+        self._eof = False
+
+    @property
+    def active_encoding(self) -> str:
+        """Encoding currently being used to decode."""
+        return self.primary_encoding if self.switch_offset is None else self.fallback_encoding
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self):
+        """Decode the next block from disk into the text buffer."""
+        block = self._raw.read(self.block_size)
+        final = not block
+        self._bytes_read += len(block)
+
+        try:
+            text = self._decoder.decode(block, final)
+        except UnicodeDecodeError as e:
+            text = self._switch_to_fallback(e, block, final)
+
+        self._buffer += text
+        self._eof = final
+
+    def _switch_to_fallback(self, error: UnicodeDecodeError, block: bytes, final: bool) -> str:
+        """Keep the valid prefix and decode the rest of the stream with the fallback codec."""
+        # Buffered incremental decoders report positions relative to pending + new bytes
+        if isinstance(error.object, bytes) and error.object.endswith(block):
+            data, start = error.object, error.start
+        else:
+            data, start = block, 0
+
+        valid_prefix = data[:start].decode(self.primary_encoding, errors='replace')
+        self.switch_offset = self._bytes_read - len(data) + start
+        self._decoder = codecs.getincrementaldecoder(self.fallback_encoding)(errors='replace')
+        return valid_prefix + self._decoder.decode(data[start:], final)
+
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            while not self._eof:
+                self._fill()
+            text, self._buffer = self._buffer, ''
+            return text
+
+        while len(self._buffer) < size and not self._eof:
+            self._fill()
+        text, self._buffer = self._buffer[:size], self._buffer[size:]
+        return text
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        while '\n' not in self._buffer and not self._eof:
+            self._fill()
+        end = self._buffer.find('\n') + 1 or len(self._buffer)
+        if size is not None and 0 <= size < end:
+            end = size
+        line, self._buffer = self._buffer[:end], self._buffer[end:]
+        return line
+
+    def close(self):
+        self._raw.close()
+        super().close()
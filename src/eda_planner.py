@@ -93,6 +93,8 @@ Respond ONLY with valid JSON."""
         # Get LLM response
         try:
             plan = self.llm.generate_json(prompt, purpose="EDA Strategy Planning")
+            if 'error' in plan:
+                raise ValueError(plan['error'])
             
             # Validate plan structure
             plan = self._validate_and_fix_plan(plan, profile)
@@ -102,7 +104,61 @@ Respond ONLY with valid JSON."""
         
         except Exception as e:
             print(f"   ⚠️  Error generating plan, using fallback: {e}")
-            return self._generate_fallback_plan(profile)
+            plan = self._generate_fallback_plan(profile)
+            # Marked so a resumed run asks the LLM again instead of reusing it
+            plan['fallback'] = True
+            return plan
+    
+    @staticmethod
+    def get_plan_columns(plan: Dict[str, Any], profile: Dict[str, Any]) -> List[str]:
+        """
+        Collect every column the plan analyzes or plots.
+        
+        Args:
+            plan: EDA plan from generate_analysis_plan
+            profile: Dataset profile (used to resolve the available columns)
+        
+        Returns:
+            Plan columns in file order (empty if the plan names none)
+        """
+        available = list(profile['columns'].keys())
+        wanted = set()
+        
+        def names(value: Any) -> List[str]:
+            # LLM plans vary in shape: a column may be a string, a list of them,
+            # or an item with 'column'/'columns'; anything else names no column
+            if isinstance(value, str):
+                return [value]
+            if isinstance(value, dict):
+                return names(value.get('column')) + names(value.get('columns'))
+            if isinstance(value, (list, tuple)):
+                return [name for item in value for name in names(item)]
+            return []
+        
+        key_columns = plan.get('key_columns', {})
+        if isinstance(key_columns, dict):
+            for value in key_columns.values():
+                wanted.update(names(value))
+        else:
+            wanted.update(names(key_columns))
+        
+        analyses = plan.get('recommended_analyses', {})
+        for items in analyses.values() if isinstance(analyses, dict) else [analyses]:
+            wanted.update(names(items))
+        
+        visualizations = plan.get('recommended_visualizations', [])
+        for viz in visualizations if isinstance(visualizations, list) else []:
+            if not isinstance(viz, dict):
+                continue
+            wanted.update(names([viz.get(key) for key in ('column', 'x', 'y')]))
+            wanted.update(names(viz.get('columns')))
+            
+            # A heatmap without columns covers every numeric column
+            if str(viz.get('type') or '').lower() == 'correlation_heatmap' and not viz.get('columns'):
+                wanted.update(col for col, info in profile['columns'].items()
+                              if 'int' in info['dtype'].lower() or 'float' in info['dtype'].lower())
+        
+        return [col for col in available if col in wanted]
     
     def _build_context(self, profile: Dict[str, Any], 
                       schema: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -0,0 +1,322 @@
+"""
+Instrumentation Module
+Lightweight spans recording wall time, thread CPU time, memory and row/column
+counts for pipeline stages and their sub-steps (columns, plots, LLM calls),
+exportable as a Chrome/Perfetto trace
+"""
+import os
+import sys
+import json
+import time
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    High-water mark of this process's resident memory since it started, in MB.
+
+    Process-wide and never decreasing: a span reading it sees the peak of
+    everything that ran before or alongside it, not its own.
+    """
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident memory of this process, in MB (Linux only)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024**2
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class Span:
+    """An open span; set() attaches counts such as rows or columns to it"""
+
+    __slots__ = ('name', 'cat', 'args')
+
+    def __init__(self, name: str, cat: str, args: Dict[str, Any]):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def set(self, **args):
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects spans from every thread of a run"""
+
+    # High-volume categories whose spans skip the memory readings
+    LIGHT_CATEGORIES = ('column',)
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False,
+                 origin: Optional[float] = None):
+        """
+        Initialize tracer.
+
+        Args:
+            enabled: Record spans (a disabled tracer costs one branch per span)
+            trace_memory: Also record Python heap usage with tracemalloc while
+                active (slows allocation-heavy code noticeably)
+            origin: perf_counter() value trace timestamps are relative to; pass
+                the parent's origin in worker processes so their spans line up
+        """
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.origin = time.perf_counter() if origin is None else origin
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+
+    def start(self):
+        """Start memory tracing if requested."""
+        if self.enabled and self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        """Stop memory tracing started by start()."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, cat: str = 'step', **args) -> Iterator[Span]:
+        """
+        Time a block of code.
+
+        Records wall time, the CPU time of the calling thread only
+        (thread_cpu_ms; work handed to pools or other threads is not
+        counted), resident memory at the end and its change over the block,
+        the process-wide peak RSS so far (process_peak_rss_mb) and, with
+        trace_memory, the Python heap peak so far. Only the RSS change is
+        attributable to the block itself. Spans of light categories
+        (per-column work) record times only. A block that raises is
+        recorded with status 'failed'.
+
+        Args:
+            name: Span name (e.g. the column or plot it covers)
+            cat: Category: 'stage', 'step', 'column', 'plot', 'llm' or 'io'
+            **args: Extra values to record, e.g. rows=..., columns=...
+        """
+        span = Span(name, cat, dict(args))
+        if not self.enabled:
+            yield span
+            return
+
+        light = cat in self.LIGHT_CATEGORIES
+        stack = self._stack()
+        stack.append(span)
+        rss_start = None if light else current_rss_mb()
+        cpu_start = time.thread_time()
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span.args['status'] = 'failed'
+            raise
+        finally:
+            end = time.perf_counter()
+            span.args['thread_cpu_ms'] = round((time.thread_time() - cpu_start) * 1000, 3)
+            # Removed by identity: interleaved coroutines may close spans out of order
+            stack.remove(span)
+            if light:
+                self.add_span(span.name, span.cat, start, end, **span.args)
+            else:
+                self._finish(span, start, end, rss_start)
+
+    def _finish(self, span: Span, start: float, end: float, rss_start: Optional[float]):
+        rss_end = current_rss_mb()
+        if rss_end is not None:
+            span.args['rss_mb'] = round(rss_end, 1)
+            if rss_start is not None:
+                span.args['rss_delta_mb'] = round(rss_end - rss_start, 1)
+        peak = peak_rss_mb()
+        if peak is not None:
+            # getrusage lags /proc slightly; the peak is never below the current value
+            span.args['process_peak_rss_mb'] = round(max(peak, rss_end or 0.0), 1)
+        if tracemalloc.is_tracing():
+            span.args['py_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 1024**2, 1)
+        self.add_span(span.name, span.cat, start, end, **span.args)
+
+    def annotate(self, **args):
+        """Attach values (e.g. rows, columns) to the innermost open span of this thread."""
+        if not self.enabled:
+            return
+        stack = self._stack()
+        if stack:
+            stack[-1].set(**args)
+
+    def add_span(self, name: str, cat: str, start: float, end: float, **args):
+        """Record a span measured elsewhere (start/end are perf_counter() values)."""
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'ts': round((start - self.origin) * 1e6, 1),
+            'dur': round((end - start) * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': thread.ident,
+            'thread_name': thread.name,
+            'args': args
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def merge(self, events: List[Dict[str, Any]]):
+        """Add spans recorded by another tracer (e.g. in a worker process)."""
+        if self.enabled and events:
+            with self._lock:
+                self.events.extend(events)
+
+    def stage_summary(self) -> List[Dict[str, Any]]:
+        """
+        One row per pipeline stage span, in start order.
+
+        Returns:
+            List of {stage, wall_s, thread_cpu_s, rss_mb, rss_delta_mb,
+            process_peak_rss_mb, rows, columns, status}; memory figures are
+            None where unavailable
+        """
+        with self._lock:
+            stages = sorted((e for e in self.events if e['cat'] == 'stage'), key=lambda e: e['ts'])
+        return [self._summary_row(event, stage=event['name'],
+                                  status=event['args'].get('status', 'ok'))
+                for event in stages]
+
+    def slowest_steps(self, n: int = 10) -> List[Dict[str, Any]]:
+        """The n longest sub-step spans (everything but stages)."""
+        with self._lock:
+            steps = [e for e in self.events if e['cat'] != 'stage']
+        steps.sort(key=lambda e: e['dur'], reverse=True)
+        return [self._summary_row(event, step=event['name'], cat=event['cat']) for event in steps[:n]]
+
+    def category_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Span count and summed wall/thread CPU seconds per sub-step category."""
+        totals: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for event in self.events:
+                if event['cat'] == 'stage':
+                    continue
+                total = totals.setdefault(event['cat'], {'count': 0, 'wall_s': 0.0, 'thread_cpu_s': 0.0})
+                total['count'] += 1
+                total['wall_s'] += event['dur'] / 1e6
+                total['thread_cpu_s'] += event['args'].get('thread_cpu_ms', 0.0) / 1000
+        for total in totals.values():
+            total['wall_s'] = round(total['wall_s'], 3)
+            total['thread_cpu_s'] = round(total['thread_cpu_s'], 3)
+        return totals
+
+    def summary(self) -> Dict[str, Any]:
+        """Stages, slowest sub-steps and per-category totals, for reports."""
+        return {
+            'stages': self.stage_summary(),
+            'slowest_steps': self.slowest_steps(),
+            'categories': self.category_totals()
+        }
+
+    @staticmethod
+    def _summary_row(event: Dict[str, Any], **fields) -> Dict[str, Any]:
+        args = event['args']
+        cpu_ms = args.get('thread_cpu_ms')
+        return {
+            **fields,
+            'wall_s': round(event['dur'] / 1e6, 3),
+            'thread_cpu_s': round(cpu_ms / 1000, 3) if cpu_ms is not None else None,
+            'rss_mb': args.get('rss_mb'),
+            'rss_delta_mb': args.get('rss_delta_mb'),
+            'process_peak_rss_mb': args.get('process_peak_rss_mb'),
+            'rows': args.get('rows'),
+            'columns': args.get('columns')
+        }
+
+    def write_chrome_trace(self, path: str) -> str:
+        """
+        Write the spans in Chrome trace event format.
+
+        Open the file in https://ui.perfetto.dev or chrome://tracing.
+
+        Returns:
+            Path of the written file
+        """
+        with self._lock:
+            events = list(self.events)
+
+        # Small stable thread ids and named tracks, one per thread and process
+        trace_events = []
+        tids: Dict[Any, int] = {}
+        for event in events:
+            key = (event['pid'], event['tid'])
+            if key not in tids:
+                tids[key] = len(tids) + 1
+                trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': event['pid'],
+                                     'tid': tids[key], 'args': {'name': event['thread_name']}})
+            trace_events.append({
+                'name': event['name'], 'cat': event['cat'], 'ph': 'X',
+                'ts': event['ts'], 'dur': event['dur'],
+                'pid': event['pid'], 'tid': tids[key], 'args': event['args']
+            })
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f, default=str)
+        return str(path)
+
+
+# Tracer of the run in progress; a disabled one when nothing is being traced
+_DISABLED = Tracer(enabled=False)
+_ACTIVE = _DISABLED
+
+
+def get_tracer() -> Tracer:
+    """Tracer of the current run (a disabled tracer outside of one)."""
+    return _ACTIVE
+
+
+@contextmanager
+def activate(tracer: Tracer) -> Iterator[Tracer]:
+    """Make a tracer current for a block (all threads of the process see it)."""
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = tracer
+    tracer.start()
+    try:
+        yield tracer
+    finally:
+        tracer.stop()
+        _ACTIVE = previous
+
+
+def span(name: str, cat: str = 'step', **args):
+    """Span on the current tracer; see Tracer.span."""
+    return get_tracer().span(name, cat, **args)
+
+
+def annotate(**args):
+    """Annotate the innermost open span on the current tracer; see Tracer.annotate."""
+    get_tracer().annotate(**args)
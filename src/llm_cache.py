@@ -0,0 +1,142 @@
+"""
+LLM Cache Module
+Disk-backed (SQLite) cache of LLM responses so identical prompts on
+unchanged datasets are answered locally instead of calling the API again
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Optional, Dict, Any
+
+
+class LLMCache:
+    """SQLite cache of LLM responses with TTL expiry and least-recently-used size eviction"""
+
+    def __init__(self, cache_dir: str = ".cache/llm", max_bytes: int = 100 * 1024**2,
+                 ttl_seconds: Optional[float] = 30 * 24 * 3600):
+        """
+        Initialize LLM cache.
+
+        Args:
+            cache_dir: Directory holding the SQLite database
+            max_bytes: Total size of cached responses before least recently
+                used entries are evicted
+            ttl_seconds: Age after which an entry is no longer served (None = never)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.db_path = os.path.join(cache_dir, "responses.sqlite")
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # Several processes (batch workers) may share the file; SQLite serializes writers
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                       key TEXT PRIMARY KEY,
+                       model TEXT NOT NULL,
+                       response TEXT NOT NULL,
+                       size INTEGER NOT NULL,
+                       created REAL NOT NULL,
+                       last_access REAL NOT NULL
+                   )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)")
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float,
+                 config: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Cache key for one request.
+
+        Args:
+            model: Model name
+            prompt: Full prompt text
+            temperature: Sampling temperature
+            config: Any other generation settings that change the response
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps({
+            'model': model,
+            'temperature': temperature,
+            'config': config or {},
+            'prompt_sha256': hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Response text, or None on a miss or an expired entry
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or self._expired(row[1], now):
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        """Store a response and evict entries past the TTL or size budget."""
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self._evict(now)
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created > self.ttl_seconds
+
+    def _evict(self, now: float):
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        if self.ttl_seconds is not None:
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        freed = 0
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            if total - freed <= self.max_bytes:
+                break
+            stale.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def delete(self, key: str):
+        """Remove one entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        self._conn.close()
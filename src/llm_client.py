@@ -3,71 +3,206 @@ LLM Client for Google Gemini API (Updated for google-genai package)
 """
 import os
 import json
-from typing import Optional, Dict, Any
+import asyncio
+import threading
+import weakref
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 from datetime import datetime
-from google import genai
-from google.genai import types
 from dotenv import load_dotenv
+from llm_cache import LLMCache
+from instrumentation import span
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+# Default number of requests one event loop keeps in flight
+DEFAULT_MAX_CONCURRENCY = 8
+
+# One genai.Client (and its HTTP connection pool) per API key, shared by every LLMClient
+_SHARED_CLIENTS: Dict[str, "genai.Client"] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+# Concurrency limiters, one per event loop
+_LOOP_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# Log appends from concurrent requests must not interleave
+_LOG_LOCK = threading.Lock()
+
+
+def configured_model() -> str:
+    """Gemini model name from the environment (or .env), as used by LLMClient."""
+    load_dotenv()
+    return os.getenv('GEMINI_MODEL', 'gemini-2.0-flash-exp')
+
+
+def get_shared_client(api_key: str) -> "genai.Client":
+    """Get the process-wide Gemini client for an API key, creating it on first use."""
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(api_key)
+        if client is None:
+            # Imported on first use: google.genai alone takes about half a second to import
+            from google import genai
+            client = genai.Client(api_key=api_key)
+            _SHARED_CLIENTS[api_key] = client
+        return client
 
 
 class LLMClient:
     """Client for interacting with Google Gemini API"""
     
-    def __init__(self, log_file: str = "logs/genai_log.md"):
+    MAX_OUTPUT_TOKENS = 8000
+    JSON_TEMPERATURE = 0.3
+    
+    def __init__(self, log_file: str = "logs/genai_log.md", cache_dir: Optional[str] = ".cache/llm",
+                 max_concurrency: Optional[int] = None):
+        """
+        Initialize LLM client.
+        
+        Args:
+            log_file: Markdown log of every prompt and response
+            cache_dir: Directory for the on-disk response cache (None disables caching)
+            max_concurrency: Async requests in flight per event loop (default from
+                GEMINI_MAX_CONCURRENCY, else 8); the limit is shared by every client
+                on the loop, and the first client to make a request on a loop sets it
+        """
         load_dotenv()
         
         self.api_key = os.getenv('GEMINI_API_KEY')
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not found in environment variables.")
         
-        self.client = genai.Client(api_key=self.api_key)
-        self.model_name = os.getenv('GEMINI_MODEL', 'gemini-2.0-flash-exp')
+        self.client = get_shared_client(self.api_key)
+        self.model_name = configured_model()
         self.log_file = log_file
+        self.cache: Optional[LLMCache] = LLMCache(cache_dir) if cache_dir else None
+        self.max_concurrency = max_concurrency or int(os.getenv('GEMINI_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY))
         self._initialize_log()
     
     def _initialize_log(self):
         os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-        if not os.path.exists(self.log_file):
-            with open(self.log_file, 'w') as f:
-                f.write("# GenAI Prompt Log\n\n")
-                f.write(f"**LLM Used:** Google Gemini ({self.model_name})\n\n")
-                f.write(f"**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write("---\n\n")
-    
-    def _log_interaction(self, prompt: str, response: str, purpose: str):
-        with open(self.log_file, 'a') as f:
-            f.write(f"## {purpose}\n\n")
-            f.write(f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"### Prompt:\n```\n{prompt}\n```\n\n")
-            f.write(f"### Response:\n```\n{response}\n```\n\n---\n\n")
+        with _LOG_LOCK:
+            if not os.path.exists(self.log_file):
+                with open(self.log_file, 'w') as f:
+                    f.write("# GenAI Prompt Log\n\n")
+                    f.write(f"**LLM Used:** Google Gemini ({self.model_name})\n\n")
+                    f.write(f"**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                    f.write("---\n\n")
+    
+    def _log_interaction(self, prompt: str, response: str, purpose: str, cached: bool = False):
+        entry = f"## {purpose}\n\n"
+        entry += f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        if cached:
+            entry += "**Source:** local response cache (no API call)\n\n"
+        entry += f"### Prompt:\n```\n{prompt}\n```\n\n"
+        entry += f"### Response:\n```\n{response}\n```\n\n---\n\n"
+        with _LOG_LOCK, open(self.log_file, 'a') as f:
+            f.write(entry)
+    
+    def _cache_key(self, prompt: str, temperature: float) -> str:
+        return LLMCache.make_key(self.model_name, prompt, temperature,
+                                 {'max_output_tokens': self.MAX_OUTPUT_TOKENS})
+    
+    def _lookup_cache(self, prompt: str, purpose: str, temperature: float) -> Tuple[Optional[str], Optional[str]]:
+        """Returns (cache key, cached response); both None when caching is off."""
+        if self.cache is None:
+            return None, None
+        
+        cache_key = self._cache_key(prompt, temperature)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            print(f"   ⚡ Using cached LLM response ({purpose})")
+            self._log_interaction(prompt, cached, purpose, cached=True)
+        return cache_key, cached
+    
+    def _config(self, temperature: float) -> "types.GenerateContentConfig":
+        from google.genai import types
+        return types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=self.MAX_OUTPUT_TOKENS,
+        )
+    
+    def _record_response(self, prompt: str, response_text: str, purpose: str,
+                         cache_key: Optional[str]) -> str:
+        self._log_interaction(prompt, response_text, purpose)
+        if cache_key is not None and response_text:
+            self.cache.put(cache_key, self.model_name, response_text)
+        return response_text
+    
+    def _record_error(self, prompt: str, error: Exception, purpose: str):
+        error_msg = f"Error: {str(error)}"
+        print(f"❌ {error_msg}")
+        self._log_interaction(prompt, f"ERROR: {error_msg}", purpose)
+    
+    def _span(self, prompt: str, purpose: str):
+        return span(purpose, 'llm', model=self.model_name, prompt_chars=len(prompt))
     
     def generate(self, prompt: str, purpose: str = "General", temperature: float = 0.7) -> str:
-        try:
-            config = types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=8000,
-            )
+        with self._span(prompt, purpose) as call:
+            cache_key, cached = self._lookup_cache(prompt, purpose, temperature)
+            call.set(cached=cached is not None)
+            if cached is not None:
+                return cached
             
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=config
-            )
+            try:
+                response = self.client.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=self._config(temperature)
+                )
+                
+                call.set(response_chars=len(response.text or ''))
+                return self._record_response(prompt, response.text, purpose, cache_key)
             
-            response_text = response.text
-            self._log_interaction(prompt, response_text, purpose)
-            return response_text
-        
-        except Exception as e:
-            error_msg = f"Error: {str(e)}"
-            print(f"❌ {error_msg}")
-            self._log_interaction(prompt, f"ERROR: {error_msg}", purpose)
-            raise
+            except Exception as e:
+                self._record_error(prompt, e, purpose)
+                raise
     
-    def generate_json(self, prompt: str, purpose: str = "JSON Generation") -> Dict[str, Any]:
-        json_prompt = f"{prompt}\n\nRespond with ONLY valid JSON, no markdown."
-        response_text = self.generate(json_prompt, purpose, temperature=0.3)
+    def _limiter(self) -> asyncio.Semaphore:
+        """Concurrency limiter of the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = _LOOP_SEMAPHORES.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            _LOOP_SEMAPHORES[loop] = semaphore
+        return semaphore
+    
+    async def agenerate(self, prompt: str, purpose: str = "General", temperature: float = 0.7) -> str:
+        """
+        Async version of generate.
         
+        Requests share the process-wide HTTP client; at most max_concurrency
+        of them are in flight per event loop, the rest wait their turn. Cache
+        reads and writes (SQLite) and log appends run on worker threads so
+        they do not block the loop.
+        """
+        with self._span(prompt, purpose) as call:
+            cache_key, cached = await asyncio.to_thread(self._lookup_cache, prompt, purpose, temperature)
+            call.set(cached=cached is not None)
+            if cached is not None:
+                return cached
+            
+            try:
+                async with self._limiter():
+                    response = await self.client.aio.models.generate_content(
+                        model=self.model_name,
+                        contents=prompt,
+                        config=self._config(temperature)
+                    )
+                
+                call.set(response_chars=len(response.text or ''))
+                return await asyncio.to_thread(self._record_response, prompt, response.text,
+                                               purpose, cache_key)
+            
+            except Exception as e:
+                await asyncio.to_thread(self._record_error, prompt, e, purpose)
+                raise
+    
+    @staticmethod
+    def _json_prompt(prompt: str) -> str:
+        return f"{prompt}\n\nRespond with ONLY valid JSON, no markdown."
+    
+    def _parse_json(self, response_text: str, json_prompt: str, temperature: float) -> Dict[str, Any]:
         cleaned = response_text.strip()
         if cleaned.startswith('```json'):
             cleaned = cleaned[7:]
@@ -81,4 +216,19 @@ class LLMClient:
             return json.loads(cleaned)
         except json.JSONDecodeError as e:
             print(f"❌ JSON parse error: {e}")
+            if self.cache is not None:
+                # Don't keep serving a malformed response on reruns
+                self.cache.delete(self._cache_key(json_prompt, temperature))
             return {"error": "Failed to parse JSON", "raw_response": cleaned}
+    
+    def generate_json(self, prompt: str, purpose: str = "JSON Generation") -> Dict[str, Any]:
+        json_prompt = self._json_prompt(prompt)
+        response_text = self.generate(json_prompt, purpose, temperature=self.JSON_TEMPERATURE)
+        return self._parse_json(response_text, json_prompt, self.JSON_TEMPERATURE)
+    
+    async def agenerate_json(self, prompt: str, purpose: str = "JSON Generation") -> Dict[str, Any]:
+        """Async version of generate_json."""
+        json_prompt = self._json_prompt(prompt)
+        response_text = await self.agenerate(json_prompt, purpose, temperature=self.JSON_TEMPERATURE)
+        # A malformed response is deleted from the cache, so parse off the loop too
+        return await asyncio.to_thread(self._parse_json, response_text, json_prompt, self.JSON_TEMPERATURE)
@@ -2,25 +2,50 @@
 Main Entry Point for AutoGen-EDA
 Orchestrates the entire EDA pipeline
 """
+from __future__ import annotations
+
+import os
 import sys
 import argparse
 from pathlib import Path
 import json
+from functools import partial
+from typing import Any, Dict, List, TYPE_CHECKING
 
-from data_loader import DataLoader
-from llm_client import LLMClient
+# Only modules that are quick to import are imported here. pandas, scipy,
+# matplotlib and google.genai take seconds together, so the modules that
+# need them are imported inside the stages that use them, and --help or a
+# bad path returns immediately.
+from llm_client import LLMClient, configured_model
 from eda_planner import EDAPlanner
-from analyzer import DataAnalyzer
-from visualizer import DataVisualizer
 from insight_generator import InsightGenerator
 from report_builder import ReportBuilder
-from utils import sanitize_filename, create_output_dir
+from pipeline import Pipeline
+from checkpoints import Checkpoint, CheckpointStore
+from instrumentation import Tracer, activate, annotate, get_tracer
+
+if TYPE_CHECKING:
+    from data_loader import DataLoader
+    from analyzer import DataAnalyzer
+    from parallel import ColumnPool
+    from visualizer import PlotPool
+
+DEFAULT_CHUNKSIZE = 100000
 
 
 class AutoGenEDA:
     """Main EDA Pipeline Orchestrator"""
     
-    def __init__(self, csv_path: str, schema_path: str = None, output_dir: str = "output"):
+    def __init__(self, csv_path: str, schema_path: str = None, output_dir: str = "output",
+                 chunksize: int = None, sample_rows: int = 200000,
+                 cache_dir: str = None, two_phase: bool = False,
+                 plan_sample_rows: int = 10000, workers: int = 1,
+                 parallel_backend: str = 'thread', approx_distinct: bool = False,
+                 quantile_accuracy: float = None, duplicate_subset: list = None,
+                 llm_cache_dir: str = None, resume: bool = False,
+                 llm_client: LLMClient = None, raise_on_error: bool = False,
+                 plot_process: bool = True, plot_cache_dir: str = None,
+                 chart_format: str = 'png', trace: bool = False, trace_memory: bool = False):
         """
         Initialize AutoGen-EDA.
         
@@ -28,18 +53,268 @@ class AutoGenEDA:
             csv_path: Path to CSV file
             schema_path: Optional path to schema file
             output_dir: Directory for outputs
+            chunksize: Rows per chunk for out-of-core profiling (None loads the whole file)
+            sample_rows: Rows kept in memory for analysis when streaming
+            cache_dir: Directory for the parsed-CSV cache (None disables caching)
+            two_phase: Plan on a row sample, then load only the columns the plan uses
+            plan_sample_rows: Rows read for profiling/planning in two-phase mode
+            workers: Workers for per-column profiling and analysis (0 = all cores)
+            parallel_backend: 'thread' or 'process' workers
+            approx_distinct: Use HyperLogLog distinct counts for high-cardinality columns
+            quantile_accuracy: Sketch numeric quantiles with this rank error (None = exact);
+                when streaming, the sketches cover the whole file rather than the sample
+            duplicate_subset: Columns for near-duplicate detection (rows equal on these only)
+            llm_cache_dir: Directory for the LLM response cache (None disables caching)
+            resume: Reuse the saved outputs of stages whose input data and settings
+                have not changed since an earlier (possibly failed) run
+            llm_client: Existing client to use instead of creating one (e.g. shared
+                by every dataset of a batch)
+            raise_on_error: Re-raise pipeline errors instead of exiting the process
+            plot_process: Render plots in a pool of worker processes; batch workers
+                are already separate processes and render in-process instead
+            plot_cache_dir: Directory of the content-addressed plot cache shared
+                across runs and datasets (None renders every plot)
+            chart_format: 'png' embeds rendered images in the HTML report;
+                'interactive' embeds each chart's pre-aggregated data, drawn
+                in the browser, and skips Matplotlib entirely
+            trace: Write every timed span (stages, columns, plots, LLM calls) as a
+                Chrome/Perfetto trace, trace_<dataset>.json
+            trace_memory: Also record Python heap usage with tracemalloc (slower)
         """
         self.csv_path = csv_path
         self.schema_path = schema_path
         self.output_dir = output_dir
+        self.chunksize = chunksize
+        self.sample_rows = sample_rows
+        self.cache_dir = cache_dir
+        self.two_phase = two_phase
+        self.plan_sample_rows = plan_sample_rows
+        self.workers = workers
+        self.parallel_backend = parallel_backend
+        self.approx_distinct = approx_distinct
+        self.quantile_accuracy = quantile_accuracy
+        self.duplicate_subset = duplicate_subset
+        self.llm_cache_dir = llm_cache_dir
+        self.resume = resume
+        self.llm_client = llm_client
+        self.raise_on_error = raise_on_error
+        self.plot_process = plot_process
+        self.plot_cache_dir = plot_cache_dir
+        self.chart_format = chart_format
+        self.trace = trace
+        self.trace_memory = trace_memory
         
         # Initialize components
         print("\n" + "="*80)
         print("🚀 AutoGen-EDA: LLM-Assisted Dataset Analysis")
         print("="*80)
         
+        from utils import create_output_dir
         create_output_dir(output_dir)
     
+    def _create_analyzer(self, df, pool: ColumnPool, loader: DataLoader) -> DataAnalyzer:
+        """Analyzer configured from the run options and the loader's whole-file summaries."""
+        from analyzer import DataAnalyzer
+        return DataAnalyzer(df, pool=pool, approx_distinct=self.approx_distinct,
+                            quantile_accuracy=self.quantile_accuracy,
+                            numeric_sketches=loader.numeric_sketches,
+                            duplicate_subset=self.duplicate_subset,
+                            duplicates=loader.duplicates,
+                            profile=loader.streamed_profile)
+    
+    @staticmethod
+    def _print_step(title: str):
+        print("\n" + "─"*80)
+        print(title)
+        print("─"*80)
+    
+    def _output_path(self, prefix: str, dataset_name: str, extension: str) -> Path:
+        return Path(self.output_dir) / f"{prefix}_{dataset_name}.{extension}"
+    
+    def _load_stage(self, loader: DataLoader) -> Dict[str, Any]:
+        self._print_step("STEP 1: DATA LOADING")
+        if self.two_phase:
+            # Phase one: profile the header and a bounded row sample only
+            df = loader.load_sample(self.plan_sample_rows)
+            schema = loader.load_schema()
+            profile = loader.get_initial_profile()
+        else:
+            df, schema, profile = loader.load_all()
+        annotate(rows=int(df.shape[0]), columns=int(df.shape[1]))
+        return {'df': df, 'schema': schema, 'profile': profile}
+    
+    def _llm_stage(self) -> LLMClient:
+        self._print_step("STEP 2: LLM INITIALIZATION")
+        if self.llm_client is not None:
+            return self.llm_client
+        return LLMClient(cache_dir=self.llm_cache_dir)
+    
+    def _plan_stage(self, data: Dict[str, Any], llm_client: LLMClient) -> Dict[str, Any]:
+        self._print_step("STEP 3: STRATEGY PLANNING")
+        planner = EDAPlanner(llm_client)
+        return planner.generate_analysis_plan(data['profile'], data['schema'])
+    
+    def _project_stage(self, loader: DataLoader, data: Dict[str, Any],
+                       eda_plan: Dict[str, Any]) -> Dict[str, Any]:
+        # Phase two: reload only the columns the plan analyzes or plots
+        self._print_step("STEP 3b: PROJECTED LOADING")
+        profile = data['profile']
+        plan_columns = EDAPlanner.get_plan_columns(eda_plan, profile)
+        if plan_columns and self.duplicate_subset:
+            plan_columns += [col for col in self.duplicate_subset
+                             if col in profile['columns'] and col not in plan_columns]
+        df = loader.load_csv(usecols=plan_columns or None)
+        annotate(rows=int(df.shape[0]), columns=int(df.shape[1]))
+        return {'df': df, 'schema': data['schema'], 'profile': loader.refine_profile(profile)}
+    
+    @staticmethod
+    def _profile_stage(data: Dict[str, Any]) -> Dict[str, Any]:
+        return data['profile']
+    
+    def _analysis_stage(self, dataset_name: str, pool: ColumnPool, loader: DataLoader,
+                        data: Dict[str, Any]) -> Dict[str, Any]:
+        self._print_step("STEP 4: STATISTICAL ANALYSIS")
+        analyzer = self._create_analyzer(data['df'], pool, loader)
+        analysis_results = analyzer.analyze_all()
+        
+        # Wide correlation matrices are kept out of the JSON as a binary sidecar
+        matrix_path = analyzer.save_correlation_matrix(
+            self._output_path("correlation_matrix", dataset_name, "npz")
+        )
+        if matrix_path:
+            print(f"   💾 Saved correlation matrix to: {matrix_path}")
+        return analysis_results
+    
+    def _insight_stage(self, analysis_results: Dict[str, Any], llm_client: LLMClient) -> Dict[str, Any]:
+        self._print_step("STEP 6: INSIGHT GENERATION")
+        from analyzer import format_facts
+        insight_gen = InsightGenerator(llm_client)
+        facts = format_facts(analysis_results)
+        return insight_gen.generate_insights(facts, analysis_results)
+    
+    def _summary_stage(self, dataset_name: str, insights: Dict[str, Any], llm_client: LLMClient) -> str:
+        return InsightGenerator(llm_client).generate_summary(dataset_name, insights)
+    
+    def _visualization_stage(self, plot_pool: PlotPool, data: Dict[str, Any], plan: Dict[str, Any],
+                             analysis_results: Dict[str, Any]) -> List[str]:
+        from visualizer import render_plots
+        from plot_cache import PlotCache
+        # Chart data files are small and cheap to write again, so only PNGs are cached
+        cache = PlotCache(self.plot_cache_dir) if self.plot_cache_dir and self.chart_format == 'png' else None
+        return render_plots(self.output_dir, data, plan, plot_pool, analysis_results, cache, self.chart_format)
+    
+    def _report_stage(self, fmt: str, dataset_name: str, profile: Dict[str, Any],
+                      analysis_results: Dict[str, Any], insights: Dict[str, Any],
+                      plot_paths: List[str], summary: str) -> str:
+        report_builder = ReportBuilder(self.output_dir)
+        build = report_builder.build_html if fmt == 'html' else report_builder.build_markdown
+        # Every stage but the reports themselves has finished by now
+        return build(dataset_name, profile, analysis_results, insights, plot_paths, summary,
+                     performance=get_tracer().summary())
+    
+    def _input_config(self) -> Dict[str, Any]:
+        """Input files and the settings that change what is loaded and computed from them."""
+        from csv_cache import file_fingerprint
+        return {
+            'csv': file_fingerprint(self.csv_path),
+            'schema': file_fingerprint(self.schema_path) if self.schema_path else None,
+            'chunksize': self.chunksize,
+            'sample_rows': self.sample_rows if self.chunksize else None,
+            'two_phase': self.two_phase,
+            'plan_sample_rows': self.plan_sample_rows if self.two_phase else None,
+            'approx_distinct': self.approx_distinct,
+            'quantile_accuracy': self.quantile_accuracy,
+            'duplicate_subset': self.duplicate_subset
+        }
+    
+    def _checkpoint(self, prefix: str, dataset_name: str, label: str, extension: str = "json",
+                    validate=None) -> Checkpoint:
+        path = self._output_path(prefix, dataset_name, extension)
+        return Checkpoint(path, label, fmt='json' if extension == 'json' else 'text', validate=validate)
+    
+    @staticmethod
+    def _not_fallback(result: Dict[str, Any]) -> bool:
+        return not result.get('fallback')
+    
+    @staticmethod
+    def _files_exist(paths: List[str]) -> bool:
+        return all(os.path.exists(path) for path in paths)
+    
+    @staticmethod
+    def _sidecar_exists(analysis_results: Dict[str, Any]) -> bool:
+        matrix_file = analysis_results.get('relationships', {}).get('correlations', {}).get('matrix_file')
+        return matrix_file is None or os.path.exists(matrix_file)
+    
+    def build_pipeline(self, dataset_name: str, pool: ColumnPool, plot_pool: PlotPool) -> Pipeline:
+        """
+        Express the EDA steps as a stage graph.
+        
+        Planning and analysis run side by side, plotting starts once both the
+        plan and the analysis exist (it draws from the analysis statistics),
+        insights as soon as the analysis does, and the two report formats are
+        rendered independently. The plan, profile, analysis
+        results, plot manifest, insights and summary are checkpointed in the
+        output directory; with resume, those whose inputs are unchanged are
+        read back instead of recomputed.
+        
+        Returns:
+            Pipeline ready to run
+        """
+        from data_loader import DataLoader
+        loader = DataLoader(self.csv_path, self.schema_path,
+                            chunksize=self.chunksize, sample_rows=self.sample_rows,
+                            cache_dir=self.cache_dir, pool=pool,
+                            approx_distinct=self.approx_distinct,
+                            quantile_accuracy=self.quantile_accuracy,
+                            duplicate_subset=self.duplicate_subset)
+        
+        checkpoints = CheckpointStore(self._output_path("checkpoints", dataset_name, "json"))
+        pipeline = Pipeline(max_threads=4, checkpoints=checkpoints, resume=self.resume)
+        pipeline.add('load', partial(self._load_stage, loader), config=self._input_config())
+        model = self.llm_client.model_name if self.llm_client is not None else configured_model()
+        pipeline.add('llm', self._llm_stage, config={'model': model}, preload=['google.genai'])
+        pipeline.add('plan', self._plan_stage, ['load', 'llm'],
+                     checkpoint=self._checkpoint("eda_plan", dataset_name, "EDA plan",
+                                                 validate=self._not_fallback))
+        
+        data = 'load'
+        if self.two_phase:
+            data = pipeline.add('project', partial(self._project_stage, loader), ['load', 'plan'])
+        
+        pipeline.add('profile', self._profile_stage, [data],
+                     checkpoint=self._checkpoint("profile", dataset_name, "dataset profile"))
+        pipeline.add('analysis', partial(self._analysis_stage, dataset_name, pool, loader), [data],
+                     checkpoint=self._checkpoint("analysis_results", dataset_name, "analysis results",
+                                                 validate=self._sidecar_exists),
+                     preload=['analyzer', 'scipy.stats'])
+        # Plots are drawn from the analysis statistics (no second pass over the data);
+        # the plot pool's worker processes draw and encode them in parallel, and
+        # interactive charts are only written as data for the report to draw
+        render_inline = self.chart_format == 'png' and not plot_pool.processes
+        pipeline.add('visualization', partial(self._visualization_stage, plot_pool),
+                     [data, 'plan', 'analysis'],
+                     config={'output_dir': os.path.abspath(self.output_dir), 'charts': self.chart_format},
+                     checkpoint=self._checkpoint("plots", dataset_name, "plot manifest",
+                                                 validate=self._files_exist),
+                     preload=['visualizer', 'plotting'] if render_inline else ['visualizer'])
+        pipeline.add('insights', self._insight_stage, ['analysis', 'llm'],
+                     checkpoint=self._checkpoint("insights", dataset_name, "insights",
+                                                 validate=self._not_fallback))
+        fallback_summary = InsightGenerator.fallback_summary(dataset_name)
+        pipeline.add('summary', partial(self._summary_stage, dataset_name), ['insights', 'llm'],
+                     checkpoint=self._checkpoint("summary", dataset_name, "executive summary", "txt",
+                                                 validate=lambda summary: summary != fallback_summary))
+        
+        report_deps = ['profile', 'analysis', 'insights', 'visualization', 'summary']
+        pipeline.add('html_report', partial(self._report_stage, 'html', dataset_name), report_deps)
+        pipeline.add('markdown_report', partial(self._report_stage, 'markdown', dataset_name), report_deps)
+        return pipeline
+    
+    def _write_trace(self, tracer: Tracer, dataset_name: str):
+        if not self.trace:
+            return None
+        return tracer.write_chrome_trace(self._output_path("trace", dataset_name, "json"))
+    
     def run(self) -> dict:
         """
         Run complete EDA pipeline.
@@ -47,81 +322,30 @@ class AutoGenEDA:
         Returns:
             Dictionary with paths to generated outputs
         """
+        from parallel import ColumnPool
+        from visualizer import PlotPool
+        from utils import sanitize_filename
+        pool = ColumnPool(self.workers, self.parallel_backend)
+        plot_pool = PlotPool(processes=self.plot_process)
+        if not self.resume and self.chart_format == 'png':
+            # Workers import Matplotlib while the data loads and the plan is drafted
+            plot_pool.start()
+        dataset_name = sanitize_filename(Path(self.csv_path).stem)
+        tracer = Tracer(trace_memory=self.trace_memory)
         try:
-            # Step 1: Load Data
-            print("\n" + "─"*80)
-            print("STEP 1: DATA LOADING")
-            print("─"*80)
-            
-            loader = DataLoader(self.csv_path, self.schema_path)
-            df, schema, profile = loader.load_all()
-            
-            dataset_name = sanitize_filename(Path(self.csv_path).stem)
-            
-            # Step 2: Initialize LLM
-            print("\n" + "─"*80)
-            print("STEP 2: LLM INITIALIZATION")
-            print("─"*80)
-            
-            llm_client = LLMClient()
-            
-            # Step 3: Generate EDA Plan
-            print("\n" + "─"*80)
-            print("STEP 3: STRATEGY PLANNING")
-            print("─"*80)
-            
-            planner = EDAPlanner(llm_client)
-            eda_plan = planner.generate_analysis_plan(profile, schema)
-            
-            # Save plan for reference
-            plan_path = Path(self.output_dir) / f"eda_plan_{dataset_name}.json"
-            with open(plan_path, 'w') as f:
-                json.dump(eda_plan, f, indent=2)
-            print(f"   💾 Saved EDA plan to: {plan_path}")
-            
-            # Step 4: Statistical Analysis
-            print("\n" + "─"*80)
-            print("STEP 4: STATISTICAL ANALYSIS")
-            print("─"*80)
-            
-            analyzer = DataAnalyzer(df)
-            analysis_results = analyzer.analyze_all(eda_plan)
-            
-            # Save raw results
-            results_path = Path(self.output_dir) / f"analysis_results_{dataset_name}.json"
-            with open(results_path, 'w') as f:
-                json.dump(analysis_results, f, indent=2, default=str)
-            print(f"   💾 Saved analysis results to: {results_path}")
+            pipeline = self.build_pipeline(dataset_name, pool, plot_pool)
+            with activate(tracer):
+                results = pipeline.run()
             
-            # Step 5: Create Visualizations
-            print("\n" + "─"*80)
-            print("STEP 5: VISUALIZATION")
-            print("─"*80)
+            timings_path = pipeline.write_timings(self._output_path("run_timings", dataset_name, "json"))
+            trace_path = self._write_trace(tracer, dataset_name)
+            stage_usage = {row['stage']: row for row in tracer.stage_summary()}
             
-            visualizer = DataVisualizer(df, self.output_dir)
-            plot_paths = visualizer.create_all_plots(eda_plan)
-            
-            # Step 6: Generate Insights
-            print("\n" + "─"*80)
-            print("STEP 6: INSIGHT GENERATION")
-            print("─"*80)
-            
-            insight_gen = InsightGenerator(llm_client)
-            facts = analyzer.get_facts_for_llm()
-            insights = insight_gen.generate_insights(facts, analysis_results)
-            
-            # Generate summary
-            summary = insight_gen.generate_summary(dataset_name, insights)
-            
-            # Step 7: Build Reports
-            print("\n" + "─"*80)
-            print("STEP 7: REPORT GENERATION")
-            print("─"*80)
-            
-            report_builder = ReportBuilder(self.output_dir)
-            report_paths = report_builder.build_reports(
-                dataset_name, profile, analysis_results, insights, plot_paths, summary
-            )
+            profile = results['profile']
+            plot_paths = results['visualization']
+            insights = results['insights']
+            llm_client = results.get('llm')
+            report_paths = {'html': results['html_report'], 'markdown': results['markdown_report']}
             
             # Final Summary
             print("\n" + "="*80)
@@ -132,6 +356,23 @@ class AutoGenEDA:
             print(f"   Columns: {profile['shape']['columns']}")
             print(f"\n📈 Generated {len(plot_paths)} visualizations")
             print(f"💡 Generated {len(insights.get('key_insights', []))} key insights")
+            if llm_client is not None and llm_client.cache is not None:
+                print(f"⚡ LLM cache: {llm_client.cache.hits} hits, {llm_client.cache.misses} API calls")
+            print(f"\n⏱️  Stage timings ({pipeline.total_seconds():.1f}s total): {timings_path}")
+            for timing in pipeline.ordered_timings():
+                if timing['status'] == 'ok':
+                    usage = stage_usage.get(timing['stage'], {})
+                    resources = []
+                    if usage.get('thread_cpu_s') is not None:
+                        resources.append(f"thread cpu {usage['thread_cpu_s']:.2f}s")
+                    if usage.get('process_peak_rss_mb') is not None:
+                        resources.append(f"process peak RSS so far {usage['process_peak_rss_mb']:,.0f} MB")
+                    resources = f"  ({', '.join(resources)})" if resources else ""
+                    print(f"   {timing['stage']:<16} {timing['start_s']:>7.2f}s → {timing['end_s']:>7.2f}s{resources}")
+                else:
+                    print(f"   {timing['stage']:<16} {timing['status']}")
+            if trace_path:
+                print(f"   🔎 Trace (open in ui.perfetto.dev): {trace_path}")
             print(f"\n📄 Reports:")
             print(f"   HTML: {report_paths['html']}")
             print(f"   Markdown: {report_paths['markdown']}")
@@ -142,15 +383,193 @@ class AutoGenEDA:
                 'dataset_name': dataset_name,
                 'reports': report_paths,
                 'plots': plot_paths,
-                'plan': str(plan_path),
-                'results': str(results_path)
+                'plan': str(self._output_path("eda_plan", dataset_name, "json")),
+                'results': str(self._output_path("analysis_results", dataset_name, "json")),
+                'timings': timings_path,
+                'trace': trace_path,
+                'shape': profile['shape'],
+                'insight_count': len(insights.get('key_insights', []))
             }
         
         except Exception as e:
             print(f"\n❌ ERROR: {e}")
             import traceback
             traceback.print_exc()
+            trace_path = self._write_trace(tracer, dataset_name)
+            if trace_path:
+                print(f"\n🔎 Trace of the failed run: {trace_path}")
+            print("\n💡 Completed stages were checkpointed; re-run with --resume to skip them")
+            if self.raise_on_error:
+                raise
             sys.exit(1)
+        
+        finally:
+            pool.close()
+            plot_pool.close()
+
+
+def add_analysis_arguments(parser: argparse.ArgumentParser):
+    """Add the options shared by single-file and batch runs to a CLI parser."""
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Profile the CSV out-of-core in bounded chunks (for files larger than RAM)'
+    )
+    
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        help='Rows per chunk in streaming mode (implies --streaming, default: 100000)',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--sample-rows',
+        type=int,
+        help='Rows kept in memory for analysis and plots in streaming mode (default: 200000)',
+        default=200000
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for the parsed-CSV cache (default: .cache/csv)',
+        default='.cache/csv'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-parse the CSV instead of using the parsed-CSV cache'
+    )
+    
+    parser.add_argument(
+        '--two-phase',
+        action='store_true',
+        help='Plan on a row sample, then load only the columns used by the plan'
+    )
+    
+    parser.add_argument(
+        '--plan-sample-rows',
+        type=int,
+        help='Rows read for profiling and planning in two-phase mode (default: 10000)',
+        default=10000
+    )
+    
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        help='Workers for per-column profiling and analysis (default: 1, 0 = all cores)',
+        default=1
+    )
+    
+    parser.add_argument(
+        '--parallel-backend',
+        choices=['thread', 'process'],
+        help='Run column workers as threads or as processes sharing column buffers (default: thread)',
+        default='thread'
+    )
+    
+    parser.add_argument(
+        '--approx-distinct',
+        action='store_true',
+        help='Estimate distinct counts of high-cardinality columns with HyperLogLog (~0.8%% error)'
+    )
+    
+    parser.add_argument(
+        '--quantile-accuracy',
+        type=float,
+        metavar='EPS',
+        help='Compute quantiles/outliers with a streaming sketch of this rank error, e.g. 0.01, in bounded '
+             'memory; meant for --streaming over whole files, not for speed on in-memory data (default: exact)',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--llm-cache-dir',
+        help='Directory for cached LLM responses (default: .cache/llm)',
+        default='.cache/llm'
+    )
+    
+    parser.add_argument(
+        '--no-llm-cache',
+        action='store_true',
+        help='Always call the LLM API instead of reusing cached responses'
+    )
+    
+    parser.add_argument(
+        '--plot-cache-dir',
+        help='Directory for rendered plots reused across runs and datasets (default: .cache/plots)',
+        default='.cache/plots'
+    )
+    
+    parser.add_argument(
+        '--no-plot-cache',
+        action='store_true',
+        help='Always render every plot instead of reusing unchanged ones'
+    )
+    
+    parser.add_argument(
+        '--charts',
+        choices=['png', 'interactive'],
+        help='Charts in the HTML report: rendered PNG images, or interactive charts drawn '
+             'in the browser from pre-aggregated data (smaller reports, no Matplotlib) (default: png)',
+        default='png'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Reuse saved outputs (plan, profile, analysis, plots, insights) whose inputs have not changed'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        action='store_true',
+        help='Write a Chrome/Perfetto trace of every stage, column, plot and LLM call (trace_<dataset>.json)'
+    )
+    
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Also record Python heap usage with tracemalloc (slows the run)'
+    )
+    
+    parser.add_argument(
+        '--duplicate-subset',
+        help='Comma-separated columns; also report near-duplicate rows that match on these columns only',
+        default=None
+    )
+
+
+def analysis_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    AutoGenEDA keyword arguments from options added by add_analysis_arguments.
+    
+    Returns:
+        Dictionary of keyword arguments (everything but paths)
+    """
+    chunksize = args.chunksize
+    if args.streaming and not chunksize:
+        chunksize = DEFAULT_CHUNKSIZE
+    
+    return {
+        'chunksize': chunksize,
+        'sample_rows': args.sample_rows,
+        'cache_dir': None if args.no_cache else args.cache_dir,
+        'two_phase': args.two_phase,
+        'plan_sample_rows': args.plan_sample_rows,
+        'workers': args.workers,
+        'parallel_backend': args.parallel_backend,
+        'approx_distinct': args.approx_distinct,
+        'quantile_accuracy': args.quantile_accuracy,
+        'duplicate_subset': args.duplicate_subset.split(',') if args.duplicate_subset else None,
+        'llm_cache_dir': None if args.no_llm_cache else args.llm_cache_dir,
+        'plot_cache_dir': None if args.no_plot_cache else args.plot_cache_dir,
+        'chart_format': args.charts,
+        'resume': args.resume,
+        'trace': args.trace or args.trace_memory,
+        'trace_memory': args.trace_memory
+    }
 
 
 def main():
@@ -163,6 +582,10 @@ Examples:
   python src/main.py data/my_dataset.csv
   python src/main.py data/my_dataset.csv --schema data/schema.json
   python src/main.py data/my_dataset.csv --output custom_output/
+  python src/main.py data/huge_dataset.csv --streaming
+  python src/main.py data/huge_dataset.csv --chunksize 500000 --sample-rows 100000
+  python src/main.py data/wide_survey.csv --two-phase --plan-sample-rows 20000
+  python src/main.py data/my_dataset.csv --resume
         """
     )
     
@@ -183,6 +606,8 @@ Examples:
         default='output'
     )
     
+    add_analysis_arguments(parser)
+    
     args = parser.parse_args()
     
     # Validate CSV file exists
@@ -196,7 +621,7 @@ Examples:
         sys.exit(1)
     
     # Run EDA
-    eda = AutoGenEDA(args.csv_file, args.schema, args.output)
+    eda = AutoGenEDA(args.csv_file, args.schema, args.output, **analysis_options(args))
     eda.run()
 
 
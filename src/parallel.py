@@ -0,0 +1,138 @@
+"""
+Parallel Module
+Shards per-column work across a thread or process pool; process workers
+attach to numeric column buffers through shared memory instead of
+receiving a pickled copy of the DataFrame
+"""
+import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pandas as pd
+import numpy as np
+from instrumentation import span
+
+
+# (shared memory name, dtype string, length, column name)
+SharedColumn = Tuple[str, str, int, Any]
+
+
+def _share_column(series: pd.Series) -> Tuple[shared_memory.SharedMemory, SharedColumn]:
+    """Copy a numeric column into a shared memory block once."""
+    values = series.to_numpy()
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+    return shm, (shm.name, values.dtype.str, len(values), series.name)
+
+
+def _run_on_shared(func: Callable, column: SharedColumn, args: tuple) -> Any:
+    """Worker side: attach to a shared column without copying and apply func."""
+    name, dtype, length, col_name = column
+    # Workers share the parent's resource tracker, so attaching here does not
+    # make the block this process's to unlink; the parent unlinks it when done
+    shm = shared_memory.SharedMemory(name=name)
+    values = series = None
+    try:
+        values = np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf)
+        series = pd.Series(values, name=col_name, copy=False)
+        return func(series, *args)
+    finally:
+        # Views must be released before the mapping can be closed
+        del series, values
+        shm.close()
+
+
+def _run_on_series(func: Callable, series: pd.Series, args: tuple) -> Any:
+    # Spans are only recorded in the parent process (inline and thread workers)
+    with span(str(series.name), 'column', func=func.__name__, rows=len(series)):
+        return func(series, *args)
+
+
+class ColumnPool:
+    """Worker pool that applies a function to many DataFrame columns"""
+
+    def __init__(self, workers: int = 1, backend: str = 'thread'):
+        """
+        Initialize column pool.
+
+        Args:
+            workers: Number of workers (1 runs everything inline; 0 uses all cores)
+            backend: 'thread' or 'process'
+        """
+        if backend not in ('thread', 'process'):
+            raise ValueError(f"Unknown parallel backend: {backend}")
+
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.backend = backend
+        self._executor: Optional[Executor] = None
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers > 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.backend == 'process':
+                # Spawned, not forked: the pool is created inside pipeline stage threads
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def map_columns(self, func: Callable, df: pd.DataFrame, columns: List[Any],
+                    args_by_column: Optional[Dict[Any, tuple]] = None) -> Dict[Any, Any]:
+        """
+        Apply func(series, *args) to each column and collect the results.
+
+        Args:
+            func: Module-level function taking a Series (must be picklable for processes)
+            df: Source DataFrame
+            columns: Columns to process
+            args_by_column: Optional extra positional arguments per column
+
+        Returns:
+            Dictionary mapping column name to result, in the order of columns
+        """
+        args_by_column = args_by_column or {}
+
+        if not self.parallel or len(columns) <= 1:
+            return {col: _run_on_series(func, df[col], args_by_column.get(col, ())) for col in columns}
+
+        executor = self._get_executor()
+        shared_blocks = []
+        try:
+            futures = {}
+            for col in columns:
+                series = df[col]
+                args = args_by_column.get(col, ())
+                if self.backend == 'process' and self._shareable(series):
+                    shm, descriptor = _share_column(series)
+                    shared_blocks.append(shm)
+                    futures[col] = executor.submit(_run_on_shared, func, descriptor, args)
+                else:
+                    futures[col] = executor.submit(_run_on_series, func, series, args)
+
+            return {col: futures[col].result() for col in columns}
+        finally:
+            for shm in shared_blocks:
+                shm.close()
+                shm.unlink()
+
+    @staticmethod
+    def _shareable(series: pd.Series) -> bool:
+        """Plain numpy numeric/bool columns can live in shared memory; others are pickled."""
+        return isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufc'
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
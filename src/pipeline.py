@@ -0,0 +1,246 @@
+"""
+Pipeline Module
+Runs the EDA stages as a dependency graph: each stage starts as soon as
+the stages it depends on have finished, each on a pool thread. The
+CPU-heavy stages hand their work to the column and plot pools, which use
+worker processes where configured, so the stages themselves stay threads.
+Stages with a checkpoint save their result and, on a resumed run, are read back instead
+of recomputed when their inputs have not changed
+"""
+import os
+import json
+import time
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from checkpoints import Checkpoint, CheckpointStore, stable_hash
+from instrumentation import get_tracer
+
+
+def _import_all(modules: List[str]):
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            # Reported by the stage itself when it runs
+            pass
+
+
+class Stage:
+    """One node of the pipeline graph"""
+
+    def __init__(self, name: str, func: Callable, deps: List[str], config: Any = None,
+                 checkpoint: Optional[Checkpoint] = None, preload: Optional[List[str]] = None):
+        """
+        Initialize stage.
+
+        Args:
+            name: Unique stage name
+            func: Called with the results of deps, in order
+            deps: Names of the stages whose results this stage needs
+            config: JSON-serializable settings that change the stage's result
+            checkpoint: Where the result is saved for resumed runs (None = not saved)
+            preload: Slow-to-import modules the stage imports when it runs;
+                they are imported ahead of time, while earlier stages run
+        """
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.config = config
+        self.checkpoint = checkpoint
+        self.preload = list(preload or [])
+
+
+class Pipeline:
+    """Dependency-graph scheduler for pipeline stages"""
+
+    def __init__(self, max_threads: int = 4, checkpoints: Optional[CheckpointStore] = None, resume: bool = False):
+        """
+        Initialize pipeline.
+
+        Args:
+            max_threads: Stages allowed to run at once
+            checkpoints: Store recording saved stage results (None = nothing saved)
+            resume: Reuse saved results of stages whose inputs have not changed
+        """
+        self.max_threads = max_threads
+        self.checkpoints = checkpoints
+        self.resume = resume and checkpoints is not None
+        self.stages: Dict[str, Stage] = {}
+        self.results: Dict[str, Any] = {}
+        self.timings: List[Dict[str, Any]] = []
+
+    def add(self, name: str, func: Callable, deps: Optional[List[str]] = None,
+            config: Any = None, checkpoint: Optional[Checkpoint] = None,
+            preload: Optional[List[str]] = None) -> str:
+        """
+        Add a stage.
+
+        Dependencies must already have been added, so the graph is acyclic
+        by construction. See Stage for the arguments.
+
+        Returns:
+            The stage name (handy for wiring deps)
+        """
+        deps = deps or []
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage name: {name}")
+        missing = [dep for dep in deps if dep not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {missing}")
+
+        self.stages[name] = Stage(name, func, deps, config, checkpoint, preload)
+        return name
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every stage, starting each one once its dependencies are done.
+
+        Each stage is keyed by a hash of its config and its dependencies'
+        keys; a checkpointed stage passes on the digest of its saved output
+        instead, so stages downstream of an unchanged result stay valid. When
+        resuming, a checkpointed stage whose key matches its saved output is
+        restored, and a stage without a checkpoint only runs if a stage that
+        does run needs its result (e.g. the data is not loaded when every
+        stage using it is restored).
+
+        If a stage fails, no new stages are started; running ones are allowed
+        to finish and the first error is re-raised.
+
+        Returns:
+            Dictionary mapping stage name to its result (stages that were not
+            needed are absent)
+        """
+        self.results = {}
+        self.timings = []
+        self._run_start = time.perf_counter()
+
+        dependents = {name: [] for name in self.stages}
+        for stage in self.stages.values():
+            for dep in stage.deps:
+                dependents[dep].append(stage.name)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_threads)
+        self._start_preload()
+
+        keys: Dict[str, str] = {}
+        input_keys: Dict[str, str] = {}
+        demanded = {name for name, deps in dependents.items() if not deps}
+        pending = dict(self.stages)
+        running: Dict[Future, Stage] = {}
+        started: Dict[str, float] = {}
+        error: Optional[BaseException] = None
+
+        try:
+            while True:
+                progress = error is None
+                while progress:
+                    progress = False
+                    for name, stage in list(pending.items()):
+                        if not all(dep in keys for dep in stage.deps):
+                            continue
+
+                        if name not in input_keys:
+                            progress = True
+                            input_keys[name] = stable_hash([name, stage.config, [keys[dep] for dep in stage.deps]])
+                            if stage.checkpoint is None:
+                                keys[name] = input_keys[name]
+                            elif self.resume:
+                                restored = self.checkpoints.restore(name, input_keys[name], stage.checkpoint)
+                                if restored is not None:
+                                    self.results[name], keys[name] = restored
+                                    now = time.perf_counter()
+                                    self._record(stage, now, now, 'restored')
+                                    get_tracer().add_span(name, 'stage', now, now, status='restored')
+                                    del pending[name]
+                                    continue
+
+                        # Checkpointed stages always produce a result; others only on demand
+                        if stage.checkpoint is None and name not in demanded:
+                            continue
+                        if not demanded.issuperset(stage.deps):
+                            demanded.update(stage.deps)
+                            progress = True
+                        if all(dep in self.results for dep in stage.deps):
+                            args = [self.results[dep] for dep in stage.deps]
+                            started[name] = time.perf_counter()
+                            future = executor.submit(self._call, stage, input_keys[name], args)
+                            running[future] = stage
+                            del pending[name]
+                            progress = True
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        result, digest = future.result()
+                        self.results[stage.name] = result
+                        keys[stage.name] = digest or input_keys[stage.name]
+                        status = 'ok'
+                    except BaseException as e:
+                        status = 'failed'
+                        if error is None:
+                            error = e
+                    self._record(stage, started[stage.name], time.perf_counter(), status)
+        finally:
+            executor.shutdown(wait=True)
+
+        if error is not None:
+            raise error
+        for stage in pending.values():
+            self._record(stage, None, None, 'skipped')
+        return self.results
+
+    def _start_preload(self):
+        """Import the preload modules of the stages on a background thread."""
+        modules = [module for stage in self.stages.values() for module in stage.preload]
+        # A resumed run restores most stages, so it imports only what actually runs
+        if modules and not self.resume:
+            threading.Thread(target=_import_all, args=(modules,), name='preload', daemon=True).start()
+
+    def _call(self, stage: Stage, key: str, args: List[Any]) -> Tuple[Any, Optional[str]]:
+        """Run a stage and save its result in the same thread."""
+        with get_tracer().span(stage.name, 'stage'):
+            return self._save(stage, key, stage.func(*args))
+
+    def _save(self, stage: Stage, key: str, result: Any) -> Tuple[Any, Optional[str]]:
+        if stage.checkpoint is None or self.checkpoints is None:
+            return result, None
+        return self.checkpoints.save(stage.name, key, stage.checkpoint, result)
+
+    def _record(self, stage: Stage, start: Optional[float], end: Optional[float], status: str):
+        self.timings.append({
+            'stage': stage.name,
+            'deps': stage.deps,
+            'start_s': round(start - self._run_start, 4) if start is not None else None,
+            'end_s': round(end - self._run_start, 4) if end is not None else None,
+            'duration_s': round(end - start, 4) if start is not None else None,
+            'status': status
+        })
+
+    def total_seconds(self) -> float:
+        """Wall time of the last run (first stage start to last stage end)."""
+        return max((t['end_s'] for t in self.timings if t['end_s'] is not None), default=0.0)
+
+    def ordered_timings(self) -> List[Dict[str, Any]]:
+        """Timings of the last run by start time, stages that did not run last."""
+        return sorted(self.timings, key=lambda t: (t['start_s'] is None, t['start_s'] or 0.0))
+
+    def write_timings(self, path: str) -> str:
+        """
+        Write per-stage timings of the last run as JSON.
+
+        Returns:
+            Path of the written file
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                'total_s': round(self.total_seconds(), 4),
+                'stages': self.ordered_timings()
+            }, f, indent=2)
+        return str(path)
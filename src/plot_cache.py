@@ -0,0 +1,235 @@
+"""
+Plot Cache Module
+Content-addressed store of rendered plots: each PNG is keyed by a hash of
+the data it draws and how it is drawn, so unchanged charts are reused
+instead of re-rendered and identical charts are stored once, up to a size
+cap beyond which the least recently used are evicted
+"""
+import os
+import json
+import shutil
+import hashlib
+import threading
+import contextlib
+from datetime import datetime
+from typing import Any, Dict, List
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: manifest updates are best-effort
+    fcntl = None
+
+
+def _update_fingerprint(hasher, value: Any):
+    """Feed a plot payload (arrays, frames, dicts, lists, scalars) into a hash."""
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            value = value.astype(str)
+        hasher.update(f"ndarray:{value.dtype.str}:{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, pd.DataFrame):
+        hasher.update(b"frame:")
+        _update_fingerprint(hasher, [list(map(str, value.index)), list(map(str, value.columns))])
+        _update_fingerprint(hasher, value.to_numpy(dtype=np.float64))
+    elif isinstance(value, dict):
+        hasher.update(b"dict:")
+        for key in sorted(value, key=str):
+            hasher.update(json.dumps(str(key)).encode())
+            _update_fingerprint(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"list:{len(value)}:".encode())
+        for item in value:
+            _update_fingerprint(hasher, item)
+    else:
+        hasher.update(json.dumps(value, default=str).encode())
+    hasher.update(b";")
+
+
+def plot_key(plot_type: str, title: str, columns: List[Any], data: Dict[str, Any],
+             settings: Dict[str, Any]) -> str:
+    """
+    Content key of one chart.
+
+    Args:
+        plot_type: Plot type (histogram, boxplot, ...)
+        title: Plot title
+        columns: Columns the plot draws
+        data: Plot payload (bin counts, box statistics, points, matrix, ...)
+        settings: Everything else that changes the pixels (style, dpi,
+            renderer version, Matplotlib version)
+
+    Returns:
+        Hex digest identifying the rendered PNG
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    _update_fingerprint(hasher, {'type': plot_type, 'title': title,
+                                 'columns': [str(col) for col in columns], 'settings': settings})
+    _update_fingerprint(hasher, data)
+    return hasher.hexdigest()
+
+
+def copy_atomic(source: str, destination: str):
+    """
+    Copy source to destination so readers never see a partial file.
+
+    A copy rather than a hard link: editing an output plot in place must not
+    change the cached one (or every other output sharing it).
+    """
+    tmp = f"{destination}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, destination)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class PlotCache:
+    """Directory of rendered plots named by content key, with an LRU-evicted JSON manifest"""
+
+    def __init__(self, cache_dir: str = ".cache/plots", max_bytes: int = 500 * 1024**2):
+        """
+        Initialize plot cache.
+
+        Args:
+            cache_dir: Directory holding the cached PNGs and manifest.json; it can
+                be shared by every run and dataset (including batch workers)
+            max_bytes: Total size of cached PNGs before least recently used
+                ones are evicted (checked when the manifest is flushed)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self.lock_path = os.path.join(cache_dir, "manifest.lock")
+        self.hits = 0
+        self.misses = 0
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """Location of the cached PNG for a key."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.png")
+
+    def fetch(self, key: str, destination: str) -> bool:
+        """
+        Copy the cached plot for a key to destination.
+
+        Returns:
+            True on a hit; False if the plot has to be rendered
+        """
+        cached = self.path(key)
+        with self._lock:
+            try:
+                if os.path.exists(destination):
+                    # Output names contain the key, so an existing file already has this content
+                    if not os.path.exists(cached):
+                        os.makedirs(os.path.dirname(cached), exist_ok=True)
+                        copy_atomic(destination, cached)
+                        self._pending[key] = self._entry(cached, {})
+                else:
+                    copy_atomic(cached, destination)
+            except FileNotFoundError:
+                # Not cached, or evicted by another process since the check
+                self.misses += 1
+                return False
+            self.hits += 1
+            self._touch(key)
+        return True
+
+    def store(self, key: str, rendered: str, info: Dict[str, Any]):
+        """
+        Add a freshly rendered plot to the cache.
+
+        Args:
+            key: Content key of the plot
+            rendered: Path of the rendered PNG (copied into the cache)
+            info: Description kept in the manifest (type, title, columns)
+        """
+        cached = self.path(key)
+        with self._lock:
+            os.makedirs(os.path.dirname(cached), exist_ok=True)
+            if not os.path.exists(cached):
+                copy_atomic(rendered, cached)
+            self._pending[key] = self._entry(cached, info)
+
+    def _entry(self, cached: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return {
+            **info,
+            'file': os.path.relpath(cached, self.cache_dir),
+            'bytes': os.path.getsize(cached),
+            'created': now,
+            'last_used': now
+        }
+
+    def _touch(self, key: str):
+        entry = self._pending.setdefault(key, {})
+        entry['last_used'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @contextlib.contextmanager
+    def _manifest_lock(self):
+        """Exclusive lock on the manifest across processes (e.g. batch workers)."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _evict(self, manifest: Dict[str, Any]):
+        """Remove least recently used PNGs (and their entries) until under max_bytes."""
+        total = sum(entry.get('bytes', 0) for entry in manifest.values())
+        if total <= self.max_bytes:
+            return
+
+        for key in sorted(manifest, key=lambda key: manifest[key].get('last_used', '')):
+            if total <= self.max_bytes:
+                break
+            entry = manifest.pop(key)
+            total -= entry.get('bytes', 0)
+            try:
+                os.remove(os.path.join(self.cache_dir, entry['file']))
+            except (OSError, KeyError):
+                pass
+
+    def flush(self):
+        """
+        Merge this run's new and reused entries into manifest.json and evict
+        least recently used plots beyond max_bytes.
+
+        The read-merge-evict-write holds a file lock, so processes sharing the
+        cache keep each other's entries; without fcntl (Windows) the merge is
+        best-effort and a concurrent flush can drop entries. A PNG whose entry
+        was dropped is still served (lookups go by file name) but is not
+        counted towards max_bytes.
+        """
+        with self._lock, self._manifest_lock():
+            if not self._pending:
+                return
+            # Re-read under the lock, so entries from other processes are kept
+            manifest = self._read_manifest()
+            for key, entry in self._pending.items():
+                if key in manifest:
+                    manifest[key].update({'last_used': entry['last_used']})
+                elif 'file' in entry:
+                    manifest[key] = entry
+            self._evict(manifest)
+            tmp = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(manifest, f, indent=2, default=str)
+            os.replace(tmp, self.manifest_path)
+            self._pending = {}
@@ -0,0 +1,163 @@
+"""
+Plotting Module
+Renders plot tasks prepared by DataVisualizer with Matplotlib's
+object-oriented Figure/Agg API, so plots can be drawn concurrently in
+worker processes without sharing pyplot's global figure state
+"""
+import matplotlib
+# Plots are only saved to files; choosing Agg up front skips the search for a GUI backend
+matplotlib.use('Agg')
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import os
+import numpy as np
+import seaborn as sns
+from typing import Any, Dict, Tuple
+from instrumentation import span
+
+
+def apply_style(style: Dict[str, Any]):
+    """
+    Set the report plot style (affects every figure created afterwards in this process).
+
+    Args:
+        style: Seaborn style name under 'seaborn'; every other key is an rcParam
+    """
+    sns.set_style(style['seaborn'])
+    for name, value in style.items():
+        if name != 'seaborn':
+            matplotlib.rcParams[name] = value
+
+
+def _new_figure(figsize: Tuple[float, float]):
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def _save(fig: Figure, path: str, dpi: int):
+    fig.tight_layout()
+    # Written under a temporary name, so a plot file that exists is always complete
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with span('savefig', 'io'):
+        fig.savefig(tmp, dpi=dpi, bbox_inches='tight', format='png')
+    os.replace(tmp, path)
+
+
+def _histogram(task: Dict[str, Any]):
+    edges = np.asarray(task['data']['edges'])
+    fig, ax = _new_figure((10, 6))
+    # One weighted value per bin draws the precomputed counts as ordinary histogram bars
+    ax.hist(edges[:-1], bins=edges, weights=task['data']['counts'],
+            edgecolor='black', alpha=0.7, color='skyblue')
+
+    ax.set_title(task['title'])
+    ax.set_xlabel(task['columns'][0])
+    ax.set_ylabel('Frequency')
+    ax.grid(axis='y', alpha=0.3)
+
+    # Add mean and median lines
+    mean_val = task['data']['mean']
+    median_val = task['data']['median']
+    ax.axvline(mean_val, color='red', linestyle='--', label=f'Mean: {mean_val:.2f}')
+    ax.axvline(median_val, color='green', linestyle='--', label=f'Median: {median_val:.2f}')
+    ax.legend()
+    return fig
+
+
+def _boxplot(task: Dict[str, Any]):
+    fig, ax = _new_figure((10, 6))
+    # bxp draws from precomputed quartiles, whisker ends and outliers
+    ax.bxp([task['data']], patch_artist=True,
+           boxprops=dict(facecolor='lightblue', alpha=0.7),
+           medianprops=dict(color='red', linewidth=2))
+
+    ax.set_title(task['title'])
+    ax.set_ylabel(task['columns'][0])
+    ax.grid(axis='y', alpha=0.3)
+    return fig
+
+
+def _bar(task: Dict[str, Any]):
+    col = task['columns'][0]
+    labels = [str(label) for label in task['data']['labels']]
+    counts = task['data']['counts']
+    positions = np.arange(len(counts))
+    fig, ax = _new_figure((12, 6))
+
+    # Use horizontal bar if many categories
+    if len(counts) > 10:
+        ax.barh(positions, counts, height=0.5, color='steelblue', alpha=0.8)
+        ax.set_yticks(positions, labels)
+        ax.set_xlabel('Count')
+        ax.set_ylabel(col)
+    else:
+        ax.bar(positions, counts, width=0.5, color='steelblue', alpha=0.8)
+        ax.set_xticks(positions, labels, rotation=45, ha='right')
+        ax.set_xlabel(col)
+        ax.set_ylabel('Count')
+
+    ax.set_title(task['title'])
+    ax.grid(axis='y' if len(counts) <= 10 else 'x', alpha=0.3)
+    return fig
+
+
+def _scatter(task: Dict[str, Any]):
+    data = task['data']
+    fig, ax = _new_figure((10, 6))
+    if 'counts' in data:
+        # Too many points to draw one by one: shade a grid of point counts instead
+        counts = np.ma.masked_equal(data['counts'].T, 0)
+        mesh = ax.pcolormesh(data['x_edges'], data['y_edges'], counts,
+                             cmap='Blues', norm=LogNorm(vmin=1, vmax=max(counts.max(), 1)))
+        fig.colorbar(mesh, ax=ax, label=f"Rows per bin ({data['points']:,} rows)")
+    else:
+        ax.scatter(data['x'], data['y'], alpha=0.5, s=30, color='steelblue')
+
+    # Add regression line
+    if data['line'] is not None:
+        ax.plot(data['line']['line_x'], data['line']['line_y'], "r--", alpha=0.8, linewidth=2)
+
+    ax.set_title(task['title'])
+    ax.set_xlabel(task['columns'][0])
+    ax.set_ylabel(task['columns'][1])
+    ax.grid(alpha=0.3)
+    return fig
+
+
+def _correlation_heatmap(task: Dict[str, Any]):
+    corr_matrix = task['data']['matrix']
+    fig, ax = _new_figure((12, 10))
+
+    mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
+    sns.heatmap(corr_matrix, mask=mask, annot=True, fmt='.2f',
+                cmap='coolwarm', center=0, square=True,
+                linewidths=1, cbar_kws={"shrink": 0.8}, ax=ax)
+
+    ax.set_title(task['title'])
+    return fig
+
+
+RENDERERS = {
+    'histogram': _histogram,
+    'boxplot': _boxplot,
+    'bar': _bar,
+    'scatter': _scatter,
+    'correlation_heatmap': _correlation_heatmap
+}
+
+
+def render(task: Dict[str, Any]) -> str:
+    """
+    Draw a plot task and write it to its PNG file.
+
+    Args:
+        task: Plot task from DataVisualizer (type, title, columns, data, dpi, path)
+
+    Returns:
+        Path of the written file
+    """
+    fig = RENDERERS[task['type']](task)
+    _save(fig, task['path'], task['dpi'])
+    return task['path']
@@ -0,0 +1,231 @@
+"""
+Streaming Profiler Module
+Builds the initial data profile incrementally from bounded CSV chunks
+so peak memory stays flat regardless of file size
+"""
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional, List
+from sketches import HyperLogLog, NumericSketch, hash_values
+from duplicates import DuplicateDetector
+
+
+class StreamingProfiler:
+    """Accumulates the initial data profile one chunk at a time"""
+
+    def __init__(self, sample_rows: int = 200000, max_tracked_distinct: int = 100000,
+                 n_sample_values: int = 5, seed: int = 42,
+                 quantile_accuracy: Optional[float] = None,
+                 duplicate_subset: Optional[List[str]] = None):
+        """
+        Initialize streaming profiler.
+
+        Args:
+            sample_rows: Size of the uniform row sample kept for downstream stages
+            max_tracked_distinct: Distinct values tracked exactly per column before
+                the unique count switches to a HyperLogLog estimate
+            n_sample_values: Number of example values kept per column
+            seed: Random seed for the row sample
+            quantile_accuracy: If set, also sketch every numeric column over the
+                whole file (moments plus KLL quantiles of this rank error)
+            duplicate_subset: Optional columns for near-duplicate detection
+        """
+        self.sample_rows = sample_rows
+        self.max_tracked_distinct = max_tracked_distinct
+        self.n_sample_values = n_sample_values
+        self.quantile_accuracy = quantile_accuracy
+        self._rng = np.random.default_rng(seed)
+
+        self.n_rows = 0
+        self.memory_bytes = 0
+        self.columns: List[str] = []
+        self._dtypes: Dict[str, List[Any]] = {}
+        self._null_counts: Dict[str, int] = {}
+        self._min: Dict[str, Optional[float]] = {}
+        self._max: Dict[str, Optional[float]] = {}
+        self._distinct: Dict[str, np.ndarray] = {}
+        self._distinct_saturated: Dict[str, bool] = {}
+        self._hll: Dict[str, HyperLogLog] = {}
+        self._sample_values: Dict[str, List[str]] = {}
+        # None marks a column that stopped being numeric partway through the file
+        self._numeric_sketches: Dict[str, Optional[NumericSketch]] = {}
+
+        self.duplicates = DuplicateDetector(duplicate_subset)
+
+        self._sample: Optional[pd.DataFrame] = None
+        self._sample_keys: Optional[np.ndarray] = None
+
+    def update(self, chunk: pd.DataFrame):
+        """
+        Fold one chunk into the running profile.
+
+        Args:
+            chunk: Next block of rows from the CSV reader
+        """
+        if not self.columns:
+            self.columns = list(chunk.columns)
+            for col in self.columns:
+                self._dtypes[col] = []
+                self._null_counts[col] = 0
+                self._min[col] = None
+                self._max[col] = None
+                self._distinct[col] = np.empty(0, dtype=np.uint64)
+                self._distinct_saturated[col] = False
+                self._hll[col] = HyperLogLog()
+                self._sample_values[col] = []
+                if self.quantile_accuracy:
+                    self._numeric_sketches[col] = NumericSketch(self.quantile_accuracy)
+
+        self.memory_bytes += int(chunk.memory_usage(deep=True).sum())
+
+        # One vectorized pass for null counts across all columns
+        null_counts = chunk.isna().sum()
+
+        for col in self.columns:
+            col_data = chunk[col]
+            if col_data.dtype not in self._dtypes[col]:
+                self._dtypes[col].append(col_data.dtype)
+            self._null_counts[col] += int(null_counts[col])
+
+            if self._numeric_sketches.get(col) is not None:
+                if pd.api.types.is_numeric_dtype(col_data) and not pd.api.types.is_bool_dtype(col_data):
+                    self._numeric_sketches[col].update(col_data.to_numpy(dtype=np.float64, na_value=np.nan))
+                else:
+                    self._numeric_sketches[col] = None
+
+            non_null = col_data.dropna()
+            if len(non_null) == 0:
+                continue
+
+            if len(self._sample_values[col]) < self.n_sample_values:
+                needed = self.n_sample_values - len(self._sample_values[col])
+                self._sample_values[col].extend(str(v) for v in non_null.head(needed).tolist())
+
+            if pd.api.types.is_numeric_dtype(col_data):
+                chunk_min = float(non_null.min())
+                chunk_max = float(non_null.max())
+                self._min[col] = chunk_min if self._min[col] is None else min(self._min[col], chunk_min)
+                self._max[col] = chunk_max if self._max[col] is None else max(self._max[col], chunk_max)
+
+            # Exact distinct tracking up to a cap, with a sketch to take over past it
+            hashes = hash_values(non_null)
+            self._hll[col].add_hashes(hashes)
+            if not self._distinct_saturated[col]:
+                merged = np.union1d(self._distinct[col], hashes)
+                if len(merged) > self.max_tracked_distinct:
+                    self._distinct_saturated[col] = True
+                    self._distinct[col] = np.empty(0, dtype=np.uint64)
+                else:
+                    self._distinct[col] = merged
+
+        self.duplicates.update(chunk)
+        self._update_sample(chunk)
+        self.n_rows += len(chunk)
+
+    def _update_sample(self, chunk: pd.DataFrame):
+        """Keep a uniform row sample by retaining the rows with the smallest random keys."""
+        if self.sample_rows <= 0 or len(chunk) == 0:
+            return
+
+        keys = self._rng.random(len(chunk))
+        chunk = chunk.set_axis(pd.RangeIndex(self.n_rows, self.n_rows + len(chunk)))
+
+        if self._sample is None:
+            candidates, candidate_keys = chunk, keys
+        else:
+            candidates = pd.concat([self._sample, chunk])
+            candidate_keys = np.concatenate([self._sample_keys, keys])
+
+        if len(candidates) > self.sample_rows:
+            keep = np.argpartition(candidate_keys, self.sample_rows - 1)[:self.sample_rows]
+            candidates = candidates.iloc[keep]
+            candidate_keys = candidate_keys[keep]
+
+        self._sample = candidates
+        self._sample_keys = candidate_keys
+
+    def get_sample(self) -> pd.DataFrame:
+        """
+        Get the row sample in original file order.
+
+        Returns:
+            Sampled DataFrame (empty if no rows were seen)
+        """
+        if self._sample is None:
+            return pd.DataFrame(columns=self.columns)
+        return self._sample.sort_index()
+
+    def get_numeric_sketches(self) -> Dict[str, NumericSketch]:
+        """
+        Get whole-file sketches of the columns that were numeric in every chunk.
+
+        Returns:
+            Dictionary mapping column name to NumericSketch (empty unless
+            quantile_accuracy was set)
+        """
+        return {col: sketch for col, sketch in self._numeric_sketches.items() if sketch is not None}
+
+    def _resolve_dtype(self, col: str) -> Any:
+        """Reconcile per-chunk dtypes into the dtype the full column would have."""
+        dtypes = self._dtypes[col]
+        if len(dtypes) == 1:
+            return dtypes[0]
+        if all(isinstance(d, np.dtype) and d.kind in 'biuf' for d in dtypes):
+            return np.result_type(*dtypes)
+        return np.dtype(object)
+
+    def get_profile(self, filename: str) -> Dict[str, Any]:
+        """
+        Build the profile in the same shape as DataLoader.get_initial_profile.
+
+        Args:
+            filename: Name of the profiled file
+
+        Returns:
+            Dictionary with dataset overview
+        """
+        n_rows = self.n_rows
+        profile = {
+            'filename': filename,
+            'shape': {
+                'rows': int(n_rows),
+                'columns': int(len(self.columns))
+            },
+            'columns': {},
+            'missing_summary': {},
+            'memory_usage_mb': float(self.memory_bytes / 1024**2),
+            'streamed': True
+        }
+
+        for col in self.columns:
+            null_count = self._null_counts[col]
+            dtype = self._resolve_dtype(col)
+            if self._distinct_saturated[col]:
+                unique_count = min(round(self._hll[col].estimate()), n_rows - null_count)
+            else:
+                unique_count = len(self._distinct[col])
+            profile['columns'][col] = {
+                'dtype': str(dtype),
+                'non_null_count': int(n_rows - null_count),
+                'null_count': int(null_count),
+                'null_percentage': float(null_count / n_rows * 100) if n_rows else 0.0,
+                'unique_count': int(unique_count),
+                'sample_values': self._sample_values[col]
+            }
+            if self._distinct_saturated[col]:
+                profile['columns'][col]['unique_count_is_estimate'] = True
+                profile['columns'][col]['unique_count_relative_error'] = round(self._hll[col].relative_error, 4)
+
+            if pd.api.types.is_numeric_dtype(dtype):
+                profile['columns'][col]['min'] = self._min[col]
+                profile['columns'][col]['max'] = self._max[col]
+
+        total_cells = n_rows * len(self.columns)
+        missing_cells = sum(self._null_counts.values())
+        profile['missing_summary'] = {
+            'total_missing_cells': int(missing_cells),
+            'total_cells': int(total_cells),
+            'missing_percentage': float(missing_cells / total_cells * 100) if total_cells else 0.0
+        }
+
+        return profile
@@ -3,12 +3,22 @@ Report Builder Module
 Assembles all components into beautiful HTML and Markdown reports
 """
 import os
+import re
 import json
 from typing import Dict, Any, List
 from datetime import datetime
 from pathlib import Path
 import base64
 
+# Inline renderer for interactive charts (chart data files written by DataVisualizer)
+CHART_SCRIPT_PATH = Path(__file__).with_name('charts.js')
+
+
+def plot_display_name(plot_path: str) -> str:
+    """Readable plot name from its file name, without the content-hash suffix."""
+    stem = re.sub(r'_[0-9a-f]{10}$', '', Path(plot_path).stem)
+    return stem.replace('_', ' ').title()
+
 
 class ReportBuilder:
     """Builds final EDA reports in multiple formats"""
@@ -25,7 +35,8 @@ class ReportBuilder:
     
     def build_reports(self, dataset_name: str, profile: Dict[str, Any],
                      analysis_results: Dict[str, Any], insights: Dict[str, Any],
-                     plot_paths: List[str], summary: str = None) -> Dict[str, str]:
+                     plot_paths: List[str], summary: str = None,
+                     performance: Dict[str, Any] = None) -> Dict[str, str]:
         """
         Build both HTML and Markdown reports.
         
@@ -36,6 +47,7 @@ class ReportBuilder:
             insights: LLM-generated insights
             plot_paths: List of paths to plot images
             summary: Executive summary
+            performance: Optional run timings (Tracer.summary()) for a performance section
         
         Returns:
             Dictionary with paths to generated reports
@@ -43,175 +55,146 @@ class ReportBuilder:
         print("\n📄 Building reports...")
         
         # Generate both formats
-        html_path = self._build_html_report(
-            dataset_name, profile, analysis_results, insights, plot_paths, summary
+        html_path = self.build_html(
+            dataset_name, profile, analysis_results, insights, plot_paths, summary, performance
         )
         
-        md_path = self._build_markdown_report(
-            dataset_name, profile, analysis_results, insights, plot_paths, summary
+        md_path = self.build_markdown(
+            dataset_name, profile, analysis_results, insights, plot_paths, summary, performance
         )
         
-        print(f"   ✅ HTML report: {html_path}")
-        print(f"   ✅ Markdown report: {md_path}")
-        
         return {
             'html': html_path,
             'markdown': md_path
         }
     
+    def build_html(self, dataset_name: str, profile: Dict[str, Any],
+                   analysis_results: Dict[str, Any], insights: Dict[str, Any],
+                   plot_paths: List[str], summary: str = None,
+                   performance: Dict[str, Any] = None) -> str:
+        """Build only the HTML report (same arguments as build_reports)."""
+        html_path = self._build_html_report(
+            dataset_name, profile, analysis_results, insights, plot_paths, summary, performance
+        )
+        print(f"   ✅ HTML report: {html_path}")
+        return html_path
+    
+    def build_markdown(self, dataset_name: str, profile: Dict[str, Any],
+                       analysis_results: Dict[str, Any], insights: Dict[str, Any],
+                       plot_paths: List[str], summary: str = None,
+                       performance: Dict[str, Any] = None) -> str:
+        """Build only the Markdown report (same arguments as build_reports)."""
+        md_path = self._build_markdown_report(
+            dataset_name, profile, analysis_results, insights, plot_paths, summary, performance
+        )
+        print(f"   ✅ Markdown report: {md_path}")
+        return md_path
+    
+    def build_index(self, entries: List[Dict[str, Any]], title: str = "Batch EDA Index") -> str:
+        """
+        Build an HTML index linking the reports of a batch run.
+        
+        Args:
+            entries: One dict per dataset with dataset, csv, status, rows,
+                columns, plots, insights, duration_s, reports and error
+            title: Page heading
+        
+        Returns:
+            Path of the written index.html
+        """
+        n_failed = sum(1 for entry in entries if entry['status'] != 'ok')
+        
+        html_content = self._html_head(title) + f"""<body>
+    <div class="header">
+        <h1>🗂️ {title}</h1>
+        <p><strong>Datasets:</strong> {len(entries)} ({len(entries) - n_failed} succeeded, {n_failed} failed)</p>
+        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+    </div>
+
+    <div class="section">
+        <h2>📋 Reports</h2>
+        <table>
+            <tr>
+                <th>Dataset</th>
+                <th>Rows</th>
+                <th>Columns</th>
+                <th>Plots</th>
+                <th>Insights</th>
+                <th>Time</th>
+                <th>Reports</th>
+            </tr>
+"""
+        
+        for entry in entries:
+            if entry['status'] == 'ok':
+                links = " · ".join(
+                    f'<a href="{os.path.relpath(path, self.output_dir)}">{fmt.upper() if fmt == "html" else fmt.title()}</a>'
+                    for fmt, path in entry['reports'].items()
+                )
+                html_content += f"""            <tr>
+                <td><strong>{entry['dataset']}</strong></td>
+                <td>{entry['rows']:,}</td>
+                <td>{entry['columns']}</td>
+                <td>{entry['plots']}</td>
+                <td>{entry['insights']}</td>
+                <td>{entry['duration_s']:.1f}s</td>
+                <td>{links}</td>
+            </tr>
+"""
+            else:
+                html_content += f"""            <tr>
+                <td><strong>{entry['dataset']}</strong></td>
+                <td colspan="5"><div class="warning">❌ {entry.get('error', 'failed')}</div></td>
+                <td>{entry['duration_s']:.1f}s</td>
+            </tr>
+"""
+        
+        html_content += """        </table>
+    </div>
+
+    <div class="footer">
+        <p>Generated by AutoGen-EDA | LLM-Assisted Exploratory Data Analysis</p>
+    </div>
+</body>
+</html>
+"""
+        
+        index_path = os.path.join(self.output_dir, "index.html")
+        with open(index_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        print(f"   ✅ Batch index: {index_path}")
+        return index_path
+    
     def _build_html_report(self, dataset_name: str, profile: Dict[str, Any],
                           analysis_results: Dict[str, Any], insights: Dict[str, Any],
-                          plot_paths: List[str], summary: str = None) -> str:
+                          plot_paths: List[str], summary: str = None,
+                          performance: Dict[str, Any] = None) -> str:
         """Build HTML report."""
         
-        # Read plots as base64 for embedding
+        # Read plots as base64 for embedding; chart data files are drawn by the chart script
         embedded_plots = []
+        charts = []
         for plot_path in plot_paths:
             try:
+                if plot_path.endswith('.json'):
+                    with open(plot_path, 'r', encoding='utf-8') as f:
+                        charts.append(json.load(f))
+                    embedded_plots.append({
+                        'name': plot_display_name(plot_path),
+                        'chart': len(charts) - 1
+                    })
+                    continue
                 with open(plot_path, 'rb') as f:
                     img_data = base64.b64encode(f.read()).decode()
                     embedded_plots.append({
-                        'name': Path(plot_path).stem.replace('_', ' ').title(),
+                        'name': plot_display_name(plot_path),
                         'data': img_data
                     })
             except Exception as e:
                 print(f"   ⚠️  Error embedding plot {plot_path}: {e}")
         
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>EDA Report - {dataset_name}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }}
-        .header h1 {{
-            margin: 0 0 10px 0;
-            font-size: 2.5em;
-        }}
-        .header p {{
-            margin: 0;
-            opacity: 0.9;
-            font-size: 1.1em;
-        }}
-        .section {{
-            background: white;
-            padding: 30px;
-            margin-bottom: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h2 {{
-            color: #667eea;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-            margin-top: 0;
-        }}
-        h3 {{
-            color: #764ba2;
-            margin-top: 25px;
-        }}
-        .metric {{
-            display: inline-block;
-            background: #f8f9fa;
-            padding: 15px 25px;
-            margin: 10px 10px 10px 0;
-            border-radius: 5px;
-            border-left: 4px solid #667eea;
-        }}
-        .metric-label {{
-            font-size: 0.9em;
-            color: #666;
-            display: block;
-        }}
-        .metric-value {{
-            font-size: 1.8em;
-            font-weight: bold;
-            color: #333;
-        }}
-        ul {{
-            line-height: 1.8;
-        }}
-        li {{
-            margin-bottom: 10px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background: #667eea;
-            color: white;
-            font-weight: 600;
-        }}
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        .plot {{
-            margin: 30px 0;
-            text-align: center;
-        }}
-        .plot img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 5px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .plot-title {{
-            font-size: 1.1em;
-            color: #666;
-            margin-bottom: 10px;
-            font-weight: 500;
-        }}
-        .insight {{
-            background: #e3f2fd;
-            border-left: 4px solid #2196f3;
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 4px;
-        }}
-        .warning {{
-            background: #fff3e0;
-            border-left: 4px solid #ff9800;
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 4px;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            color: #666;
-            font-size: 0.9em;
-        }}
-        code {{
-            background: #f4f4f4;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-    </style>
-</head>
-<body>
+        html_content = self._html_head(f"EDA Report - {dataset_name}") + f"""<body>
     <div class="header">
         <h1>📊 Exploratory Data Analysis Report</h1>
         <p><strong>Dataset:</strong> {dataset_name}</p>
@@ -249,7 +232,15 @@ class ReportBuilder:
             <span class="metric-label">Duplicate Rows</span>
             <span class="metric-value">{overview.get('duplicate_rows', 0):,}</span>
         </div>
-    </div>
+"""
+        if 'sample_rows' in overview:
+            html_content += f"""        <div class="metric">
+            <span class="metric-label">Analysis Sample</span>
+            <span class="metric-value">{overview['sample_rows']:,} rows</span>
+        </div>
+        <p>{self._sample_note(overview)}</p>
+"""
+        html_content += """    </div>
 """
         
         # Key Insights
@@ -329,12 +320,18 @@ class ReportBuilder:
         <h2>📊 Visualizations</h2>
 """
             for plot in embedded_plots:
+                if 'chart' in plot:
+                    body = f'<div class="chart" data-chart="{plot["chart"]}"></div>'
+                else:
+                    body = f'<img src="data:image/png;base64,{plot["data"]}" alt="{plot["name"]}">'
                 html_content += f"""
         <div class="plot">
             <div class="plot-title">{plot['name']}</div>
-            <img src="data:image/png;base64,{plot['data']}" alt="{plot['name']}">
+            {body}
         </div>
 """
+            if charts:
+                html_content += self._chart_scripts(charts)
             html_content += "    </div>\n"
         
         # Limitations
@@ -351,6 +348,10 @@ class ReportBuilder:
         
         html_content += "        </ul>\n    </div>\n"
         
+        # Performance
+        if performance and performance.get('stages'):
+            html_content += self._performance_html(performance)
+        
         # Footer
         html_content += """
     <div class="footer">
@@ -367,9 +368,266 @@ class ReportBuilder:
         
         return html_path
     
+    @staticmethod
+    def _html_head(title: str) -> str:
+        """Document head and stylesheet shared by the reports and the batch index."""
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }}
+        .header {{
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+        }}
+        .header h1 {{
+            margin: 0 0 10px 0;
+            font-size: 2.5em;
+        }}
+        .header p {{
+            margin: 0;
+            opacity: 0.9;
+            font-size: 1.1em;
+        }}
+        .section {{
+            background: white;
+            padding: 30px;
+            margin-bottom: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        h2 {{
+            color: #667eea;
+            border-bottom: 3px solid #667eea;
+            padding-bottom: 10px;
+            margin-top: 0;
+        }}
+        h3 {{
+            color: #764ba2;
+            margin-top: 25px;
+        }}
+        .metric {{
+            display: inline-block;
+            background: #f8f9fa;
+            padding: 15px 25px;
+            margin: 10px 10px 10px 0;
+            border-radius: 5px;
+            border-left: 4px solid #667eea;
+        }}
+        .metric-label {{
+            font-size: 0.9em;
+            color: #666;
+            display: block;
+        }}
+        .metric-value {{
+            font-size: 1.8em;
+            font-weight: bold;
+            color: #333;
+        }}
+        ul {{
+            line-height: 1.8;
+        }}
+        li {{
+            margin-bottom: 10px;
+        }}
+        table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }}
+        th, td {{
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }}
+        th {{
+            background: #667eea;
+            color: white;
+            font-weight: 600;
+        }}
+        tr:hover {{
+            background: #f8f9fa;
+        }}
+        .plot {{
+            margin: 30px 0;
+            text-align: center;
+        }}
+        .plot img {{
+            max-width: 100%;
+            height: auto;
+            border-radius: 5px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }}
+        .chart svg {{
+            max-width: 100%;
+            height: auto;
+        }}
+        .chart-controls {{
+            color: #666;
+            font-size: 0.9em;
+        }}
+        .chart-controls label {{
+            margin: 0 10px;
+        }}
+        .plot-title {{
+            font-size: 1.1em;
+            color: #666;
+            margin-bottom: 10px;
+            font-weight: 500;
+        }}
+        .insight {{
+            background: #e3f2fd;
+            border-left: 4px solid #2196f3;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 4px;
+        }}
+        .warning {{
+            background: #fff3e0;
+            border-left: 4px solid #ff9800;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 4px;
+        }}
+        .footer {{
+            text-align: center;
+            padding: 20px;
+            color: #666;
+            font-size: 0.9em;
+        }}
+        code {{
+            background: #f4f4f4;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+        }}
+    </style>
+</head>
+"""
+    
+    @staticmethod
+    def _sample_note(overview: Dict[str, Any]) -> str:
+        """What a streamed run computed over the whole file and what over its row sample."""
+        names = {'categorical_analysis': 'category frequencies', 'numeric_analysis': 'numeric statistics',
+                 'relationships': 'correlations'}
+        sampled = [names.get(section, section) for section in overview.get('sampled_sections', [])]
+        return (f"Row, missing-value, distinct and duplicate counts cover all {overview.get('total_rows', 0):,} "
+                f"rows; {' and '.join(filter(None, [', '.join(sampled[:-1]), sampled[-1]]))} use a uniform sample of "
+                f"{overview['sample_rows']:,} rows.")
+    
+    @staticmethod
+    def _chart_scripts(charts: List[Dict[str, Any]]) -> str:
+        """Chart data as an inline JSON block, followed by the script that draws it."""
+        # "</" would end the script element early if a label contained "</script>"
+        data = json.dumps(charts, separators=(',', ':')).replace('</', '<\\/')
+        script = CHART_SCRIPT_PATH.read_text(encoding='utf-8')
+        return f"""
+        <script type="application/json" id="eda-chart-data">{data}</script>
+        <script>
+{script}
+        </script>
+"""
+    
+    @staticmethod
+    def _format_cell(value: Any, fmt: str = '{:,}') -> str:
+        return fmt.format(value) if value is not None else '–'
+    
+    def _performance_rows(self, performance: Dict[str, Any]) -> Dict[str, List[List[str]]]:
+        """Table cells of the performance section, shared by both report formats."""
+        stage_rows = []
+        for row in performance['stages']:
+            if row['status'] == 'restored':
+                stage_rows.append([row['stage'], 'restored from checkpoint', '–', '–', '–', '–'])
+                continue
+            stage_rows.append([
+                row['stage'],
+                f"{row['wall_s']:.2f}s",
+                self._format_cell(row['thread_cpu_s'], '{:.2f}s'),
+                self._format_cell(row['process_peak_rss_mb'], '{:,.0f} MB'),
+                self._format_cell(row['rows']),
+                self._format_cell(row['columns'])
+            ])
+        
+        step_rows = [
+            [row['step'], row['cat'], f"{row['wall_s']:.3f}s", self._format_cell(row['thread_cpu_s'], '{:.3f}s')]
+            for row in performance.get('slowest_steps', [])
+        ]
+        
+        category_rows = [
+            [cat, f"{total['count']:,}", f"{total['wall_s']:.2f}s", f"{total['thread_cpu_s']:.2f}s"]
+            for cat, total in sorted(performance.get('categories', {}).items(),
+                                     key=lambda item: -item[1]['wall_s'])
+        ]
+        return {'stages': stage_rows, 'steps': step_rows, 'categories': category_rows}
+    
+    def _performance_html(self, performance: Dict[str, Any]) -> str:
+        tables = self._performance_rows(performance)
+        
+        def table(headers: List[str], rows: List[List[str]]) -> str:
+            html = "        <table>\n            <tr>" + "".join(f"<th>{h}</th>" for h in headers) + "</tr>\n"
+            for row in rows:
+                html += "            <tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>\n"
+            return html + "        </table>\n"
+        
+        html_content = """
+    <div class="section">
+        <h2>⏱️ Performance</h2>
+        <p>Wall time, CPU time of the stage's own thread, the process's peak resident
+        memory so far and data size of each pipeline stage. Work handed to worker pools
+        is not in the thread CPU figure, and the peak RSS covers everything that ran
+        before or alongside the stage. Stages overlap, so wall times do not add up to
+        the run time.</p>
+"""
+        html_content += table(['Stage', 'Wall', 'Thread CPU', 'Process Peak RSS So Far', 'Rows', 'Columns'], tables['stages'])
+        if tables['steps']:
+            html_content += "        <h3>Slowest Steps</h3>\n"
+            html_content += table(['Step', 'Kind', 'Wall', 'Thread CPU'], tables['steps'])
+        if tables['categories']:
+            html_content += "        <h3>Time by Kind of Step</h3>\n"
+            html_content += table(['Kind', 'Count', 'Total Wall', 'Total Thread CPU'], tables['categories'])
+        html_content += "    </div>\n"
+        return html_content
+    
+    def _performance_markdown(self, performance: Dict[str, Any]) -> str:
+        tables = self._performance_rows(performance)
+        
+        def table(headers: List[str], rows: List[List[str]]) -> str:
+            md = "| " + " | ".join(headers) + " |\n|" + "|".join("---" for _ in headers) + "|\n"
+            for row in rows:
+                md += "| " + " | ".join(str(cell).replace('|', '\\|') for cell in row) + " |\n"
+            return md + "\n"
+        
+        md_content = "\n## ⏱️ Performance\n\n"
+        md_content += ("Thread CPU counts only the stage's own thread, not work handed to worker pools; "
+                       "peak RSS is the process's high-water mark so far, covering everything that ran "
+                       "before or alongside the stage. "
+                       "Stages overlap, so wall times do not add up to the run time.\n\n")
+        md_content += table(['Stage', 'Wall', 'Thread CPU', 'Process Peak RSS So Far', 'Rows', 'Columns'], tables['stages'])
+        if tables['steps']:
+            md_content += "### Slowest Steps\n\n"
+            md_content += table(['Step', 'Kind', 'Wall', 'Thread CPU'], tables['steps'])
+        if tables['categories']:
+            md_content += "### Time by Kind of Step\n\n"
+            md_content += table(['Kind', 'Count', 'Total Wall', 'Total Thread CPU'], tables['categories'])
+        return md_content
+    
     def _build_markdown_report(self, dataset_name: str, profile: Dict[str, Any],
                               analysis_results: Dict[str, Any], insights: Dict[str, Any],
-                              plot_paths: List[str], summary: str = None) -> str:
+                              plot_paths: List[str], summary: str = None,
+                              performance: Dict[str, Any] = None) -> str:
         """Build Markdown report."""
         
         md_content = f"""# 📊 Exploratory Data Analysis Report
@@ -399,7 +657,10 @@ class ReportBuilder:
 - **Total Columns:** {overview.get('total_columns', 0)}
 - **Memory Usage:** {overview.get('memory_usage_mb', 0):.2f} MB
 - **Duplicate Rows:** {overview.get('duplicate_rows', 0):,}
-
+"""
+        if 'sample_rows' in overview:
+            md_content += f"- **Analysis Sample:** {overview['sample_rows']:,} rows\n\n{self._sample_note(overview)}\n"
+        md_content += """
 ---
 
 """
@@ -478,9 +739,13 @@ class ReportBuilder:
 
 """
             for plot_path in plot_paths:
-                plot_name = Path(plot_path).stem.replace('_', ' ').title()
+                plot_name = plot_display_name(plot_path)
                 rel_path = Path(plot_path).name
-                md_content += f"### {plot_name}\n\n![{plot_name}]({rel_path})\n\n"
+                if plot_path.endswith('.json'):
+                    # Interactive charts are only drawn in the HTML report
+                    md_content += f"### {plot_name}\n\nInteractive chart; see the HTML report (data: [{rel_path}]({rel_path}))\n\n"
+                else:
+                    md_content += f"### {plot_name}\n\n![{plot_name}]({rel_path})\n\n"
         
         # Limitations
         md_content += """## ⚠️ Limitations & Considerations
@@ -492,6 +757,10 @@ class ReportBuilder:
         for note in insights.get('data_quality_notes', []):
             md_content += f"- {note}\n"
         
+        # Performance
+        if performance and performance.get('stages'):
+            md_content += self._performance_markdown(performance)
+        
         md_content += "\n---\n\n"
         md_content += "*Generated by AutoGen-EDA | LLM-Assisted Exploratory Data Analysis*\n"
         
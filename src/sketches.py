@@ -0,0 +1,416 @@
+"""
+Sketches Module
+Mergeable probabilistic summaries for columns too large to summarize exactly
+"""
+import math
+from typing import Any, Dict, List, Optional, Tuple
+import pandas as pd
+import numpy as np
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """
+    64-bit hashes of the non-null values of a column.
+
+    Numeric values are hashed as float64 so 3 and 3.0 hash alike regardless
+    of the dtype a chunk was parsed with.
+
+    Returns:
+        uint64 array with one hash per non-null value
+    """
+    values = series.dropna()
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        values = values.astype('float64')
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length_32(values: np.ndarray) -> np.ndarray:
+    """Bit length of uint32 values (exact: uint32 fits in a float64 mantissa)."""
+    _, exponent = np.frexp(values.astype(np.float64))
+    return exponent.astype(np.int64)
+
+
+def _leading_zeros_64(values: np.ndarray) -> np.ndarray:
+    """Count leading zero bits of nonzero uint64 values."""
+    high = values >> np.uint64(32)
+    low = values & np.uint64(0xFFFFFFFF)
+    return np.where(high > 0, 32 - _bit_length_32(high), 64 - _bit_length_32(low))
+
+
+def spread_sample(sorted_values: np.ndarray, limit: int) -> List[float]:
+    """Up to limit values spread evenly over sorted values, always keeping both extremes."""
+    if len(sorted_values) > limit:
+        sorted_values = sorted_values[np.unique(np.linspace(0, len(sorted_values) - 1, limit).round().astype(int))]
+    return [float(value) for value in sorted_values]
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count sketch.
+
+    Uses 2**precision one-byte registers; the relative standard error of the
+    estimate is 1.04 / sqrt(2**precision) (about 0.8% at the default
+    precision of 14, i.e. 16 KB per column), and linear counting keeps small
+    cardinalities essentially exact.
+    """
+
+    def __init__(self, precision: int = 14):
+        """
+        Initialize sketch.
+
+        Args:
+            precision: Number of index bits (4-18)
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 18, got {precision}")
+
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of the estimate."""
+        return 1.04 / math.sqrt(self.m)
+
+    def add_hashes(self, hashes: np.ndarray):
+        """Fold an array of uint64 hashes into the sketch."""
+        if len(hashes) == 0:
+            return
+
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        # The guard bit caps the rank at 64 - precision + 1 when the remaining bits are all zero
+        remaining = (hashes << p) | (np.uint64(1) << (p - np.uint64(1)))
+        rank = (_leading_zeros_64(remaining) + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def add_series(self, series: pd.Series):
+        """Fold the non-null values of a column into the sketch."""
+        self.add_hashes(hash_values(series))
+
+    def merge(self, other: 'HyperLogLog'):
+        """Merge another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        """
+        Estimate the number of distinct values added.
+
+        Returns:
+            Estimated distinct count
+        """
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros > 0:
+            # Linear counting is far more accurate in the small range
+            return float(m * math.log(m / zeros))
+        return float(raw)
+
+
+def approx_nunique(series: pd.Series, precision: int = 14) -> int:
+    """
+    Approximate number of distinct non-null values of a column.
+
+    Returns:
+        Estimated distinct count, clamped to the number of non-null values
+    """
+    sketch = HyperLogLog(precision)
+    sketch.add_series(series)
+    return int(min(round(sketch.estimate()), series.count()))
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch.
+
+    Keeps a hierarchy of sorted compactors whose items carry weight 2**level.
+    With parameter k the normalized rank error is about 1.65 / (k / 200) %
+    (roughly 3.3 / k) with high probability, independent of the stream length.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        """
+        Initialize sketch.
+
+        Args:
+            k: Size parameter of the top compactor (larger is more accurate)
+            seed: Random seed for the compaction offsets
+        """
+        self.k = max(8, int(k))
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def for_accuracy(cls, accuracy: float, seed: int = 0) -> 'KLLSketch':
+        """
+        Build a sketch sized for a target normalized rank error.
+
+        Args:
+            accuracy: Target rank error as a fraction (e.g. 0.01 for 1%)
+        """
+        return cls(k=math.ceil(3.3 / accuracy), seed=seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Approximate normalized rank error of the sketch."""
+        return 3.3 / self.k
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values: np.ndarray):
+        """Add a batch of values (NaNs are ignored)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: 'KLLSketch'):
+        """Merge another sketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved exactly
+                leftover = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[:len(items) - len(leftover)]
+                promoted = paired[self._rng.integers(2)::2]
+
+                self.levels[level] = leftover
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def _weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lvl), 2 ** h, dtype=np.float64)
+                                  for h, lvl in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs: List[float]) -> List[float]:
+        """
+        Approximate quantiles.
+
+        Args:
+            qs: Quantile fractions in [0, 1]
+
+        Returns:
+            Estimated value at each quantile (NaN if the sketch is empty)
+        """
+        if self.n == 0:
+            return [float('nan')] * len(qs)
+        items, cumulative = self._weighted_items()
+        total = cumulative[-1]
+        positions = np.searchsorted(cumulative, np.asarray(qs) * total, side='left')
+        return [float(items[min(pos, len(items) - 1)]) for pos in positions]
+
+    def histogram(self, edges: np.ndarray) -> np.ndarray:
+        """Estimated number of values in each bin between consecutive edges."""
+        if self.n == 0:
+            return np.zeros(len(edges) - 1)
+        items, cumulative = self._weighted_items()
+        weights = np.diff(cumulative, prepend=0.0)
+        return np.histogram(items, bins=edges, weights=weights)[0]
+
+    def count_below(self, value: float, inclusive: bool = False) -> float:
+        """Estimated number of values < value (or <= value if inclusive)."""
+        if self.n == 0:
+            return 0.0
+        items, cumulative = self._weighted_items()
+        pos = np.searchsorted(items, value, side='right' if inclusive else 'left')
+        return float(cumulative[pos - 1]) if pos > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'k': self.k, 'n': self.n, 'levels': [lvl.tolist() for lvl in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'KLLSketch':
+        sketch = cls(k=data['k'])
+        sketch.n = data['n']
+        sketch.levels = [np.asarray(lvl, dtype=np.float64) for lvl in data['levels']]
+        return sketch
+
+
+class NumericSketch:
+    """
+    One-pass, mergeable summary of a numeric column.
+
+    Exact count, mean, variance, skewness, kurtosis, min and max (from merged
+    central moments) plus KLL quantiles, so q25/median/q75 and the IQR outlier
+    counts come from a single streaming pass.
+    """
+
+    def __init__(self, accuracy: float = 0.01, seed: int = 0):
+        """
+        Initialize sketch.
+
+        Args:
+            accuracy: Target normalized rank error of the quantiles
+            seed: Random seed for the quantile sketch
+        """
+        self.accuracy = accuracy
+        self.kll = KLLSketch.for_accuracy(accuracy, seed)
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def update(self, values):
+        """Add a batch of values (NaNs are ignored)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        batch = NumericSketch(self.accuracy)
+        batch.n = len(values)
+        batch.mean = float(values.mean())
+        centered = values - batch.mean
+        squared = centered * centered
+        batch.m2 = float(squared.sum())
+        batch.m3 = float((squared * centered).sum())
+        batch.m4 = float((squared * squared).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+
+        self._merge_moments(batch)
+        self.kll.update(values)
+
+    def merge(self, other: 'NumericSketch'):
+        """Merge another sketch into this one."""
+        self._merge_moments(other)
+        self.kll.merge(other.kll)
+
+    def _merge_moments(self, other: 'NumericSketch'):
+        """Combine central moments of two partitions (Pebay's pairwise formulas)."""
+        if other.n == 0:
+            return
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta2 = delta * delta
+
+        m2 = self.m2 + other.m2 + delta2 * na * nb / n
+        m3 = (self.m3 + other.m3 + delta * delta2 * na * nb * (na - nb) / n**2
+              + 3 * delta * (na * other.m2 - nb * self.m2) / n)
+        m4 = (self.m4 + other.m4
+              + delta2 * delta2 * na * nb * (na * na - na * nb + nb * nb) / n**3
+              + 6 * delta2 * (na * na * other.m2 + nb * nb * self.m2) / n**2
+              + 4 * delta * (na * other.m3 - nb * self.m3) / n)
+
+        self.mean += delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self, histogram_bins: int = 30, max_fliers: int = 100) -> Optional[Dict[str, Any]]:
+        """
+        Summarize in the shape of DataAnalyzer's numeric analysis.
+
+        Args:
+            histogram_bins: Equal-width bins between min and max in 'histogram'
+            max_fliers: Most outlier values kept for drawing in 'boxplot'
+
+        Returns:
+            Statistics dictionary, or None if no values were added
+        """
+        n = self.n
+        if n == 0:
+            return None
+
+        q1, median, q3 = self.kll.quantiles([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        lower_bound = q1 - 1.5 * iqr
+        upper_bound = q3 + 1.5 * iqr
+        n_outliers = (self.kll.count_below(lower_bound)
+                      + n - self.kll.count_below(upper_bound, inclusive=True))
+        n_outliers = int(round(min(max(n_outliers, 0), n)))
+
+        variance = self.m2 / (n - 1) if n > 1 else float('nan')
+        if self.m2 > 0:
+            skewness = math.sqrt(n) * self.m3 / self.m2 ** 1.5
+            kurtosis = n * self.m4 / (self.m2 * self.m2) - 3
+        else:
+            skewness = kurtosis = float('nan')
+
+        return {
+            'count': int(n),
+            'mean': float(self.mean),
+            'median': float(median),
+            'std': float(math.sqrt(variance)) if n > 1 else float('nan'),
+            'min': float(self.min),
+            'max': float(self.max),
+            'q25': float(q1),
+            'q75': float(q3),
+            'outliers': {
+                'count': n_outliers,
+                'percentage': round(n_outliers / n * 100, 2),
+                'lower_bound': float(lower_bound),
+                'upper_bound': float(upper_bound)
+            },
+            'skewness': float(skewness),
+            'kurtosis': float(kurtosis),
+            'histogram': self._histogram(histogram_bins),
+            'boxplot': self._box_whiskers(lower_bound, upper_bound, max_fliers),
+            'approximate_quantiles': True,
+            'quantile_rank_error': round(self.kll.rank_error, 4)
+        }
+
+    def _histogram(self, bins: int) -> Dict[str, List[float]]:
+        edges = np.histogram_bin_edges([self.min, self.max], bins=bins)
+        counts = np.round(self.kll.histogram(edges)).astype(int)
+        return {'counts': counts.tolist(), 'edges': edges.tolist()}
+
+    def _box_whiskers(self, lower_bound: float, upper_bound: float, max_fliers: int) -> Dict[str, Any]:
+        """Whisker ends and outliers from the values the quantile sketch retained."""
+        items = np.unique(np.concatenate(self.kll.levels + [np.array([self.min, self.max])]))
+        inside = items[(items >= lower_bound) & (items <= upper_bound)]
+        outside = items[(items < lower_bound) | (items > upper_bound)]
+        return {
+            'whislo': float(inside.min()) if len(inside) else float(lower_bound),
+            'whishi': float(inside.max()) if len(inside) else float(upper_bound),
+            'fliers': spread_sample(outside, max_fliers)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'accuracy': self.accuracy, 'n': self.n, 'mean': self.mean,
+            'm2': self.m2, 'm3': self.m3, 'm4': self.m4,
+            'min': self.min, 'max': self.max, 'kll': self.kll.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'NumericSketch':
+        sketch = cls(data['accuracy'])
+        for key in ('n', 'mean', 'm2', 'm3', 'm4', 'min', 'max'):
+            setattr(sketch, key, data[key])
+        sketch.kll = KLLSketch.from_dict(data['kll'])
+        return sketch
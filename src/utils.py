@@ -6,6 +6,7 @@ import os
 from typing import Any, Dict, List
 import pandas as pd
 import numpy as np
+from column_stats import get_column_stats
 
 
 def detect_missing_value_codes(df: pd.DataFrame) -> Dict[str, List[Any]]:
@@ -72,40 +73,14 @@ def infer_column_types(df: pd.DataFrame) -> Dict[str, str]:
     """
     Infer semantic types of columns beyond pandas dtypes.
     
+    Reads the shared ColumnStats of the frame, so repeated calls from
+    different stages do not rescan the data.
+    
     Returns:
         Dictionary mapping column names to inferred types
         (numeric, categorical, datetime, text, id, binary)
     """
-    inferred_types = {}
-    
-    for col in df.columns:
-        dtype = df[col].dtype
-        n_unique = df[col].nunique()
-        n_total = len(df[col])
-        
-        # Numeric
-        if pd.api.types.is_numeric_dtype(dtype):
-            if n_unique == 2:
-                inferred_types[col] = 'binary'
-            elif n_unique == n_total or n_unique > 0.9 * n_total:
-                inferred_types[col] = 'id'  # Likely an ID column
-            else:
-                inferred_types[col] = 'numeric'
-        
-        # Datetime
-        elif pd.api.types.is_datetime64_any_dtype(dtype):
-            inferred_types[col] = 'datetime'
-        
-        # Object/String
-        else:
-            if n_unique <= 20 or n_unique < 0.05 * n_total:
-                inferred_types[col] = 'categorical'
-            elif n_unique == n_total:
-                inferred_types[col] = 'id'
-            else:
-                inferred_types[col] = 'text'
-    
-    return inferred_types
+    return dict(get_column_stats(df).column_types)
 
 
 def safe_percentage(value: float, total: float) -> float:
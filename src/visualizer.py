@@ -4,262 +4,599 @@ Creates visualizations based on EDA plan and analysis results
 """
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import os
+import json
+import multiprocessing
+from functools import lru_cache
+from importlib import metadata
+from concurrent.futures import ProcessPoolExecutor
 from utils import sanitize_filename, infer_column_types
+from instrumentation import Tracer, activate, annotate, get_tracer, span
+from plot_cache import PlotCache, plot_key
+
+# Each plot task is small, so more workers than this mostly add start-up cost
+MAX_PLOT_WORKERS = 8
+
+PLOT_STYLE = {'seaborn': 'whitegrid', 'figure.figsize': (10, 6), 'font.size': 10}
+PLOT_DPI = 100
+# Bump when a renderer in plotting.py changes what it draws, so cached plots are re-rendered
+RENDERER_VERSION = 1
+
+# Scatter plots with more points than this are drawn as a 2-D histogram
+SCATTER_MAX_POINTS = 20000
+SCATTER_BINS = 100
+# Rows per block when accumulating regression sums (bounds temporary memory)
+STATS_CHUNK_ROWS = 1000000
+
+# 'png' renders plot images; 'interactive' writes chart data drawn in the browser
+CHART_FORMATS = ('png', 'interactive')
+# Interactive scatter charts send at most this many points, else a count grid
+CHART_MAX_POINTS = 2000
+# Divides SCATTER_BINS, so a precomputed grid coarsens by summing whole blocks
+CHART_GRID_BINS = 50
+
+
+def regression_line(x: np.ndarray, y: np.ndarray) -> Optional[Dict[str, Any]]:
+    """
+    Least-squares line fitted from sufficient statistics gathered in one pass.
+    
+    The sums (n, Σx, Σy, Σx², Σxy and the x/y ranges) are accumulated block
+    by block, relative to the first point so large offsets do not cancel out.
+    
+    Args:
+        x: Numeric x values (no missing values)
+        y: Numeric y values of the same length
+    
+    Returns:
+        Dictionary with slope, intercept, x/y ranges and the two line
+        endpoints, or None with fewer than 3 points or constant x
+    """
+    n = len(x)
+    if n <= 2:
+        return None
+    
+    x0, y0 = float(x[0]), float(y[0])
+    sx = sy = sxx = sxy = 0.0
+    x_min = y_min = np.inf
+    x_max = y_max = -np.inf
+    for start in range(0, n, STATS_CHUNK_ROWS):
+        dx = x[start:start + STATS_CHUNK_ROWS] - x0
+        dy = y[start:start + STATS_CHUNK_ROWS] - y0
+        sx += dx.sum()
+        sy += dy.sum()
+        sxx += np.dot(dx, dx)
+        sxy += np.dot(dx, dy)
+        x_min, x_max = min(x_min, dx.min()), max(x_max, dx.max())
+        y_min, y_max = min(y_min, dy.min()), max(y_max, dy.max())
+    
+    var_x = sxx - sx * sx / n
+    if var_x <= 0:
+        return None
+    slope = (sxy - sx * sy / n) / var_x
+    intercept = y0 + (sy - slope * sx) / n - slope * x0
+    x_range = (x0 + x_min, x0 + x_max)
+    return {
+        'slope': slope,
+        'intercept': intercept,
+        'x_range': x_range,
+        'y_range': (y0 + y_min, y0 + y_max),
+        # A straight line needs only its two endpoints
+        'line_x': list(x_range),
+        'line_y': [intercept + slope * value for value in x_range]
+    }
+
+
+def _jsonable(value: Any) -> Any:
+    """Chart data as JSON values: arrays to lists, floats to 6 significant digits, NaN to None."""
+    if isinstance(value, np.ndarray):
+        return [_jsonable(item) for item in value.tolist()]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        return float(f"{value:.6g}") if np.isfinite(value) else None
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    return str(value)
+
+
+def chart_data(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compact JSON form of a plot task for the report's chart script.
+    
+    Histograms, boxplots and bars keep their precomputed statistics; scatter
+    plots above CHART_MAX_POINTS points become a CHART_GRID_BINS x
+    CHART_GRID_BINS count grid, and the heatmap becomes labels plus a matrix.
+    
+    Args:
+        task: Plot task built by DataVisualizer
+    
+    Returns:
+        Dictionary with type, title, columns and the data to draw
+    """
+    data = dict(task['data'])
+    if task['type'] == 'scatter':
+        if 'counts' in data:
+            # Sum blocks of the SCATTER_BINS grid down to CHART_GRID_BINS bins per axis
+            step = SCATTER_BINS // CHART_GRID_BINS
+            counts = data['counts'].reshape(CHART_GRID_BINS, step, CHART_GRID_BINS, step).sum(axis=(1, 3))
+            data = {'grid': counts.astype(int), 'x_edges': data['x_edges'][::step],
+                    'y_edges': data['y_edges'][::step], 'points': data['points'], 'line': data['line']}
+        elif len(data['x']) > CHART_MAX_POINTS:
+            counts, x_edges, y_edges = np.histogram2d(data['x'], data['y'], bins=CHART_GRID_BINS)
+            data = {'grid': counts.astype(int), 'x_edges': x_edges, 'y_edges': y_edges,
+                    'points': len(data['x']), 'line': data['line']}
+        if data['line'] is not None:
+            data['line'] = {key: data['line'][key] for key in ('slope', 'intercept', 'line_x', 'line_y')}
+    elif task['type'] == 'correlation_heatmap':
+        matrix = data['matrix']
+        data = {'labels': [str(col) for col in matrix.columns], 'matrix': matrix.to_numpy(dtype=float)}
+    elif task['type'] == 'bar':
+        data['labels'] = [str(label) for label in data['labels']]
+    
+    return _jsonable({'type': task['type'], 'title': task['title'],
+                      'columns': [str(col) for col in task['columns']], 'data': data})
+
+
+@lru_cache(maxsize=None)
+def plot_settings() -> Dict[str, Any]:
+    """Everything besides a plot's data and spec that changes the rendered PNG."""
+    return {'style': PLOT_STYLE, 'dpi': PLOT_DPI, 'renderer': RENDERER_VERSION,
+            'matplotlib': metadata.version('matplotlib'), 'seaborn': metadata.version('seaborn')}
+
+
+def _init_plot_worker():
+    """Import Matplotlib and set the plot style once per worker process."""
+    import plotting
+    plotting.apply_style(PLOT_STYLE)
+
+
+def _warm_up():
+    """No-op task that makes the executor start its workers."""
+
+
+def _render_task(task: Dict[str, Any], origin: Optional[float] = None,
+                 trace_memory: bool = False) -> Tuple[Optional[str], Optional[str], List[Dict[str, Any]]]:
+    """
+    Worker side: render one plot task under a tracer of its own.
+    
+    Args:
+        task: Plot task built by DataVisualizer
+        origin: Parent tracer origin when the run is traced (None records nothing)
+        trace_memory: Record heap usage in the worker's spans
+    
+    Returns:
+        Tuple of (path or None, error message or None, span events to merge)
+    """
+    import plotting
+    tracer = Tracer(enabled=origin is not None, trace_memory=trace_memory, origin=origin)
+    with activate(tracer):
+        with span(task['name'], 'plot', rows=task['rows'], columns=len(task['columns'])):
+            try:
+                return plotting.render(task), None, tracer.events
+            except Exception as e:
+                return None, str(e), tracer.events
+
+
+class PlotPool:
+    """Process pool that renders plot tasks in parallel"""
+    
+    def __init__(self, processes: bool = True, workers: int = 0):
+        """
+        Initialize plot pool.
+        
+        Args:
+            processes: Render in worker processes; False renders inline in the
+                calling thread (e.g. in batch workers, already separate processes)
+            workers: Number of worker processes (0 = one per core, up to MAX_PLOT_WORKERS)
+        """
+        self.processes = processes
+        self.workers = workers if workers > 0 else min(os.cpu_count() or 1, MAX_PLOT_WORKERS)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._styled = False
+    
+    def start(self) -> 'PlotPool':
+        """Start the worker processes now so they import Matplotlib while other stages run."""
+        if self.processes and self._executor is None:
+            # Spawned, not forked: forking while stage threads hold locks can deadlock the child
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context('spawn'),
+                                                 initializer=_init_plot_worker)
+            self._executor.submit(_warm_up)
+        return self
+    
+    def render(self, tasks: List[Dict[str, Any]]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Render plot tasks.
+        
+        Args:
+            tasks: Plot tasks built by DataVisualizer
+        
+        Returns:
+            (path or None, error message or None) per task, in the order of tasks
+        """
+        if not self.processes:
+            if not self._styled:
+                _init_plot_worker()
+                self._styled = True
+            return [self._render_inline(task) for task in tasks]
+        
+        self.start()
+        tracer = get_tracer()
+        origin = tracer.origin if tracer.enabled else None
+        futures = [self._executor.submit(_render_task, task, origin, tracer.trace_memory)
+                   for task in tasks]
+        outcomes = []
+        for future in futures:
+            path, error, events = future.result()
+            tracer.merge(events)
+            outcomes.append((path, error))
+        return outcomes
+    
+    @staticmethod
+    def _render_inline(task: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        import plotting
+        # Spans go straight to the current tracer
+        with span(task['name'], 'plot', rows=task['rows'], columns=len(task['columns'])):
+            try:
+                return plotting.render(task), None
+            except Exception as e:
+                return None, str(e)
+    
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.close()
 
 
 class DataVisualizer:
     """Creates visualizations for EDA"""
     
-    def __init__(self, df: pd.DataFrame, output_dir: str = "output"):
+    def __init__(self, df: pd.DataFrame, output_dir: str = "output", pool: PlotPool = None,
+                 analysis_results: Dict[str, Any] = None, cache: PlotCache = None,
+                 chart_format: str = 'png'):
         """
         Initialize visualizer.
         
         Args:
             df: DataFrame to visualize
             output_dir: Directory to save plots
+            pool: Plot pool that renders the plots (None renders them inline)
+            analysis_results: Optional DataAnalyzer results; histograms, boxplots
+                and the heatmap are drawn from their statistics instead of the data
+            cache: Optional plot cache; unchanged plots are taken from it instead
+                of being rendered again
+            chart_format: 'png' to render images, or 'interactive' to write each
+                chart's data as JSON for the HTML report to draw (no Matplotlib)
         """
+        if chart_format not in CHART_FORMATS:
+            raise ValueError(f"Unknown chart format: {chart_format} (expected one of {', '.join(CHART_FORMATS)})")
         self.df = df
         self.output_dir = output_dir
         self.column_types = infer_column_types(df)
+        self.pool = pool or PlotPool(processes=False)
+        self.analysis_results = analysis_results or {}
+        self.numeric_stats = dict(self.analysis_results.get('numeric_analysis', {}))
+        self.cache = cache
+        self.chart_format = chart_format
         self.plot_paths = []
         
-        # Set style
-        sns.set_style("whitegrid")
-        plt.rcParams['figure.figsize'] = (10, 6)
-        plt.rcParams['font.size'] = 10
-        
         os.makedirs(output_dir, exist_ok=True)
     
     def create_all_plots(self, plan: Dict[str, Any] = None) -> List[str]:
         """
         Create all visualizations.
         
+        Each plot becomes a task holding only the data it draws (bin counts,
+        box statistics, bar counts, scatter points or the correlation matrix).
+        Plot files are named by a hash of that data, the spec and the style, so
+        with a cache unchanged plots are reused; the pool renders the rest in
+        parallel. In interactive mode each chart's data is written to a JSON
+        file instead and nothing is rendered.
+        
         Args:
             plan: Optional EDA plan with recommended visualizations
         
         Returns:
-            List of paths to saved plots
+            List of paths to saved plots (or chart data files), in plan order
         """
         print("\n📈 Creating visualizations...")
         
         if plan and 'recommended_visualizations' in plan:
             # Use LLM-recommended visualizations
-            for viz in plan['recommended_visualizations']:
-                self._create_plot_from_spec(viz)
+            specs = plan['recommended_visualizations']
         else:
             # Fallback: create default plots
-            self._create_default_plots()
-        
-        print(f"   ✅ Created {len(self.plot_paths)} plots")
+            specs = self._default_specs()
+        
+        tasks = []
+        for spec in specs:
+            task = self._task_from_spec(spec)
+            if task is not None:
+                tasks.append(task)
+        
+        # Identical specs give the same key and share one file
+        unique = {}
+        for task in tasks:
+            unique.setdefault(task['key'], task)
+        
+        if self.chart_format == 'interactive':
+            self.plot_paths = [self._write_chart(task) for task in unique.values()]
+            print(f"   ✅ Wrote data for {len(self.plot_paths)} interactive charts")
+            return self.plot_paths
+        
+        to_render = [task for task in unique.values() if not self._fetch_cached(task)]
+        outcomes = {task['key']: outcome for task, outcome in zip(to_render, self.pool.render(to_render))}
+        
+        reused = 0
+        for key, task in unique.items():
+            path, error = outcomes.get(key, (task['path'], None))
+            if error is not None:
+                print(f"   ⚠️  Error creating {task['spec'].get('type')} plot: {error}")
+                continue
+            if key not in outcomes:
+                reused += 1
+            elif self.cache is not None:
+                self.cache.store(key, path, {'type': task['type'], 'title': task['title'],
+                                             'columns': [str(col) for col in task['columns']]})
+            self.plot_paths.append(path)
+        if self.cache is not None:
+            self.cache.flush()
+        
+        print(f"   ✅ Created {len(self.plot_paths)} plots" + (f" ({reused} reused from the plot cache)" if reused else ""))
         return self.plot_paths
     
-    def _create_plot_from_spec(self, spec: Dict[str, Any]):
-        """Create a plot from LLM specification."""
-        try:
-            plot_type = spec.get('type', '').lower()
+    def _fetch_cached(self, task: Dict[str, Any]) -> bool:
+        """Put the cached copy of a plot at its output path; False if it must be rendered."""
+        if self.cache is None:
+            return False
+        with span(f"plot cache: {task['name']}", 'io') as lookup:
+            hit = self.cache.fetch(task['key'], task['path'])
+            lookup.set(hit=hit)
+        return hit
+    
+    def _write_chart(self, task: Dict[str, Any]) -> str:
+        """Write a plot task's chart data next to where its PNG would go."""
+        path = f"{os.path.splitext(task['path'])[0]}.json"
+        with span(task['name'], 'plot', rows=task['rows'], columns=len(task['columns']), format='interactive'):
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(chart_data(task), f, separators=(',', ':'), allow_nan=False)
+            os.replace(tmp, path)
+        return path
+    
+    def _task_from_spec(self, spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Turn an LLM plot specification into a render task (None if it cannot be drawn)."""
+        plot_type = spec.get('type', '').lower()
+        columns = spec.get('columns') or [spec.get(key) for key in ('column', 'x', 'y') if spec.get(key)]
+        
+        with span(f"prepare {plot_type}: {', '.join(map(str, columns))}", 'step',
+                  rows=int(self.df.shape[0]), columns=len(columns)):
+            try:
+                if plot_type == 'histogram':
+                    task = self._histogram_task(spec)
+                elif plot_type == 'boxplot':
+                    task = self._boxplot_task(spec)
+                elif plot_type == 'bar':
+                    task = self._bar_task(spec)
+                elif plot_type == 'scatter':
+                    task = self._scatter_task(spec)
+                elif plot_type == 'correlation_heatmap':
+                    task = self._correlation_heatmap_task(spec)
+                else:
+                    print(f"   ⚠️  Unknown plot type: {plot_type}")
+                    return None
             
-            if plot_type == 'histogram':
-                self._plot_histogram(spec)
-            elif plot_type == 'boxplot':
-                self._plot_boxplot(spec)
-            elif plot_type == 'bar':
-                self._plot_bar(spec)
-            elif plot_type == 'scatter':
-                self._plot_scatter(spec)
-            elif plot_type == 'correlation_heatmap':
-                self._plot_correlation_heatmap(spec)
-            else:
-                print(f"   ⚠️  Unknown plot type: {plot_type}")
-        
-        except Exception as e:
-            print(f"   ⚠️  Error creating {spec.get('type')} plot: {e}")
-    
-    def _plot_histogram(self, spec: Dict[str, Any]):
-        """Create histogram."""
+            except Exception as e:
+                print(f"   ⚠️  Error creating {spec.get('type')} plot: {e}")
+                return None
+        
+        if task is not None:
+            key = plot_key(plot_type, task['title'], task['columns'], task['data'], plot_settings())
+            task.update({
+                'type': plot_type,
+                'spec': spec,
+                'name': f"{plot_type}: {', '.join(map(str, task['columns']))}",
+                'rows': int(self.df.shape[0]),
+                'dpi': PLOT_DPI,
+                'key': key,
+                # The key in the name keeps different plots of the same kind and
+                # columns (other datasets, specs or data) from overwriting each other
+                'path': os.path.join(self.output_dir, f"{task.pop('filename')}_{key[:10]}.png")
+            })
+        return task
+    
+    def _numeric_stats(self, col: str) -> Optional[Dict[str, Any]]:
+        """Analyzer statistics of a numeric column; computed once here for columns the analysis skipped."""
+        stats = self.numeric_stats.get(col)
+        if stats is None or 'histogram' not in stats:
+            from analyzer import summarize_numeric
+            stats = self.numeric_stats[col] = summarize_numeric(self.df[col])
+        return stats
+    
+    def _histogram_task(self, spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Histogram task: precomputed bin counts with the column's mean and median."""
         col = spec.get('column')
         if col not in self.df.columns:
-            return
-        
-        plt.figure(figsize=(10, 6))
-        
-        data = self.df[col].dropna()
-        plt.hist(data, bins=30, edgecolor='black', alpha=0.7, color='skyblue')
-        
-        plt.title(spec.get('title', f'Distribution of {col}'))
-        plt.xlabel(col)
-        plt.ylabel('Frequency')
-        plt.grid(axis='y', alpha=0.3)
-        
-        # Add mean and median lines
-        mean_val = data.mean()
-        median_val = data.median()
-        plt.axvline(mean_val, color='red', linestyle='--', label=f'Mean: {mean_val:.2f}')
-        plt.axvline(median_val, color='green', linestyle='--', label=f'Median: {median_val:.2f}')
-        plt.legend()
-        
-        filename = f"histogram_{sanitize_filename(col)}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=100, bbox_inches='tight')
-        plt.close()
-        
-        self.plot_paths.append(filepath)
+            return None
+        
+        stats = self._numeric_stats(col)
+        if stats is None:
+            return None
+        
+        return {
+            'title': spec.get('title', f'Distribution of {col}'),
+            'columns': [col],
+            'data': {**stats['histogram'], 'mean': stats['mean'], 'median': stats['median']},
+            'filename': f"histogram_{sanitize_filename(col)}"
+        }
     
-    def _plot_boxplot(self, spec: Dict[str, Any]):
-        """Create boxplot."""
+    def _boxplot_task(self, spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Boxplot task: precomputed quartiles, whisker ends and outliers."""
         col = spec.get('column')
         if col not in self.df.columns:
-            return
-        
-        plt.figure(figsize=(10, 6))
-        
-        data = self.df[col].dropna()
-        plt.boxplot(data, vert=True, patch_artist=True,
-                   boxprops=dict(facecolor='lightblue', alpha=0.7),
-                   medianprops=dict(color='red', linewidth=2))
-        
-        plt.title(spec.get('title', f'Boxplot of {col}'))
-        plt.ylabel(col)
-        plt.grid(axis='y', alpha=0.3)
-        
-        filename = f"boxplot_{sanitize_filename(col)}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=100, bbox_inches='tight')
-        plt.close()
-        
-        self.plot_paths.append(filepath)
+            return None
+        
+        stats = self._numeric_stats(col)
+        if stats is None:
+            return None
+        
+        return {
+            'title': spec.get('title', f'Boxplot of {col}'),
+            'columns': [col],
+            'data': {'med': stats['median'], 'q1': stats['q25'], 'q3': stats['q75'], **stats['boxplot']},
+            'filename': f"boxplot_{sanitize_filename(col)}"
+        }
     
-    def _plot_bar(self, spec: Dict[str, Any]):
-        """Create bar chart."""
+    def _bar_task(self, spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Bar chart task: counts of the 20 most frequent values."""
         col = spec.get('column')
         if col not in self.df.columns:
-            return
-        
-        plt.figure(figsize=(12, 6))
+            return None
         
         value_counts = self.df[col].value_counts().head(20)
-        
-        # Use horizontal bar if many categories
-        if len(value_counts) > 10:
-            value_counts.plot(kind='barh', color='steelblue', alpha=0.8)
-            plt.xlabel('Count')
-            plt.ylabel(col)
-        else:
-            value_counts.plot(kind='bar', color='steelblue', alpha=0.8)
-            plt.xlabel(col)
-            plt.ylabel('Count')
-            plt.xticks(rotation=45, ha='right')
-        
-        plt.title(spec.get('title', f'Frequency of {col}'))
-        plt.grid(axis='y' if len(value_counts) <= 10 else 'x', alpha=0.3)
-        
-        filename = f"bar_{sanitize_filename(col)}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=100, bbox_inches='tight')
-        plt.close()
-        
-        self.plot_paths.append(filepath)
+        return {
+            'title': spec.get('title', f'Frequency of {col}'),
+            'columns': [col],
+            'data': {'labels': value_counts.index.tolist(), 'counts': value_counts.to_numpy()},
+            'filename': f"bar_{sanitize_filename(col)}"
+        }
     
-    def _plot_scatter(self, spec: Dict[str, Any]):
-        """Create scatter plot."""
+    def _scatter_task(self, spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Scatter plot task: the rows where both columns are present, with their
+        regression line. Above SCATTER_MAX_POINTS rows the points are binned
+        into a SCATTER_BINS x SCATTER_BINS count grid here, and only the grid
+        is sent to the renderer.
+        """
         x_col = spec.get('x')
         y_col = spec.get('y')
         
         if x_col not in self.df.columns or y_col not in self.df.columns:
-            return
-        
-        plt.figure(figsize=(10, 6))
+            return None
         
         # Remove NaN values
-        plot_data = self.df[[x_col, y_col]].dropna()
+        present = self.df[x_col].notna() & self.df[y_col].notna()
+        x = self.df[x_col].to_numpy(dtype=float)[present.to_numpy()]
+        y = self.df[y_col].to_numpy(dtype=float)[present.to_numpy()]
+        line = regression_line(x, y)
         
-        plt.scatter(plot_data[x_col], plot_data[y_col], alpha=0.5, s=30, color='steelblue')
-        
-        # Add regression line
-        if len(plot_data) > 2:
-            z = np.polyfit(plot_data[x_col], plot_data[y_col], 1)
-            p = np.poly1d(z)
-            plt.plot(plot_data[x_col], p(plot_data[x_col]), "r--", alpha=0.8, linewidth=2)
-        
-        plt.title(spec.get('title', f'{x_col} vs {y_col}'))
-        plt.xlabel(x_col)
-        plt.ylabel(y_col)
-        plt.grid(alpha=0.3)
-        
-        filename = f"scatter_{sanitize_filename(x_col)}_vs_{sanitize_filename(y_col)}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=100, bbox_inches='tight')
-        plt.close()
-        
-        self.plot_paths.append(filepath)
+        if len(x) <= SCATTER_MAX_POINTS:
+            data = {'x': x, 'y': y, 'line': line}
+        else:
+            x_range = line['x_range'] if line else (x.min(), x.max())
+            y_range = line['y_range'] if line else (y.min(), y.max())
+            counts, x_edges, y_edges = np.histogram2d(x, y, bins=SCATTER_BINS,
+                                                      range=[x_range, y_range])
+            data = {'counts': counts, 'x_edges': x_edges, 'y_edges': y_edges,
+                    'points': len(x), 'line': line}
+        annotate(mode='points' if 'x' in data else 'density', points=len(x))
+        
+        return {
+            'title': spec.get('title', f'{x_col} vs {y_col}'),
+            'columns': [x_col, y_col],
+            'data': data,
+            'filename': f"scatter_{sanitize_filename(x_col)}_vs_{sanitize_filename(y_col)}"
+        }
+    
+    def _correlation_matrix(self, columns: List[str]) -> pd.DataFrame:
+        """Correlations of columns from the analysis results (inline or sidecar), else from the data."""
+        correlations = self.analysis_results.get('relationships', {}).get('correlations', {})
+        matrix = None
+        if 'matrix' in correlations:
+            matrix = pd.DataFrame(correlations['matrix'])
+        elif correlations.get('matrix_file') and os.path.exists(correlations['matrix_file']):
+            from correlation import load_matrix
+            values, names = load_matrix(correlations['matrix_file'])
+            matrix = pd.DataFrame(values, index=names, columns=names)
+        
+        if matrix is not None and all(col in matrix.columns for col in columns):
+            return matrix.loc[columns, columns]
+        return self.df[columns].corr()
     
-    def _plot_correlation_heatmap(self, spec: Dict[str, Any]):
-        """Create correlation heatmap."""
+    def _correlation_heatmap_task(self, spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Correlation heatmap task: the analyzer's correlation matrix for the columns."""
         columns = spec.get('columns', [])
         
         # If no columns specified, use all numeric columns
         if not columns:
-            columns = [col for col, ctype in self.column_types.items() 
+            columns = [col for col, ctype in self.column_types.items()
                       if ctype == 'numeric']
         
         # Filter to only columns that exist
         columns = [col for col in columns if col in self.df.columns]
         
         if len(columns) < 2:
-            return
-        
-        plt.figure(figsize=(12, 10))
-        
-        corr_matrix = self.df[columns].corr()
-        
-        mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
-        
-        sns.heatmap(corr_matrix, mask=mask, annot=True, fmt='.2f', 
-                   cmap='coolwarm', center=0, square=True,
-                   linewidths=1, cbar_kws={"shrink": 0.8})
-        
-        plt.title(spec.get('title', 'Correlation Matrix'))
-        
-        filename = "correlation_heatmap.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=100, bbox_inches='tight')
-        plt.close()
-        
-        self.plot_paths.append(filepath)
+            return None
+        
+        return {
+            'title': spec.get('title', 'Correlation Matrix'),
+            'columns': columns,
+            'data': {'matrix': self._correlation_matrix(columns)},
+            'filename': "correlation_heatmap"
+        }
     
-    def _create_default_plots(self):
-        """Create default set of plots if no plan provided."""
-        numeric_cols = [col for col, ctype in self.column_types.items() 
+    def _default_specs(self) -> List[Dict[str, Any]]:
+        """Default set of plots if no plan provided."""
+        numeric_cols = [col for col, ctype in self.column_types.items()
                        if ctype == 'numeric']
-        categorical_cols = [col for col, ctype in self.column_types.items() 
+        categorical_cols = [col for col, ctype in self.column_types.items()
                           if ctype in ['categorical', 'binary']]
+        specs = []
         
         # Histograms for numeric columns
         for col in numeric_cols[:3]:
-            self._plot_histogram({'column': col, 'title': f'Distribution of {col}'})
+            specs.append({'type': 'histogram', 'column': col, 'title': f'Distribution of {col}'})
         
         # Boxplots for numeric columns
         for col in numeric_cols[:2]:
-            self._plot_boxplot({'column': col, 'title': f'Outliers in {col}'})
+            specs.append({'type': 'boxplot', 'column': col, 'title': f'Outliers in {col}'})
         
         # Bar charts for categorical columns
         for col in categorical_cols[:2]:
-            self._plot_bar({'column': col, 'title': f'Frequency of {col}'})
+            specs.append({'type': 'bar', 'column': col, 'title': f'Frequency of {col}'})
         
         # Correlation heatmap if we have numeric columns
         if len(numeric_cols) >= 2:
-            self._plot_correlation_heatmap({
+            specs.append({
+                'type': 'correlation_heatmap',
                 'columns': numeric_cols[:10],
                 'title': 'Correlation Matrix'
             })
+        return specs
+
+
+def render_plots(output_dir: str, data: Dict[str, Any], plan: Dict[str, Any] = None,
+                 pool: PlotPool = None, analysis_results: Dict[str, Any] = None,
+                 cache: PlotCache = None, chart_format: str = 'png') -> List[str]:
+    """
+    Pipeline visualization stage.
+    
+    Args:
+        output_dir: Directory to save plots
+        data: Loaded data with the frame under 'df'
+        plan: Optional EDA plan with recommended visualizations
+        pool: Plot pool that renders the plots (None renders them inline)
+        analysis_results: Optional DataAnalyzer results to draw statistics from
+        cache: Optional plot cache to reuse unchanged plots from
+        chart_format: 'png' or 'interactive' (chart data for the HTML report)
+    
+    Returns:
+        List of paths to saved plots or chart data files
+    """
+    visualizer = DataVisualizer(data['df'], output_dir, pool, analysis_results, cache, chart_format)
+    return visualizer.create_all_plots(plan)
 
 
 # Test
@@ -272,8 +609,9 @@ if __name__ == "__main__":
         'score': np.random.uniform(0, 100, 1000)
     })
     
-    viz = DataVisualizer(df)
-    plot_paths = viz.create_all_plots()
+    with PlotPool() as pool:
+        viz = DataVisualizer(df, pool=pool)
+        plot_paths = viz.create_all_plots()
     
     print(f"\n✅ Created {len(plot_paths)} plots:")
     for path in plot_paths: